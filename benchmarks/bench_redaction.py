@@ -0,0 +1,72 @@
+"""Compare redact_text with the previous multi-pass implementation.
+
+Usage:
+    uv run python benchmarks/bench_redaction.py [--number N]
+"""
+
+import argparse
+import re
+import timeit
+
+from use_notify.redaction import SECRET_REPLACEMENT, _looks_sensitive_path_segment, redact_text
+
+# The multi-pass implementation redact_text replaced: six full scans per string.
+_LEGACY_QUERY_SECRET_RE = re.compile(r"(?i)([?&](?:access_token|token|key|pushkey)=)[^&\s)]+")
+_LEGACY_PATH_SECRET_PATTERNS = (
+    re.compile(r"(?i)(api\.day\.app/)[^/?\s)]+"),
+    re.compile(r"(?i)(/v1/sender/)[^/?\s)]+"),
+    re.compile(r"(?i)(/open-apis/bot/v2/hook/)[^/?\s)]+"),
+    re.compile(r"(?i)(ntfy\.sh/)[^/?\s)]+"),
+)
+_LEGACY_SINGLE_SEGMENT_URL_RE = re.compile(
+    r"(?i)(?P<prefix>https?://[^/?#\s)]+/)(?P<segment>[^/?#\s)]+)(?=(?:[?#\s)]|$))"
+)
+
+
+def legacy_redact_text(value: str) -> str:
+    redacted = _LEGACY_QUERY_SECRET_RE.sub(rf"\1{SECRET_REPLACEMENT}", value)
+    for pattern in _LEGACY_PATH_SECRET_PATTERNS:
+        redacted = pattern.sub(rf"\1{SECRET_REPLACEMENT}", redacted)
+    return _LEGACY_SINGLE_SEGMENT_URL_RE.sub(_legacy_single_segment, redacted)
+
+
+def _legacy_single_segment(match):
+    if _looks_sensitive_path_segment(match.group("segment")):
+        return f"{match.group('prefix')}{SECRET_REPLACEMENT}"
+    return match.group(0)
+
+
+SAMPLES = {
+    "plain": "Connection reset by peer while sending notification",
+    "ding_http_error": (
+        "Server error '503 Service Unavailable' for url "
+        "'https://oapi.dingtalk.com/robot/send?access_token=0123456789abcdef0123'\n"
+        "For more information check: "
+        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/503"
+    ),
+    "bark_connect_error": "failed to connect https://api.day.app/AbCdEf123456GhIjKl7890",
+    "provider_rejection": (
+        "feishu notification provider rejected response (code=19001): "
+        "param invalid: incoming webhook access token invalid"
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    options = parser.parse_args()
+
+    print(f"{'sample':<20} {'legacy us':>10} {'current us':>10} {'speedup':>8}")
+    for name, text in SAMPLES.items():
+        assert redact_text(text) == legacy_redact_text(text), name
+        legacy = timeit.timeit(lambda: legacy_redact_text(text), number=options.number)
+        current = timeit.timeit(lambda: redact_text(text), number=options.number)
+        print(
+            f"{name:<20} {legacy / options.number * 1e6:>10.2f} "
+            f"{current / options.number * 1e6:>10.2f} {legacy / current:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
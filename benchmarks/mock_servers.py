@@ -0,0 +1,197 @@
+"""Local stand-ins for notification providers used by the benchmark suite.
+
+``MockProviderServer`` answers the Ding, WeChat, Feishu, Bark and ntfy webhook
+paths with each provider's success body. ``SmtpSink`` accepts and discards mail
+over plain SMTP with AUTH PLAIN. ``ServerProcess`` runs either one in a child
+process.
+"""
+
+import json
+import multiprocessing
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DING_OK = json.dumps({"errcode": 0, "errmsg": "ok"}).encode()
+FEISHU_OK = json.dumps({"code": 0, "msg": "success"}).encode()
+BARK_OK = json.dumps({"code": 200, "message": "success"}).encode()
+UNAVAILABLE = json.dumps({"errcode": 503, "errmsg": "busy"}).encode()
+
+
+class _ProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        path = self.path.split("?", 1)[0]
+
+        if path.startswith("/slow/"):
+            time.sleep(self.server.latency)
+        if "/flaky/" in path and self.server.should_fail():
+            self._reply(503, UNAVAILABLE)
+        elif path.endswith("/robot/send") or path.endswith("/cgi-bin/webhook/send"):
+            self._reply(200, DING_OK)
+        elif "/open-apis/bot/v2/hook/" in path:
+            self._reply(200, FEISHU_OK)
+        else:
+            # Bark and ntfy both post to /{token_or_topic}.
+            self._reply(200, BARK_OK)
+
+    def _reply(self, status, body):
+        # Headers and body go out in one write: a separate body write after the
+        # headers can stall on Nagle/delayed ACK and swamp the measurement.
+        self.send_response_only(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self._headers_buffer.append(b"\r\n" + body)
+        self.flush_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockProviderServer(ThreadingHTTPServer):
+    """HTTP server on an ephemeral localhost port.
+
+    Paths under ``/flaky/`` fail with 503 on ``fail_ratio - 1`` out of every
+    ``fail_ratio`` requests, which drives the retry-heavy scenario. Paths under
+    ``/slow/`` answer after ``latency`` seconds, like a remote provider, so
+    concurrent publishes have waiting to overlap.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, fail_ratio: int = 3, latency: float = 0.02):
+        super().__init__(("127.0.0.1", 0), _ProviderHandler)
+        self.fail_ratio = fail_ratio
+        self.latency = latency
+        self._counter = 0
+        self._counter_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def should_fail(self) -> bool:
+        with self._counter_lock:
+            self._counter += 1
+            return self._counter % self.fail_ratio != 0
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self._reply("220 use-notify benchmark sink")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+            if command.startswith("EHLO"):
+                self._reply("250-localhost", "250-AUTH PLAIN", "250 SIZE 10485760")
+            elif command.startswith("HELO"):
+                self._reply("250 localhost")
+            elif command.startswith("AUTH"):
+                self._reply("235 authenticated")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self._reply("250 ok")
+            elif command == "DATA":
+                self._reply("354 end with <CRLF>.<CRLF>")
+                self._read_message()
+                self.server.messages += 1
+                self._reply("250 queued")
+            elif command == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("502 not implemented")
+
+    def _read_message(self):
+        while True:
+            line = self.rfile.readline()
+            if not line or line == b".\r\n":
+                return
+
+    def _reply(self, *lines):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode("ascii"))
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server on an ephemeral localhost port that discards mail."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 256
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.messages = 0
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class ServerProcess:
+    """Run a server class in a child process.
+
+    In-process server threads compete with the benchmark for the GIL. With
+    many requests in flight that contention dominates latency and hides
+    whether concurrent publishing scales.
+    """
+
+    def __init__(self, server_cls, **kwargs):
+        self.server_cls = server_cls
+        self.kwargs = kwargs
+        self.host = None
+        self.port = None
+        self._process = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self):
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_serve, args=(self.server_cls, self.kwargs, sender), daemon=True
+        )
+        self._process.start()
+        self.host, self.port = receiver.recv()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._process.terminate()
+        self._process.join()
+
+
+def _serve(server_cls, kwargs, sender):
+    server = server_cls(**kwargs)
+    sender.send(server.server_address[:2])
+    sender.close()
+    server.serve_forever()
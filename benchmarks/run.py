@@ -0,0 +1,292 @@
+"""Publish throughput and latency benchmarks against local provider stand-ins.
+
+Usage:
+    uv run python benchmarks/run.py [--iterations N] [--concurrency N]
+        [--scenario NAME ...] [--output results.json] [--compare baseline.json]
+
+Every scenario publishes through ``useNotify`` to servers started on localhost
+(see ``mock_servers.py``), so results measure use-notify's own overhead plus
+loopback HTTP/SMTP, not provider latency. HTTP channels reuse one pooled client
+that is warmed up before timing starts, so client construction (SSL context
+setup) and connection setup are not part of the measurement.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+from mock_servers import MockProviderServer, ServerProcess, SmtpSink
+
+from use_notify import useNotify, useNotifyChannel
+
+CONTENT = "## 部署完成\n\n- service: api\n- version: 1.2.3\n- duration: 42s"
+TITLE = "benchmark"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    channels: Callable[["Endpoints"], list]
+    mode: str = "sync"
+    concurrency: int = 1
+    max_retries: int = 0
+    # Post to the mock server's /slow/ paths, which add provider latency.
+    slow: bool = False
+
+
+@dataclass(frozen=True)
+class Endpoints:
+    http_base_url: str
+    smtp_port: int
+
+
+@dataclass(frozen=True)
+class Result:
+    iterations: int
+    total_seconds: float
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def _local(channel_cls, url=None):
+    """Subclass a channel so it reuses one pooled client and, given ``url``,
+    posts to that fixed local URL."""
+    attributes = {"reuse_connections": True}
+    if url is not None:
+        attributes["api_url"] = property(lambda _: url)
+    return type(f"Local{channel_cls.__name__}", (channel_cls,), attributes)
+
+
+def ding(endpoints, path="/robot/send"):
+    url = f"{endpoints.http_base_url}{path}?access_token=bench"
+    return _local(useNotifyChannel.Ding, url)({"token": "bench"})
+
+
+def wechat(endpoints):
+    url = f"{endpoints.http_base_url}/cgi-bin/webhook/send?key=bench"
+    return _local(useNotifyChannel.WeChat, url)({"token": "bench"})
+
+
+def feishu(endpoints):
+    url = f"{endpoints.http_base_url}/open-apis/bot/v2/hook/bench"
+    return _local(useNotifyChannel.Feishu, url)({"token": "bench"})
+
+
+def bark(endpoints):
+    return _local(useNotifyChannel.Bark)({"token": "bench", "base_url": endpoints.http_base_url})
+
+
+def ntfy(endpoints):
+    return _local(useNotifyChannel.Ntfy)({"topic": "bench", "base_url": endpoints.http_base_url})
+
+
+def email(endpoints):
+    return useNotifyChannel.Email(
+        {
+            "server": "127.0.0.1",
+            "port": endpoints.smtp_port,
+            "username": "bench",
+            "password": "bench",
+            "from_email": "bench@example.com",
+            "to_emails": ["ops@example.com"],
+        }
+    )
+
+
+def all_http(endpoints):
+    return [ding(endpoints), wechat(endpoints), feishu(endpoints), bark(endpoints), ntfy(endpoints)]
+
+
+def flaky_ding(endpoints):
+    return [ding(endpoints, path="/flaky/robot/send")]
+
+
+def _single(factory):
+    return lambda endpoints: [factory(endpoints)]
+
+
+SCENARIOS: List[Scenario] = [
+    *(
+        Scenario(f"sync_{factory.__name__}", _single(factory))
+        for factory in (ding, wechat, feishu, bark, ntfy, email)
+    ),
+    Scenario("async_ding", _single(ding), mode="async"),
+    Scenario("async_email", _single(email), mode="async"),
+    Scenario("sync_multi_channel", all_http),
+    Scenario("async_multi_channel", all_http, mode="async"),
+    # With provider latency, concurrent publishes should reach about
+    # --concurrency times the throughput of the matching serial scenario.
+    Scenario("async_ding_slow", _single(ding), mode="async", slow=True),
+    Scenario("async_ding_concurrent", _single(ding), mode="async", concurrency=-1, slow=True),
+    Scenario("async_multi_channel_slow", all_http, mode="async", slow=True),
+    Scenario("async_multi_channel_concurrent", all_http, mode="async", concurrency=-1, slow=True),
+    # The flaky endpoint fails 2 of every 3 requests, so each publish retries twice.
+    Scenario("sync_retry_heavy", flaky_ding, max_retries=2),
+    Scenario("async_retry_heavy", flaky_ding, mode="async", max_retries=2),
+]
+
+
+def run_scenario(scenario: Scenario, endpoints: Endpoints, iterations, concurrency) -> Result:
+    if scenario.slow:
+        endpoints = replace(endpoints, http_base_url=f"{endpoints.http_base_url}/slow")
+    channels = scenario.channels(endpoints)
+    notify = useNotify(channels, max_retries=scenario.max_retries)
+    try:
+        if scenario.mode == "sync":
+            _warm_up(notify, concurrency=1)
+            started = time.perf_counter()
+            latencies = [_timed_publish(notify) for _ in range(iterations)]
+            total = time.perf_counter() - started
+        else:
+            workers = concurrency if scenario.concurrency == -1 else scenario.concurrency
+            # Warm-up and timing share one event loop: async clients are pooled per loop.
+            latencies, total = asyncio.run(_run_async(notify, iterations, workers))
+    finally:
+        for channel in channels:
+            if hasattr(channel, "close"):
+                channel.close()
+    return _summarize(latencies, total)
+
+
+def _warm_up(notify, concurrency):
+    # Build the pooled clients and open keep-alive connections outside the timed region.
+    for _ in range(concurrency):
+        notify.publish(content=CONTENT, title=TITLE)
+
+
+def _timed_publish(notify) -> float:
+    started = time.perf_counter()
+    notify.publish(content=CONTENT, title=TITLE)
+    return time.perf_counter() - started
+
+
+async def _run_async(notify, iterations, concurrency) -> Tuple[List[float], float]:
+    await asyncio.gather(
+        *(notify.publish_async(content=CONTENT, title=TITLE) for _ in range(concurrency))
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed():
+        async with semaphore:
+            started = time.perf_counter()
+            await notify.publish_async(content=CONTENT, title=TITLE)
+            return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(timed() for _ in range(iterations)))
+    return latencies, time.perf_counter() - started
+
+
+def _summarize(latencies: List[float], total: float) -> Result:
+    ordered = sorted(latencies)
+    return Result(
+        iterations=len(ordered),
+        total_seconds=round(total, 6),
+        throughput=round(len(ordered) / total, 2),
+        mean_ms=round(sum(ordered) / len(ordered) * 1000, 3),
+        p50_ms=round(_percentile(ordered, 0.50) * 1000, 3),
+        p99_ms=round(_percentile(ordered, 0.99) * 1000, 3),
+        max_ms=round(ordered[-1] * 1000, 3),
+    )
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+
+
+def _metadata(options) -> Dict[str, object]:
+    try:
+        from importlib.metadata import version
+
+        package_version = version("use-notify")
+    except Exception:
+        package_version = "unknown"
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "use_notify": package_version,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "iterations": options.iterations,
+        "concurrency": options.concurrency,
+        "provider_latency_ms": options.provider_latency_ms,
+    }
+
+
+def _print_results(results: Dict[str, Result], baseline: Dict[str, dict]):
+    header = f"{'scenario':<32} {'ops/s':>9} {'p50 ms':>8} {'p99 ms':>8}"
+    if baseline:
+        header += f" {'ops/s vs base':>14} {'p99 vs base':>12}"
+    print(header)
+    for name, result in results.items():
+        line = f"{name:<32} {result.throughput:>9.1f} {result.p50_ms:>8.2f} {result.p99_ms:>8.2f}"
+        previous = baseline.get(name)
+        if previous:
+            line += (
+                f" {result.throughput / previous['throughput']:>13.2f}x"
+                f" {result.p99_ms / previous['p99_ms']:>11.2f}x"
+            )
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--provider-latency-ms",
+        type=float,
+        default=20.0,
+        help="response delay of the mock provider in *_slow and *_concurrent scenarios",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="run only scenarios whose name contains this text (repeatable)",
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file from an earlier --output run")
+    options = parser.parse_args(argv)
+
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not options.scenario or any(text in scenario.name for text in options.scenario)
+    ]
+    baseline = {}
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    results = {}
+    http_server = ServerProcess(MockProviderServer, latency=options.provider_latency_ms / 1000)
+    with http_server, ServerProcess(SmtpSink) as smtp_sink:
+        endpoints = Endpoints(http_base_url=http_server.base_url, smtp_port=smtp_sink.port)
+        for scenario in scenarios:
+            results[scenario.name] = run_scenario(
+                scenario, endpoints, options.iterations, options.concurrency
+            )
+
+    _print_results(results, baseline)
+    if options.output:
+        report = {
+            "meta": _metadata(options),
+            "results": {name: asdict(result) for name, result in results.items()},
+        }
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+            output_file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,44 @@
 # flake8: noqa: F401
 from . import channels as useNotifyChannel
+from .concurrency import AdaptiveConcurrency
 from .decorator import (
     clear_default_notify_instance,
     get_default_notify_instance,
     notify,
+    notify_block,
     set_default_notify_instance,
 )
-from .notification import NotificationPublishError
+from .dispatch import DispatcherRejectedError, NotificationDispatcher
+from .health import ChannelHealth, PublisherStats
+from .loop_bridge import EventLoopBridge, get_default_loop_bridge
+from .metrics import InMemoryMetrics, MetricsSink, OpenTelemetryMetrics, PrometheusMetrics
+from .notification import ChannelFailure, NotificationPublishError
 from .notification import Notify as useNotify
 from .notification import RetryConfig
+from .ratelimit import RateLimitedError, RateLimiter, SharedRateLimiter
 
 __all__ = [
     "useNotifyChannel",
     "useNotify",
     "NotificationPublishError",
+    "ChannelFailure",
+    "ChannelHealth",
+    "PublisherStats",
     "RetryConfig",
+    "RateLimiter",
+    "RateLimitedError",
+    "SharedRateLimiter",
+    "AdaptiveConcurrency",
+    "NotificationDispatcher",
+    "DispatcherRejectedError",
+    "EventLoopBridge",
+    "get_default_loop_bridge",
+    "MetricsSink",
+    "InMemoryMetrics",
+    "PrometheusMetrics",
+    "OpenTelemetryMetrics",
     "notify",
+    "notify_block",
     "set_default_notify_instance",
     "get_default_notify_instance",
     "clear_default_notify_instance",
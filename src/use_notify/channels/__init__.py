@@ -1,32 +1,98 @@
 # flake8: noqa: F401
-from .bark import Bark
+"""通知渠道
+
+渠道类在首次访问时才导入对应模块，``import use_notify`` 不会加载
+httpx、smtplib 等只有发送时才需要的依赖。
+"""
+
+from collections.abc import MutableMapping
+from importlib import import_module
+
 from .base import BaseChannel
-from .chanify import Chanify
-from .console import Console
-from .ding import Ding
-from .email import Email
-from .feishu import Feishu
-from .ntfy import Ntfy
-from .pushdeer import PushDeer
-from .pushover import PushOver
-from .wechat import WeChat
-
-# 兼容wecom
-WeCom = WeChat
-
-CHANNEL_REGISTRY = {
-    "bark": Bark,
-    "chanify": Chanify,
-    "console": Console,
-    "ding": Ding,
-    "email": Email,
-    "feishu": Feishu,
-    "ntfy": Ntfy,
-    "pushdeer": PushDeer,
-    "pushover": PushOver,
-    "wechat": WeChat,
-    "wecom": WeChat,
+
+# 类名 -> 定义它的子模块
+_CHANNEL_MODULES = {
+    "Bark": "bark",
+    "ChannelGroup": "group",
+    "Chanify": "chanify",
+    "Console": "console",
+    "Ding": "ding",
+    "Email": "email",
+    "Feishu": "feishu",
+    "File": "file",
+    "HttpChannel": "http",
+    "Ntfy": "ntfy",
+    "PushDeer": "pushdeer",
+    "PushOver": "pushover",
+    "WeChat": "wechat",
+    "Webhook": "webhook",
+    # 兼容wecom
+    "WeCom": "wechat",
 }
+_CLASS_NAMES = {"WeCom": "WeChat"}
+
+__all__ = ["BaseChannel", "CHANNEL_REGISTRY", "get_channel_class", *_CHANNEL_MODULES]
+
+
+def __getattr__(name):
+    module_name = _CHANNEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    channel_cls = getattr(import_module(f".{module_name}", __name__), _CLASS_NAMES.get(name, name))
+    globals()[name] = channel_cls
+    return channel_cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CHANNEL_MODULES))
+
+
+class _LazyRegistry(MutableMapping):
+    """配置名 -> 渠道类，内置渠道按需导入
+
+    可以像字典一样注册自定义渠道：``CHANNEL_REGISTRY["custom"] = MyChannel``。
+    """
+
+    def __init__(self, class_names):
+        # 值为类名字符串时表示尚未导入的内置渠道
+        self._entries = dict(class_names)
+
+    def __getitem__(self, key):
+        channel_cls = self._entries[key]
+        if isinstance(channel_cls, str):
+            channel_cls = self._entries[key] = __getattr__(channel_cls)
+        return channel_cls
+
+    def __setitem__(self, key, channel_cls):
+        self._entries[key] = channel_cls
+
+    def __delitem__(self, key):
+        del self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+CHANNEL_REGISTRY = _LazyRegistry(
+    {
+        "bark": "Bark",
+        "chanify": "Chanify",
+        "console": "Console",
+        "ding": "Ding",
+        "email": "Email",
+        "feishu": "Feishu",
+        "file": "File",
+        "ntfy": "Ntfy",
+        "pushdeer": "PushDeer",
+        "pushover": "PushOver",
+        "webhook": "Webhook",
+        "wechat": "WeChat",
+        "wecom": "WeChat",
+    }
+)
 
 
 def get_channel_class(name):
@@ -1,10 +1,28 @@
+from typing import Callable, Optional, Union
+
+from .config import ChannelConfig
 from .http import HttpChannel
 
 
+class BarkConfig(ChannelConfig):
+    __slots__ = ("token", "base_url", "badge", "sound", "icon", "group", "url")
+
+    token: Union[str, Callable[[], str]]
+    base_url: Optional[str]
+    badge: Optional[int]
+    sound: Optional[str]
+    icon: Optional[str]
+    group: Optional[str]
+    url: Optional[str]
+
+
 class Bark(HttpChannel):
     """Bark app 消息通知"""
 
+    config_class = BarkConfig
+
     payload_kind = "json"
+    cache_request_body = True
     provider_name = "bark"
     success_fields = {"code": {200}}
     success_log_message = "`bark` send successfully"
@@ -32,9 +50,11 @@ class Bark(HttpChannel):
             payload["title"] = title
 
         # Optional parameters from config
-        for param in ["badge", "sound", "icon", "group", "url"]:
-            if param in self.config and getattr(self.config, param) is not None:
-                payload[param] = getattr(self.config, param)
+        config = self.config
+        for param in ("badge", "sound", "icon", "group", "url"):
+            value = getattr(config, param)
+            if value is not None:
+                payload[param] = value
 
         return payload
 
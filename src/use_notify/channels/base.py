@@ -1,10 +1,19 @@
 from abc import ABCMeta, abstractmethod
 
-from usepy.dict import AdDict
-
 
 class BaseChannel(metaclass=ABCMeta):
+    # ChannelConfig 子类；未设置时（如自定义渠道）使用 AdDict 包装配置
+    config_class = None
+
     def __init__(self, config: dict):
+        config_class = self.config_class
+        if config_class is not None:
+            self.config = config_class(config)
+            return
+
+        # usepy 的导入开销较大，推迟到第一次创建自定义渠道时
+        from usepy.dict import AdDict
+
         self.config = AdDict(config)
 
     def resolve_config_value(self, field):
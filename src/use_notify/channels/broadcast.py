@@ -0,0 +1,81 @@
+from abc import abstractmethod
+from typing import Callable, List, Optional, Sequence, Union
+
+from use_notify._validation import is_int_like
+
+from .config import ChannelConfig
+from .http import HttpChannel
+
+Token = Union[str, Callable[[], str]]
+
+DEFAULT_BROADCAST_CONCURRENCY = 16
+
+
+class BroadcastConfig(ChannelConfig):
+    """带 ``token`` 的 webhook 渠道配置，``tokens`` 提供多个目标时启用广播"""
+
+    __slots__ = ("token", "tokens", "broadcast_concurrency")
+
+    token: Token
+    tokens: Optional[Sequence[Token]]
+    broadcast_concurrency: Optional[int]
+
+    def validate(self):
+        if self.tokens is not None and (
+            isinstance(self.tokens, (str, bytes)) or not isinstance(self.tokens, Sequence)
+        ):
+            raise ValueError("tokens must be a list of tokens")
+        concurrency = self.broadcast_concurrency
+        if concurrency is not None and (not is_int_like(concurrency) or concurrency < 1):
+            raise ValueError("broadcast_concurrency must be >= 1")
+
+
+class BroadcastChannel(HttpChannel):
+    """按 token 区分目标的 webhook 渠道，支持一条消息广播到多个目标
+
+    配置 ``tokens`` 时，消息体只构建并序列化一次，随后通过同一个连接池
+    并发发送给全部目标，并发数由 ``broadcast_concurrency`` 限制（默认 16）。
+    任一目标失败时抛出 NotificationPublishError，每个失败目标一条记录，
+    渠道名形如 ``Ding[3]``（目标在 ``tokens`` 中的下标）。已成功的目标不会
+    因 Publisher 重试而重复发送：广播失败不属于可重试错误。
+    """
+
+    config_class = BroadcastConfig
+
+    @abstractmethod
+    def url_for_token(self, token) -> str:
+        raise NotImplementedError
+
+    @property
+    def api_url(self):
+        return self.url_for_token(self.resolve_config_value("token"))
+
+    def broadcast_urls(self) -> Optional[List[str]]:
+        """多目标时返回每个目标的 URL，未配置 ``tokens`` 时返回 None"""
+        tokens = self.config.tokens
+        if not tokens:
+            return None
+        return [self.url_for_token(token() if callable(token) else token) for token in tokens]
+
+    def send(self, content, title=None):
+        urls = self.broadcast_urls()
+        if urls is None:
+            return super().send(content, title)
+        concurrency = self._broadcast_concurrency(len(urls))
+        for part_content, part_title in self.split_message(content, title):
+            body = self.request_payload(part_content, part_title)
+            self._post_many([(url, body) for url in urls], concurrency)
+        self._log_success()
+
+    async def send_async(self, content, title=None):
+        urls = self.broadcast_urls()
+        if urls is None:
+            return await super().send_async(content, title)
+        concurrency = self._broadcast_concurrency(len(urls))
+        for part_content, part_title in self.split_message(content, title):
+            body = self.request_payload(part_content, part_title)
+            await self._post_many_async([(url, body) for url in urls], concurrency)
+        self._log_success()
+
+    def _broadcast_concurrency(self, targets: int) -> int:
+        return min(self.config.broadcast_concurrency or DEFAULT_BROADCAST_CONCURRENCY, targets)
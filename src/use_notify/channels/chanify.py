@@ -1,9 +1,21 @@
+from typing import Callable, Optional, Union
+
+from .config import ChannelConfig
 from .http import HttpChannel
 
 
+class ChanifyConfig(ChannelConfig):
+    __slots__ = ("token", "base_url")
+
+    token: Union[str, Callable[[], str]]
+    base_url: Optional[str]
+
+
 class Chanify(HttpChannel):
     """chanify 消息通知"""
 
+    config_class = ChanifyConfig
+
     payload_kind = "data"
     provider_name = "chanify"
     success_fields = {"res": {0}, "code": {0}}
@@ -0,0 +1,101 @@
+from collections.abc import Mapping
+from typing import Dict, Optional, Tuple
+
+
+class ChannelConfig(Mapping):
+    """基于 ``__slots__`` 的渠道配置
+
+    子类在 ``__slots__`` 中声明字段，构造时从配置字典一次性读取并校验，
+    之后 ``config.token`` 是普通的槽位读取，不再经过字典查找。
+
+    - 未提供的已声明字段读取为 ``None``；
+    - 未声明的键保存在额外字典中，同样可以通过属性读取；既未声明也未传入的
+      名称抛出 AttributeError；
+    - ``"key" in config``、``config["key"]``、``config.get("key")`` 只认实际传入的键，
+      ``config["key"] = value`` 与属性赋值等价。
+
+    它是只读的 Mapping 而不是 dict：没有 ``copy()`` / ``update()``，
+    需要字典时使用 ``to_dict()``。
+
+    每次赋值都会递增 ``_version``，渠道据此让缓存的请求体失效；
+    原地修改列表等可变值不会被察觉，需要重新赋值。
+    """
+
+    __slots__ = ("_keys", "_extra", "_version")
+
+    _fields: Tuple[str, ...] = ()
+    # 相同键集合的实例共享同一个 tuple，大量同类渠道时节省内存
+    _key_sets: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if not name.startswith("_") and name not in fields:
+                    fields.append(name)
+        cls._fields = tuple(fields)
+
+    def __init__(self, config: Optional[Mapping] = None):
+        values = dict(config) if config else {}
+        keys = tuple(values)
+        set_slot = object.__setattr__
+        set_slot(self, "_keys", self._key_sets.setdefault(keys, keys))
+        for name in self._fields:
+            set_slot(self, name, values.pop(name, None))
+        set_slot(self, "_extra", values or None)
+        set_slot(self, "_version", 0)
+        self.validate()
+
+    def validate(self) -> None:
+        """在构造时调用，子类覆盖以校验字段，失败时抛出 ValueError"""
+
+    def __getattr__(self, name):
+        # 只有未声明的字段会走到这里
+        extra = self._extra
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        if name in self._fields:
+            object.__setattr__(self, name, value)
+        else:
+            extra = self._extra
+            if extra is None:
+                extra = {}
+                object.__setattr__(self, "_extra", extra)
+            extra[name] = value
+        if name not in self._keys:
+            object.__setattr__(self, "_keys", self._keys + (name,))
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        # 与方法同名的额外键（如 "get"）要从额外字典读取
+        if key in self._fields:
+            return getattr(self, key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def to_dict(self) -> dict:
+        """返回实际传入的配置"""
+        return dict(self)
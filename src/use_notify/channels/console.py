@@ -1,22 +1,146 @@
+import atexit
+import json
+import sys
+import threading
+import time
+from typing import IO, Optional
+
+from use_notify._validation import is_int_like, is_number_like
+
 from .base import BaseChannel
+from .config import ChannelConfig
+
+TEXT = "text"
+JSON = "json"
+
+
+class ConsoleConfig(ChannelConfig):
+    __slots__ = ("stream", "format", "buffer_size", "flush_interval")
+
+    stream: Optional[IO[str]]
+    format: Optional[str]
+    buffer_size: Optional[int]
+    flush_interval: Optional[float]
+
+    def validate(self):
+        if self.format not in (None, TEXT, JSON):
+            raise ValueError("format must be 'text' or 'json'")
+        if self.buffer_size is not None and (
+            not is_int_like(self.buffer_size) or self.buffer_size < 1
+        ):
+            raise ValueError("buffer_size must be >= 1")
+        if self.flush_interval is not None and (
+            not is_number_like(self.flush_interval) or self.flush_interval <= 0
+        ):
+            raise ValueError("flush_interval must be > 0")
 
 
 class Console(BaseChannel):
-    """控制台通知渠道（用于演示）"""
+    """控制台通知渠道（用于演示，也可作为压测时的输出端）
+
+    每条消息格式化为一个字符串后一次写入，多线程并发发送时输出不会交错。
+
+    配置项：
+
+    - ``stream``：输出流，默认写入当前的 ``sys.stdout``；
+    - ``format``：``"text"``（默认）或 ``"json"``，后者每条消息输出一行 JSON；
+    - ``buffer_size``：开启缓冲，累计这么多条消息后一次写入；
+    - ``flush_interval``：开启缓冲，并由后台线程每隔这么多秒写出一次。
+
+    缓冲模式下可调用 ``flush()`` 立即写出，``close()`` 停止后台线程并写出剩余消息；
+    进程退出时也会自动写出。``close()`` 之后仍可继续发送，缓冲和退出时写出会重新开启。
+    """
+
+    config_class = ConsoleConfig
 
     def __init__(self, config=None):
         super().__init__(config or {})
+        config = self.config
+        self._json = config.format == JSON
+        self._buffered = config.buffer_size is not None or config.flush_interval is not None
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher: Optional[threading.Event] = None
+        self._closed = False
+        if self._buffered:
+            atexit.register(self.flush)
 
     def send(self, content, title=None):
         """发送通知到控制台"""
-        title_display = title or "消息提醒"
-        print(f"\n📢 [默认实例通知] {title_display}")
-        print(f"📝 {content}")
-        print("-" * 50)
+        self._emit(self._format(content, title, "默认实例通知"))
 
     async def send_async(self, content, title=None):
         """异步发送通知到控制台"""
+        self._emit(self._format(content, title, "默认实例异步通知"))
+
+    def flush(self):
+        """立即写出缓冲中的消息"""
+        with self._lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            # 在锁内写出，保证各批次按顺序输出
+            self._write(text, flush=True)
+
+    def close(self):
+        """停止后台刷新线程并写出剩余消息"""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+            if flusher is not None:
+                self._stop_flusher.set()
+            if self._buffered and not self._closed:
+                atexit.unregister(self.flush)
+            self._closed = True
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+
+    def _format(self, content, title, label):
         title_display = title or "消息提醒"
-        print(f"\n📢 [默认实例异步通知] {title_display}")
-        print(f"📝 {content}")
-        print("-" * 50)
+        if self._json:
+            record = {"ts": time.time(), "title": title_display, "content": content}
+            return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        return f"\n📢 [{label}] {title_display}\n📝 {content}\n{'-' * 50}\n"
+
+    def _emit(self, text):
+        if not self._buffered:
+            self._write(text)
+            return
+        with self._lock:
+            if self._closed:
+                # close() 之后继续发送：重新登记退出时写出，避免缓冲中的消息丢失
+                self._closed = False
+                atexit.register(self.flush)
+            self._buffer.append(text)
+            buffer_size = self.config.buffer_size
+            full = buffer_size is not None and len(self._buffer) >= buffer_size
+        if self.config.flush_interval is not None and self._flusher is None:
+            self._start_flusher()
+        if full:
+            self.flush()
+
+    def _write(self, text, flush=False):
+        stream = self.config.stream or sys.stdout
+        stream.write(text)
+        if flush:
+            stream.flush()
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is not None:
+                return
+            # 每个后台线程有自己的停止信号，close() 后重新启动的线程不受影响
+            stop = self._stop_flusher = threading.Event()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(stop,),
+                name="use-notify-console-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _flush_periodically(self, stop):
+        while not stop.wait(self.config.flush_interval):
+            self.flush()
@@ -1,41 +1,91 @@
 # -*- coding: utf-8 -*-
-from .http import HttpChannel
+import base64
+import hashlib
+import hmac
+import time
+from typing import Callable, List, Optional, Union
+from urllib.parse import quote_plus
 
+from .broadcast import BroadcastChannel, BroadcastConfig
 
-class Ding(HttpChannel):
+# 钉钉接受一小时内的时间戳，同一时间窗口内的请求复用同一个时间戳和签名
+SIGN_REUSE_SECONDS = 60
+
+
+class DingConfig(BroadcastConfig):
+    __slots__ = ("secret", "at_all", "at_mobiles", "at_user_ids")
+
+    secret: Optional[Union[str, Callable[[], str]]]
+    at_all: Optional[bool]
+    at_mobiles: Optional[List[str]]
+    at_user_ids: Optional[List[str]]
+
+
+class Ding(BroadcastChannel):
     """钉钉消息通知
     https://developers.dingtalk.com/document/app/custom-robot-access?spm=ding_open_doc.document.0.0.6d9d28e1QcCPII#topic-2026027
+
+    配置 ``secret`` 时使用加签模式，URL 附带 ``timestamp`` 和 ``sign``。
     """
 
+    config_class = DingConfig
+
     payload_kind = "json"
+    cache_request_body = True
     provider_name = "ding"
     success_fields = {"errcode": {0}}
     success_log_message = "`钉钉` send successfully"
+    max_message_bytes = 20000
+    default_title = "消息提醒"
+    # (secret, 预先载入密钥的 HMAC 对象)
+    _hmac_key = None
+    # (时间戳, secret, 已编码的签名)
+    _signature_cache = None
 
-    @property
-    def api_url(self):
-        return (
-            "https://oapi.dingtalk.com/robot/send"
-            f"?access_token={self.resolve_config_value('token')}"
-        )
+    def url_for_token(self, token):
+        url = f"https://oapi.dingtalk.com/robot/send?access_token={token}"
+        if self.config.secret:
+            timestamp, sign = self.signature()
+            url = f"{url}&timestamp={timestamp}&sign={sign}"
+        return url
+
+    def signature(self):
+        """返回 ``(毫秒时间戳, URL 编码后的签名)``，同一时间窗口内直接复用"""
+        secret = self.resolve_config_value("secret")
+        now = int(time.time())
+        timestamp = (now - now % SIGN_REUSE_SECONDS) * 1000
+        cached = self._signature_cache
+        if cached is not None and cached[0] == timestamp and cached[1] == secret:
+            return timestamp, cached[2]
+
+        key = self._hmac_key
+        if key is None or key[0] != secret:
+            key = (secret, hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256))
+            self._hmac_key = key
+        mac = key[1].copy()
+        mac.update(f"{timestamp}\n{secret}".encode("utf-8"))
+        sign = quote_plus(base64.b64encode(mac.digest()))
+        self._signature_cache = (timestamp, secret, sign)
+        return timestamp, sign
 
     @property
     def headers(self):
         return {"Content-Type": "application/json"}
 
     def build_api_body(self, content, title=None):
-        title = title or "消息提醒"
+        title = title or self.default_title
         api_body = {
             "msgtype": "markdown",
             "markdown": {"title": title, "text": content},
             "at": {},
         }
-        if self.config.at_all:
-            api_body["at"]["isAtAll"] = self.config.at_all
-        if self.config.at_mobiles:
-            api_body["at"]["atMobiles"] = self.config.at_mobiles
-        if self.config.at_user_ids:
-            api_body["at"]["atUserIds"] = self.config.at_user_ids
+        config = self.config
+        if config.at_all:
+            api_body["at"]["isAtAll"] = config.at_all
+        if config.at_mobiles:
+            api_body["at"]["atMobiles"] = config.at_mobiles
+        if config.at_user_ids:
+            api_body["at"]["atUserIds"] = config.at_user_ids
         return api_body
 
     def build_request_payload(self, content, title=None):
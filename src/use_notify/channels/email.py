@@ -5,17 +5,43 @@ import smtplib
 from email.header import Header
 from email.mime.text import MIMEText
 from functools import partial
+from typing import List, Optional, Union
 
 from use_notify._validation import is_int_like
 
 from .base import BaseChannel
+from .config import ChannelConfig
 
 logger = logging.getLogger(__name__)
 
 
+class EmailConfig(ChannelConfig):
+    __slots__ = (
+        "server",
+        "port",
+        "username",
+        "password",
+        "from_email",
+        "to_emails",
+        "use_ssl",
+        "use_tls",
+    )
+
+    server: str
+    port: Union[int, str]
+    username: str
+    password: str
+    from_email: str
+    to_emails: List[str]
+    use_ssl: Optional[bool]
+    use_tls: Optional[bool]
+
+
 class Email(BaseChannel):
     """邮件消息通知"""
 
+    config_class = EmailConfig
+
     def __init__(self, config):
         super().__init__(config)
         self._validate_required_fields()
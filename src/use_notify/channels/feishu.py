@@ -1,27 +1,40 @@
 # -*- coding: utf-8 -*-
-from .http import HttpChannel
+from typing import List, Optional
 
+from .broadcast import BroadcastChannel, BroadcastConfig
 
-class Feishu(HttpChannel):
+
+class FeishuConfig(BroadcastConfig):
+    __slots__ = ("at_all", "at_user_ids")
+
+    at_all: Optional[bool]
+    at_user_ids: Optional[List[str]]
+
+
+class Feishu(BroadcastChannel):
     """飞书消息通知
     https://open.feishu.cn/document/client-docs/bot-v3/add-custom-bot?lang=zh-CN
     """
 
+    config_class = FeishuConfig
+
     payload_kind = "json"
+    cache_request_body = True
     provider_name = "feishu"
     success_fields = {"code": {0}}
     success_log_message = "`飞书` send successfully"
+    max_message_bytes = 20 * 1024
+    default_title = "消息提醒"
 
-    @property
-    def api_url(self):
-        return f"https://open.feishu.cn/open-apis/bot/v2/hook/{self.resolve_config_value('token')}"
+    def url_for_token(self, token):
+        return f"https://open.feishu.cn/open-apis/bot/v2/hook/{token}"
 
     @property
     def headers(self):
         return {"Content-Type": "application/json"}
 
     def build_api_body(self, content, title=None):
-        title = title or "消息提醒"
+        title = title or self.default_title
         api_body_content = [{"tag": "text", "text": content}]
 
         if self.config.at_all:
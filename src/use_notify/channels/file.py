@@ -0,0 +1,249 @@
+import asyncio
+import atexit
+import gzip
+import os
+import shutil
+import threading
+import time
+import weakref
+from typing import List, Optional
+
+from use_notify._validation import is_int_like, is_number_like
+
+from .base import BaseChannel
+from .config import ChannelConfig
+from .utils import dumps_json
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# 进程退出时关闭仍存活的 File；弱引用集合不会让渠道对象和文件句柄常驻内存
+_open_files: "weakref.WeakSet[File]" = weakref.WeakSet()
+_files_lock = threading.Lock()
+_atexit_registered = False
+
+
+class FileConfig(ChannelConfig):
+    __slots__ = (
+        "path",
+        "buffer_size",
+        "rotate_bytes",
+        "rotate_interval",
+        "compress",
+        "fsync_every",
+        "fsync_interval",
+    )
+
+    path: str
+    buffer_size: Optional[int]
+    rotate_bytes: Optional[int]
+    rotate_interval: Optional[float]
+    compress: Optional[bool]
+    fsync_every: Optional[int]
+    fsync_interval: Optional[float]
+
+    def validate(self):
+        if not self.path:
+            raise ValueError("File channel requires 'path' in config")
+        for name in ("buffer_size", "rotate_bytes", "fsync_every"):
+            value = getattr(self, name)
+            if value is not None and (not is_int_like(value) or value < 1):
+                raise ValueError(f"{name} must be >= 1")
+        for name in ("rotate_interval", "fsync_interval"):
+            value = getattr(self, name)
+            if value is not None and (not is_number_like(value) or value <= 0):
+                raise ValueError(f"{name} must be > 0")
+
+
+class File(BaseChannel):
+    """把通知以 JSON Lines 追加写入本地文件，用于审计归档
+
+    每条消息写为一行 ``{"ts": ..., "title": ..., "content": ...}``。
+
+    配置项：
+
+    - ``path``：文件路径（必填），目录不存在时自动创建；
+    - ``buffer_size``：写缓冲字节数，默认 64 KiB；
+    - ``rotate_bytes`` / ``rotate_interval``：文件超过该大小或打开超过该秒数后轮转，
+      旧文件重命名为 ``<path>.<时间>``；
+    - ``compress``：轮转后在后台线程中把旧文件压缩为 ``.gz``；
+    - ``fsync_every`` / ``fsync_interval``：每写入这么多条或距上次 fsync 超过这么多秒时
+      刷新缓冲并 fsync；设置 ``fsync_interval`` 时由后台线程按间隔执行，
+      没有新消息时也不会让记录一直留在缓冲中。
+
+    ``buffer_size`` 和 fsync 策略都不设置时，每条记录写入后立即交给操作系统
+    （不 fsync），进程被强制终止也不会丢失已发送的记录。只设置 ``buffer_size``
+    时记录留在缓冲中，直到轮转、``flush()``、``close()`` 或进程正常退出。
+
+    ``close()`` 之后仍可继续发送，文件会重新打开，进程退出时照常写出。
+    """
+
+    config_class = FileConfig
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.path = os.path.abspath(os.fspath(self.config.path))
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._unsynced = 0
+        self._synced_at = 0.0
+        self._compressors: List[threading.Thread] = []
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher: Optional[threading.Event] = None
+        _register_for_exit_close(self)
+
+    def send(self, content, title=None):
+        """追加一条记录"""
+        line = dumps_json({"ts": time.time(), "title": title, "content": content}) + b"\n"
+        config = self.config
+        with self._lock:
+            file = self._file
+            if file is None or self._should_rotate(len(line)):
+                file = self._reopen()
+            file.write(line)
+            self._size += len(line)
+            self._unsynced += 1
+            if (
+                (config.fsync_every is not None and self._unsynced >= config.fsync_every)
+                or (
+                    config.fsync_interval is not None
+                    and time.monotonic() - self._synced_at >= config.fsync_interval
+                )
+                or self._write_through
+            ):
+                self._sync()
+            if config.fsync_interval is not None and self._flusher is None:
+                self._start_flusher()
+
+    async def send_async(self, content, title=None):
+        """追加一条记录；写入、轮转和 fsync 在线程池中执行，不阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send, content, title)
+
+    def flush(self):
+        """写出缓冲；配置了 fsync 策略时同时 fsync"""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def close(self):
+        """停止后台 fsync 线程，写出缓冲、关闭文件，并等待后台压缩完成"""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+            if flusher is not None:
+                self._stop_flusher.set()
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+        if flusher is not None:
+            flusher.join()
+        for thread in self._compressors:
+            thread.join()
+        self._compressors.clear()
+
+    @property
+    def _write_through(self) -> bool:
+        config = self.config
+        return (
+            config.buffer_size is None
+            and config.fsync_every is None
+            and config.fsync_interval is None
+        )
+
+    def _start_flusher(self):
+        # 已持有 self._lock；线程只持有弱引用，渠道被回收后线程随之退出
+        stop = self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=_sync_periodically,
+            args=(weakref.ref(self), stop, self.config.fsync_interval),
+            name="use-notify-file-fsync",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _sync_pending(self):
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                self._sync()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        config = self.config
+        if (
+            config.rotate_bytes is not None
+            and self._size
+            and (self._size + incoming > config.rotate_bytes)
+        ):
+            return True
+        return (
+            config.rotate_interval is not None
+            and time.monotonic() - self._opened_at >= config.rotate_interval
+        )
+
+    def _reopen(self):
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+            self._rotate()
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=self.config.buffer_size or DEFAULT_BUFFER_SIZE)
+        self._size = self._file.tell()
+        self._opened_at = self._synced_at = time.monotonic()
+        return self._file
+
+    def _rotate(self):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        target = f"{self.path}.{stamp}"
+        suffix = 1
+        while os.path.exists(target) or os.path.exists(f"{target}.gz"):
+            target = f"{self.path}.{stamp}.{suffix}"
+            suffix += 1
+        os.replace(self.path, target)
+        if self.config.compress:
+            self._compressors = [thread for thread in self._compressors if thread.is_alive()]
+            thread = threading.Thread(
+                target=_gzip_file, args=(target,), name="use-notify-file-gzip", daemon=True
+            )
+            thread.start()
+            self._compressors.append(thread)
+
+    def _sync(self):
+        file = self._file
+        file.flush()
+        if self.config.fsync_every is not None or self.config.fsync_interval is not None:
+            os.fsync(file.fileno())
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+
+def _register_for_exit_close(channel: File) -> None:
+    global _atexit_registered
+    with _files_lock:
+        _open_files.add(channel)
+        if not _atexit_registered:
+            atexit.register(_close_open_files)
+            _atexit_registered = True
+
+
+def _close_open_files() -> None:
+    """进程退出前写出并关闭所有仍存活的 File"""
+    for channel in list(_open_files):
+        channel.close()
+
+
+def _sync_periodically(ref, stop: threading.Event, interval: float):
+    while not stop.wait(interval):
+        channel = ref()
+        if channel is None:
+            return
+        channel._sync_pending()
+        del channel
+
+
+def _gzip_file(path: str):
+    with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.remove(path)
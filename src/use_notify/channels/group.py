@@ -0,0 +1,158 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Sequence
+
+from use_notify._validation import is_number_like
+from use_notify.notification import NotificationPublishError
+
+from .base import BaseChannel
+from .config import ChannelConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelGroupError(NotificationPublishError):
+    """渠道组内所有渠道都失败，任一成员的失败可重试时整个渠道组可被重试"""
+
+
+class ChannelGroup(BaseChannel):
+    """一组等价渠道，任一渠道发送成功即视为送达
+
+    - 未设置 ``hedge_delay`` 时按顺序故障转移：前一个渠道失败才尝试下一个。
+    - 设置 ``hedge_delay`` 后进行对冲发送：前一个渠道在 ``hedge_delay`` 秒内
+      未成功（仍在发送或已失败）就并行启动下一个，首个成功的渠道胜出，其余
+      仍在进行的异步发送会被取消。同步发送无法中断已在运行的线程，
+      落选渠道可能在后台完成，因此接收方可能收到重复消息。
+
+    所有渠道都失败时抛出 ChannelGroupError（NotificationPublishError 的子类），
+    包含每个渠道的失败原因；
+    只要其中有可重试的失败，发布器的 ``max_retries`` 仍会重试整个渠道组。
+
+    Example:
+        group = ChannelGroup([WeChat(...), Feishu(...)], hedge_delay=0.5)
+        useNotify([group]).publish(title="告警", content="...")
+    """
+
+    config_class = ChannelConfig
+
+    def __init__(self, channels: Sequence[BaseChannel], hedge_delay: Optional[float] = None):
+        super().__init__({})
+        channels = tuple(channels)
+        if not channels:
+            raise ValueError("ChannelGroup requires at least one channel")
+        if hedge_delay is not None and (not is_number_like(hedge_delay) or hedge_delay < 0):
+            raise ValueError("hedge_delay must be >= 0")
+        self.channels = channels
+        self.hedge_delay = hedge_delay
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def send(self, content, title=None):
+        if self.hedge_delay is None:
+            return self._failover(content, title)
+        return self._hedge(content, title)
+
+    async def send_async(self, content, title=None):
+        if self.hedge_delay is None:
+            return await self._failover_async(content, title)
+        return await self._hedge_async(content, title)
+
+    def _failover(self, content, title):
+        failures = []
+        for channel in self.channels:
+            try:
+                channel.send(content, title)
+            except Exception as error:
+                failures.append((channel, error))
+                continue
+            self._log_winner(channel, failures)
+            return
+        self._raise_all_failed(failures)
+
+    async def _failover_async(self, content, title):
+        failures = []
+        for channel in self.channels:
+            try:
+                await channel.send_async(content, title)
+            except Exception as error:
+                failures.append((channel, error))
+                continue
+            self._log_winner(channel, failures)
+            return
+        self._raise_all_failed(failures)
+
+    def _hedge(self, content, title):
+        executor = self._get_executor()
+        remaining = list(self.channels)
+        running = {}
+        failures = []
+        while remaining or running:
+            if remaining:
+                channel = remaining.pop(0)
+                # Run in a copy of the caller's context so metrics and tracing
+                # from the publish call still apply inside worker threads.
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, channel.send, content, title)] = channel
+            timeout = self.hedge_delay if remaining else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                channel = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    self._log_winner(channel, failures)
+                    return
+                failures.append((channel, error))
+        self._raise_all_failed(failures)
+
+    async def _hedge_async(self, content, title):
+        remaining = list(self.channels)
+        running = {}
+        failures = []
+        try:
+            while remaining or running:
+                if remaining:
+                    channel = remaining.pop(0)
+                    running[asyncio.ensure_future(channel.send_async(content, title))] = channel
+                timeout = self.hedge_delay if remaining else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    channel = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._log_winner(channel, failures)
+                        return
+                    failures.append((channel, error))
+            self._raise_all_failed(failures)
+        finally:
+            for task in running:
+                task.cancel()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=len(self.channels), thread_name_prefix="use-notify-hedge"
+                    )
+        return self._executor
+
+    @staticmethod
+    def _log_winner(channel, failures):
+        logger.debug(
+            "ChannelGroup delivered via %s after %s failed channel(s)",
+            channel.__class__.__name__,
+            len(failures),
+        )
+
+    @staticmethod
+    def _raise_all_failed(failures):
+        if len(failures) == 1:
+            raise failures[0][1]
+        raise ChannelGroupError(
+            [(channel.__class__.__name__, error) for channel, error in failures]
+        )
@@ -1,12 +1,49 @@
+import asyncio
+import contextvars
+import functools
 import logging
+import threading
+import time
+import weakref
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
-import httpx
+from use_notify.metrics import current_metrics_sink
+from use_notify.tracing import current_span, http_trace_hook, http_trace_hook_async
 
 from .base import BaseChannel
-from .utils import validate_business_response
+from .config import ChannelConfig
+from .splitting import json_text_size, number_title, split_text
+from .utils import (
+    build_success_prefixes,
+    dumps_json,
+    freeze_success_fields,
+    validate_business_response,
+)
 
 logger = logging.getLogger(__name__)
+_pool_lock = threading.Lock()
+
+
+class _Borrowed:
+    """把复用的客户端包装成上下文管理器，退出时不关闭"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client):
+        self.client = client
+
+    def __enter__(self):
+        return self.client
+
+    def __exit__(self, *exc_info):
+        return None
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        return None
 
 
 class HttpChannel(BaseChannel):
@@ -15,61 +52,375 @@ class HttpChannel(BaseChannel):
     success_fields = None
     provider_name = None
     success_log_message = None
+    # 为 True 时 JSON 请求体序列化后缓存，重试同一条消息时直接复用；配置属性
+    # 被重新赋值后缓存失效。缓存会跨越多次发送，只有请求体完全由消息和配置决定
+    # 的渠道才应开启，因此默认关闭，由内置渠道各自开启
+    cache_request_body = False
+    _body_cache = None
+    _success_prefixes = ()
+    # 为 True 时多次发送复用同一个连接池：同步客户端按渠道实例共享，
+    # 异步客户端按事件循环共享；用完调用 close() / aclose() 释放
+    reuse_connections = False
+    _pooled_client = None
+    # {事件循环: (AsyncClient, 关闭任务)}
+    _async_pools = None
+    # 除 GET / POST 外允许的请求方法，统一经 client.request 发送
+    request_methods = ("GET", "POST")
+    # 单条消息的字节上限（按 message_size 计算），超出时按行拆分为带编号的多条
+    # 依次发送；None 表示不拆分。只适用于 JSON 请求体
+    max_message_bytes = None
+    # 未传标题时使用的标题，拆分时在它后面加编号
+    default_title = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 在类定义时冻结成功值集合并生成成功响应的前缀，避免每次响应都重新构建
+        if cls.__dict__.get("success_fields"):
+            cls.success_fields = freeze_success_fields(cls.success_fields)
+            cls._success_prefixes = build_success_prefixes(cls.success_fields)
 
     @abstractmethod
     def build_request_payload(self, content, title=None):
         raise NotImplementedError
 
+    def request_payload(self, content, title=None):
+        """返回发送用的请求体，JSON 请求体序列化为 bytes 并按消息和配置版本缓存"""
+        if self.payload_kind != "json":
+            return self.build_request_payload(content, title)
+        config = self.config
+        # ChannelConfig 以版本号判断配置是否变化，其他字典配置比较浅拷贝快照
+        if isinstance(config, ChannelConfig):
+            version = config._version
+        else:
+            version = dict(config) if isinstance(config, dict) else None
+        cached = self._body_cache
+        if (
+            cached is not None
+            and cached[0] is content
+            and cached[1] is title
+            and cached[2] is config
+            and cached[3] == version
+        ):
+            return cached[4]
+        body = dumps_json(self.build_request_payload(content, title))
+        if self.cache_request_body and version is not None:
+            self._body_cache = (content, title, config, version, body)
+        return body
+
+    def message_size(self, content, title=None) -> int:
+        """按服务商限制的口径计算消息大小，默认是 JSON 请求体的字节数"""
+        return len(self.request_payload(content, title))
+
+    def measure_content(self, text) -> int:
+        """``text`` 作为正文时在 message_size 中占用的字节数"""
+        return json_text_size(text)
+
+    def split_message(self, content, title=None):
+        """超出 ``max_message_bytes`` 时按行拆分，返回 ``[(content, title), ...]``
+
+        拆分后每条的标题带上编号，例如 ``告警 (2/3)``。
+        """
+        limit = self.max_message_bytes
+        if limit is None or self.message_size(content, title) <= limit:
+            return [(content, title)]
+        title = title or self.default_title
+        # 按三位数编号预留标题长度
+        overhead = self.message_size("", number_title(title, 999, 999))
+        chunks = split_text(content, limit - overhead, self.measure_content)
+        total = len(chunks)
+        return [(chunk, number_title(title, index, total)) for index, chunk in enumerate(chunks, 1)]
+
     def send(self, content, title=None):
-        payload = self.build_request_payload(content, title)
-        with httpx.Client() as client:
+        parts = self.split_message(content, title)
+        if len(parts) > 1:
+            self._send_parts(parts)
+            self._log_success()
+            return
+
+        payload = self.request_payload(content, title)
+        with self._client() as client:
+            metrics = current_metrics_sink()
+            started = time.perf_counter()
             response = self._send_request(client, payload)
+            if metrics is not None:
+                self._record_response(metrics, response, started)
+            span = current_span()
+            if span is not None:
+                span.set_attribute("http.response.status_code", response.status_code)
             self._handle_response(response)
         self._log_success()
 
     async def send_async(self, content, title=None):
-        payload = self.build_request_payload(content, title)
-        async with httpx.AsyncClient() as client:
+        parts = self.split_message(content, title)
+        if len(parts) > 1:
+            await self._send_parts_async(parts)
+            self._log_success()
+            return
+
+        payload = self.request_payload(content, title)
+        async with self._async_client() as client:
+            metrics = current_metrics_sink()
+            started = time.perf_counter()
             response = await self._send_request_async(client, payload)
+            if metrics is not None:
+                self._record_response(metrics, response, started)
+            span = current_span()
+            if span is not None:
+                span.set_attribute("http.response.status_code", response.status_code)
             self._handle_response(response)
         self._log_success()
 
+    def close(self):
+        """关闭复用的同步连接池"""
+        client, self._pooled_client = self._pooled_client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self):
+        """关闭复用的连接池
+
+        当前事件循环的异步客户端在这里关闭；其他仍在运行的循环各自关闭自己的客户端。
+        """
+        self.close()
+        with _pool_lock:
+            pools, self._async_pools = self._async_pools, None
+        if not pools:
+            return
+        current = asyncio.get_running_loop()
+        for loop, (_, closer) in list(pools.items()):
+            if loop is current:
+                closer.cancel()
+                await asyncio.wait([closer])
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(closer.cancel)
+
+    def _client(self):
+        import httpx
+
+        if not self.reuse_connections:
+            return httpx.Client()
+        client = self._pooled_client
+        if client is None:
+            with _pool_lock:
+                client = self._pooled_client
+                if client is None:
+                    client = self._pooled_client = httpx.Client()
+        return _Borrowed(client)
+
+    def _async_client(self):
+        import httpx
+
+        if not self.reuse_connections:
+            return httpx.AsyncClient()
+        # AsyncClient 的连接绑定在创建它的事件循环上，每个循环各用一个；
+        # 随客户端启动一个关闭任务，循环结束时在该循环内关闭客户端并移除条目。
+        # 关闭任务引用着循环，不移除的话循环和客户端会一直留在字典里
+        loop = asyncio.get_running_loop()
+        with _pool_lock:
+            pools = self._async_pools
+            if pools is None:
+                pools = self._async_pools = weakref.WeakKeyDictionary()
+            pooled = pools.get(loop)
+            if pooled is None:
+                client = httpx.AsyncClient()
+                closer = loop.create_task(_close_on_shutdown(client))
+                closer.add_done_callback(functools.partial(_discard_async_pool, pools, loop))
+                pooled = pools[loop] = (client, closer)
+        return _Borrowed(pooled[0])
+
+    def _send_parts(self, parts):
+        url = self.api_url
+        with self._client() as client:
+            for index, (content, title) in enumerate(parts):
+                body = dumps_json(self.build_request_payload(content, title))
+                try:
+                    self._post(client, url, body)
+                except Exception as error:
+                    self._raise_part_failure(index, len(parts), error)
+
+    async def _send_parts_async(self, parts):
+        url = self.api_url
+        async with self._async_client() as client:
+            for index, (content, title) in enumerate(parts):
+                body = dumps_json(self.build_request_payload(content, title))
+                try:
+                    await self._post_async(client, url, body)
+                except Exception as error:
+                    self._raise_part_failure(index, len(parts), error)
+
+    def _raise_part_failure(self, index, total, error):
+        # 第一条失败时原样抛出以便重试；之后的失败不再重试，避免重复发送已送达的部分。
+        # 名称写作 ``Ding(part 2/3)``，与广播目标的 ``Ding[1]`` 区分
+        if index == 0:
+            raise error
+
+        from use_notify.notification import NotificationPublishError
+
+        name = f"{self.__class__.__name__}(part {index + 1}/{total})"
+        raise NotificationPublishError([(name, error)])
+
+    def _post_many(self, requests, concurrency):
+        """在同一个连接池上并发 POST 多个 ``(url, body)``，失败按下标汇总后抛出"""
+        import httpx
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        with httpx.Client(limits=limits) as client:
+            if concurrency == 1:
+                errors = [self._capture(self._post, client, url, body) for url, body in requests]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=concurrency, thread_name_prefix="use-notify-http"
+                ) as executor:
+                    futures = [
+                        # 每个请求在调用方上下文的副本中运行，指标与追踪照常生效
+                        executor.submit(
+                            contextvars.copy_context().run, self._post, client, *request
+                        )
+                        for request in requests
+                    ]
+                    errors = [future.exception() for future in futures]
+        self._raise_request_failures(errors)
+
+    async def _post_many_async(self, requests, concurrency):
+        import httpx
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(limits=limits) as client:
+
+            async def post(url, body):
+                async with semaphore:
+                    await self._post_async(client, url, body)
+
+            results = await asyncio.gather(
+                *(post(url, body) for url, body in requests), return_exceptions=True
+            )
+        self._raise_request_failures(
+            [result if isinstance(result, Exception) else None for result in results]
+        )
+
+    def _post(self, client, url, body):
+        metrics = current_metrics_sink()
+        started = time.perf_counter()
+        response = client.post(url, headers=self._request_headers(), **self._payload_kwargs(body))
+        if metrics is not None:
+            self._record_response(metrics, response, started)
+        self._handle_response(response)
+
+    async def _post_async(self, client, url, body):
+        metrics = current_metrics_sink()
+        started = time.perf_counter()
+        response = await client.post(
+            url, headers=self._request_headers(), **self._payload_kwargs(body)
+        )
+        if metrics is not None:
+            self._record_response(metrics, response, started)
+        self._handle_response(response)
+
+    @staticmethod
+    def _capture(fn, *args):
+        try:
+            fn(*args)
+        except Exception as error:
+            return error
+        return None
+
+    def _raise_request_failures(self, errors):
+        failures = [
+            (f"{self.__class__.__name__}[{index}]", error)
+            for index, error in enumerate(errors)
+            if error is not None
+        ]
+        if not failures:
+            return
+
+        from use_notify.notification import NotificationPublishError
+
+        raise NotificationPublishError(failures)
+
     def _send_request(self, client, payload):
+        request_kwargs = self._payload_kwargs(payload)
+        span = current_span()
+        if span is not None:
+            request_kwargs["extensions"] = {"trace": http_trace_hook(span)}
         if self.request_method == "POST":
-            return client.post(self.api_url, headers=self.headers, **self._payload_kwargs(payload))
+            return client.post(self.api_url, headers=self._request_headers(), **request_kwargs)
         if self.request_method == "GET":
-            return client.get(self.api_url, headers=self.headers, **self._payload_kwargs(payload))
+            return client.get(self.api_url, headers=self._request_headers(), **request_kwargs)
+        if self.request_method in self.request_methods:
+            return client.request(
+                self.request_method, self.api_url, headers=self._request_headers(), **request_kwargs
+            )
         raise ValueError(f"Unsupported HTTP method: {self.request_method}")
 
     async def _send_request_async(self, client, payload):
+        request_kwargs = self._payload_kwargs(payload)
+        span = current_span()
+        if span is not None:
+            request_kwargs["extensions"] = {"trace": http_trace_hook_async(span)}
         if self.request_method == "POST":
             return await client.post(
-                self.api_url,
-                headers=self.headers,
-                **self._payload_kwargs(payload),
+                self.api_url, headers=self._request_headers(), **request_kwargs
             )
         if self.request_method == "GET":
-            return await client.get(
-                self.api_url,
-                headers=self.headers,
-                **self._payload_kwargs(payload),
+            return await client.get(self.api_url, headers=self._request_headers(), **request_kwargs)
+        if self.request_method in self.request_methods:
+            return await client.request(
+                self.request_method, self.api_url, headers=self._request_headers(), **request_kwargs
             )
         raise ValueError(f"Unsupported HTTP method: {self.request_method}")
 
+    def _request_headers(self):
+        # JSON 请求体以 bytes 发送，httpx 不会再补 Content-Type，未设置时在这里补上
+        headers = self.headers
+        if self.payload_kind != "json" or (
+            headers and any(name.lower() == "content-type" for name in headers)
+        ):
+            return headers
+        return {**(headers or {}), "Content-Type": "application/json"}
+
     def _payload_kwargs(self, payload):
         if self.payload_kind == "json":
-            return {"json": payload}
+            return {"content": payload}
         if self.payload_kind == "data":
             return {"data": payload}
         if self.payload_kind == "params":
             return {"params": payload}
         raise ValueError(f"Unsupported HTTP payload kind: {self.payload_kind}")
 
+    def _record_response(self, metrics, response, started):
+        request = response.request
+        metrics.http_request_finished(
+            self.__class__.__name__,
+            response.status_code,
+            int(request.headers.get("content-length", 0)),
+            time.perf_counter() - started,
+        )
+
     def _handle_response(self, response):
         response.raise_for_status()
         if self.success_fields:
-            validate_business_response(response, self.provider_name, self.success_fields)
+            validate_business_response(
+                response, self.provider_name, self.success_fields, self._success_prefixes
+            )
 
     def _log_success(self):
         if self.success_log_message:
             logger.debug(self.success_log_message)
+
+
+def _discard_async_pool(pools, loop, closer):
+    with _pool_lock:
+        pooled = pools.get(loop)
+        if pooled is not None and pooled[1] is closer:
+            del pools[loop]
+
+
+async def _close_on_shutdown(client):
+    # asyncio.run 和 EventLoopBridge.close 在关闭循环前会取消未完成的任务，
+    # 此时客户端所属的循环仍可用，可以正常关闭连接
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await client.aclose()
@@ -1,33 +1,47 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from use_notify._validation import is_int_like
+
+from .config import ChannelConfig
 from .http import HttpChannel
+from .utils import dumps_json
 
+BatchMessage = Union[str, Tuple[str, Optional[str]]]
 
-class Ntfy(HttpChannel):
-    """Ntfy.sh 通知渠道"""
+DEFAULT_BATCH_CONCURRENCY = 8
 
-    payload_kind = "json"
-    success_log_message = "`ntfy` send successfully"
 
-    def __init__(self, config: dict):
-        """
-        初始化 Ntfy 渠道
+class NtfyConfig(ChannelConfig):
+    __slots__ = ("topic", "base_url", "priority", "tags", "click", "attach", "actions")
 
-        Args:
-            config: 配置字典，必须包含 'topic'，可选包含 'base_url' 等参数
-        """
-        super().__init__(config)
+    topic: Union[str, Callable[[], str]]
+    base_url: Optional[str]
+    priority: Optional[int]
+    tags: Optional[List[str]]
+    click: Optional[str]
+    attach: Optional[str]
+    actions: Optional[List[Dict[str, Any]]]
 
-        # 验证必需的配置参数
-        if "topic" not in self.config or not self.config.topic:
+    def validate(self):
+        if not self.topic:
             raise ValueError("Ntfy channel requires 'topic' in config")
 
+
+class Ntfy(HttpChannel):
+    """Ntfy.sh 通知渠道"""
+
+    config_class = NtfyConfig
+
+    payload_kind = "json"
+    cache_request_body = True
+    success_log_message = "`ntfy` send successfully"
+
     @property
     def api_url(self):
         """构建 ntfy.sh API URL"""
         # 检查是否有自定义 base_url，否则使用默认值
-        if "base_url" in self.config and self.config.base_url:
+        if self.config.base_url:
             base_url = self.config.base_url.rstrip("/")
         else:
             base_url = "https://ntfy.sh"
@@ -58,27 +72,65 @@ class Ntfy(HttpChannel):
             payload["title"] = title
 
         # 添加高级功能支持
+        config = self.config
         # 优先级支持 (1-5)
-        if "priority" in self.config and self.config.priority is not None:
-            payload["priority"] = self.config.priority
+        if config.priority is not None:
+            payload["priority"] = config.priority
 
         # 标签支持
-        if "tags" in self.config and self.config.tags:
-            payload["tags"] = self.config.tags
+        if config.tags:
+            payload["tags"] = config.tags
 
         # 点击 URL 支持
-        if "click" in self.config and self.config.click:
-            payload["click"] = self.config.click
+        if config.click:
+            payload["click"] = config.click
 
         # 附件 URL 支持
-        if "attach" in self.config and self.config.attach:
-            payload["attach"] = self.config.attach
+        if config.attach:
+            payload["attach"] = config.attach
 
         # 操作支持
-        if "actions" in self.config and self.config.actions:
-            payload["actions"] = self.config.actions
+        if config.actions:
+            payload["actions"] = config.actions
 
         return payload
 
     def build_request_payload(self, content: str, title: Optional[str] = None) -> Dict[str, Any]:
         return self._prepare_payload(content, title)
+
+    def send_batch(
+        self, messages: Iterable[BatchMessage], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ):
+        """批量发送多条消息
+
+        topic 只解析一次，所有消息通过同一个保持连接的连接池发送，
+        最多 ``concurrency`` 个请求并发。任一消息失败时抛出
+        NotificationPublishError，渠道名形如 ``Ntfy[3]``（消息在批次中的下标）。
+
+        Args:
+            messages: 消息内容，或 ``(content, title)`` 元组
+            concurrency: 最大并发请求数
+        """
+        requests = self._batch_requests(messages, concurrency)
+        if requests:
+            self._post_many(requests, min(concurrency, len(requests)))
+            self._log_success()
+
+    async def send_batch_async(
+        self, messages: Iterable[BatchMessage], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ):
+        """异步批量发送多条消息，参见 :meth:`send_batch`"""
+        requests = self._batch_requests(messages, concurrency)
+        if requests:
+            await self._post_many_async(requests, min(concurrency, len(requests)))
+            self._log_success()
+
+    def _batch_requests(self, messages, concurrency):
+        if not is_int_like(concurrency) or concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        url = self.api_url
+        requests = []
+        for message in messages:
+            content, title = (message, None) if isinstance(message, str) else message
+            requests.append((url, dumps_json(self.build_request_payload(content, title))))
+        return requests
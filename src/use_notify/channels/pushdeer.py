@@ -1,11 +1,21 @@
 # -*- coding: utf-8 -*-
 import logging
+from typing import Callable, Optional, Union
 
+from .config import ChannelConfig
 from .http import HttpChannel
 
 logger = logging.getLogger(__name__)
 
 
+class PushDeerConfig(ChannelConfig):
+    __slots__ = ("token", "base_url", "type")
+
+    token: Union[str, Callable[[], str]]
+    base_url: Optional[str]
+    type: Optional[str]
+
+
 class PushDeer(HttpChannel):
     """pushdeer app 消息通知
 
@@ -20,6 +30,8 @@ class PushDeer(HttpChannel):
     - type: 可选，消息类型，可选值为text、markdown、image，默认为markdown
     """
 
+    config_class = PushDeerConfig
+
     request_method = "GET"
     payload_kind = "params"
     provider_name = "pushdeer"
@@ -1,9 +1,21 @@
+from typing import Callable, Union
+
+from .config import ChannelConfig
 from .http import HttpChannel
 
 
+class PushOverConfig(ChannelConfig):
+    __slots__ = ("token", "user")
+
+    token: Union[str, Callable[[], str]]
+    user: Union[str, Callable[[], str]]
+
+
 class PushOver(HttpChannel):
     """pushover app 消息通知"""
 
+    config_class = PushOverConfig
+
     payload_kind = "data"
     provider_name = "pushover"
     success_fields = {"status": {1}}
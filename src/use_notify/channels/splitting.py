@@ -0,0 +1,62 @@
+import json
+from typing import Callable, List
+
+
+def json_text_size(text: str) -> int:
+    """``text`` 作为 JSON 字符串值编码后的 UTF-8 字节数（不含引号）"""
+    return len(json.dumps(text, ensure_ascii=False).encode("utf-8")) - 2
+
+
+def utf8_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def number_title(title, index: int, total: int) -> str:
+    return f"{title} ({index}/{total})" if title else f"({index}/{total})"
+
+
+def split_text(text: str, budget: int, measure: Callable[[str], int]) -> List[str]:
+    """按行把 ``text`` 切成若干段，每段按 ``measure`` 计算不超过 ``budget`` 字节
+
+    尽量在换行处切分；单行超长时按字符切开。
+    """
+    if budget < 1:
+        raise ValueError("message size limit leaves no room for content")
+    newline_size = measure("\n")
+    chunks = []
+    lines = []
+    size = 0
+    for line in text.split("\n"):
+        line_size = measure(line)
+        if line_size > budget:
+            if lines:
+                chunks.append("\n".join(lines))
+                lines, size = [], 0
+            pieces = _split_line(line, budget, measure)
+            chunks.extend(pieces[:-1])
+            lines, size = [pieces[-1]], measure(pieces[-1])
+            continue
+        added = line_size + (newline_size if lines else 0)
+        if lines and size + added > budget:
+            chunks.append("\n".join(lines))
+            lines, size = [line], line_size
+        else:
+            lines.append(line)
+            size += added
+    if lines:
+        chunks.append("\n".join(lines))
+    return chunks
+
+
+def _split_line(line: str, budget: int, measure: Callable[[str], int]) -> List[str]:
+    pieces = []
+    start = 0
+    size = 0
+    for index, char in enumerate(line):
+        char_size = measure(char)
+        if size + char_size > budget and index > start:
+            pieces.append(line[start:index])
+            start, size = index, 0
+        size += char_size
+    pieces.append(line[start:])
+    return pieces
@@ -1,5 +1,14 @@
 import json
-from typing import Dict, Iterable
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Union
+
+JsonEncoder = Callable[[object], bytes]
+
+_json_encoder: Optional[JsonEncoder] = None
+
+# Larger response bodies aren't parsed for provider error codes; provider
+# error responses are small, and parsing a huge body costs more than it tells.
+MAX_VALIDATED_BODY_SIZE = 64 * 1024
+_JSON_VALUE_END = frozenset((b",", b"}", b" ", b"\t", b"\r", b"\n"))
 
 
 class ProviderResponseError(RuntimeError):
@@ -15,12 +24,125 @@ class ProviderResponseError(RuntimeError):
         )
 
 
+def dumps_json(payload) -> bytes:
+    """Serialize a request payload to compact UTF-8 JSON bytes.
+
+    Uses orjson or ujson when installed and falls back to the stdlib, matching
+    the compact output of httpx's ``json=``. Override with :func:`set_json_encoder`.
+    """
+    encoder = _json_encoder
+    if encoder is None:
+        encoder = set_json_encoder(None)
+    return encoder(payload)
+
+
+def set_json_encoder(encoder: Union[str, JsonEncoder, None]) -> JsonEncoder:
+    """Set the JSON encoder used for HTTP channel request bodies.
+
+    ``encoder`` is ``"orjson"``, ``"ujson"``, ``"json"``, a callable returning
+    bytes, or ``None`` to pick the fastest installed implementation.
+    """
+    global _json_encoder
+    if callable(encoder):
+        _json_encoder = encoder
+    elif encoder is None:
+        _json_encoder = _orjson_encoder() or _ujson_encoder() or _stdlib_dumps
+    elif encoder == "orjson":
+        _json_encoder = _orjson_encoder(required=True)
+    elif encoder == "ujson":
+        _json_encoder = _ujson_encoder(required=True)
+    elif encoder == "json":
+        _json_encoder = _stdlib_dumps
+    else:
+        raise ValueError(f"Unsupported JSON encoder: {encoder!r}")
+    return _json_encoder
+
+
+def _stdlib_dumps(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+        "utf-8"
+    )
+
+
+def _orjson_encoder(required=False):
+    try:
+        import orjson
+    except ImportError:
+        if required:
+            raise ImportError("orjson is not installed, run `pip install orjson`") from None
+        return None
+
+    def dumps(payload) -> bytes:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            # orjson rejects non-str keys and integers beyond 64 bits
+            return _stdlib_dumps(payload)
+
+    return dumps
+
+
+def _ujson_encoder(required=False):
+    try:
+        import ujson
+    except ImportError:
+        if required:
+            raise ImportError("ujson is not installed, run `pip install ujson`") from None
+        return None
+
+    def dumps(payload) -> bytes:
+        return ujson.dumps(payload, ensure_ascii=False, escape_forward_slashes=False).encode(
+            "utf-8"
+        )
+
+    return dumps
+
+
+def freeze_success_fields(success_fields: Dict[str, Iterable]) -> Dict[str, FrozenSet]:
+    """Return ``success_fields`` with each set of success values frozen."""
+    return {field: frozenset(values) for field, values in success_fields.items()}
+
+
+def build_success_prefixes(success_fields: Dict[str, Iterable]) -> Tuple[bytes, ...]:
+    """Compact JSON prefixes that mark a successful response, e.g. ``{"errcode":0``.
+
+    Only built for a single success field with int or str values; a response
+    starting with one of them succeeded without parsing the body.
+    """
+    if len(success_fields) != 1:
+        return ()
+    ((field, values),) = success_fields.items()
+    key = json.dumps(field).encode("utf-8")
+    return tuple(
+        b"{" + key + b":" + json.dumps(value, ensure_ascii=False).encode("utf-8")
+        for value in values
+        if isinstance(value, (int, str)) and not isinstance(value, bool)
+    )
+
+
 def validate_business_response(
     response,
     provider: str,
     success_fields: Dict[str, Iterable],
+    success_prefixes: Tuple[bytes, ...] = (),
 ) -> None:
-    """Validate provider-specific success fields in a JSON response body."""
+    """Validate provider-specific success fields in a JSON response body.
+
+    Bodies that aren't JSON, exceed ``MAX_VALIDATED_BODY_SIZE`` or start with
+    one of ``success_prefixes`` are accepted without being parsed.
+    """
+    headers = getattr(response, "headers", None)
+    content_type = headers.get("content-type") if headers is not None else None
+    if isinstance(content_type, str) and "json" not in content_type:
+        return
+
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        if success_prefixes and _has_success_prefix(content, success_prefixes):
+            return
+        if len(content) > MAX_VALIDATED_BODY_SIZE:
+            return
+
     try:
         payload = response.json()
     except (TypeError, ValueError):
@@ -32,7 +154,9 @@ def validate_business_response(
     for field, success_values in success_fields.items():
         if field not in payload:
             continue
-        if payload[field] not in set(success_values):
+        if not isinstance(success_values, (frozenset, set)):
+            success_values = set(success_values)
+        if payload[field] not in success_values:
             raise ProviderResponseError(
                 provider=provider,
                 field=field,
@@ -41,6 +165,17 @@ def validate_business_response(
             )
 
 
+def _has_success_prefix(content: bytes, prefixes: Tuple[bytes, ...]) -> bool:
+    if content[:1] != b"{":
+        content = content.lstrip()
+    for prefix in prefixes:
+        # The value must end right after the prefix: {"status":1 is not {"status":10
+        end = content[len(prefix) : len(prefix) + 1]
+        if end in _JSON_VALUE_END and content.startswith(prefix):
+            return True
+    return False
+
+
 def _extract_error_detail(payload: dict) -> str:
     for key in (
         "errmsg",
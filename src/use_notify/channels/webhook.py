@@ -0,0 +1,147 @@
+import json
+import re
+from string import Formatter
+from typing import Any, Callable, Dict, Optional, Union
+
+from .config import ChannelConfig
+from .http import HttpChannel
+from .utils import build_success_prefixes, freeze_success_fields
+
+TEMPLATE_FIELDS = ("title", "content")
+DEFAULT_TEMPLATE = {"title": "{title}", "content": "{content}"}
+METHODS = ("POST", "PUT", "PATCH")
+
+# 编译时用私有区字符标记占位符，序列化后按标记切分
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+_MARK_PATTERN = re.compile(f"{_MARK_START}(\\w+){_MARK_END}")
+
+
+class WebhookConfig(ChannelConfig):
+    __slots__ = ("url", "method", "headers", "payload", "success_fields")
+
+    url: Union[str, Callable[[], str]]
+    method: Optional[str]
+    headers: Optional[Dict[str, str]]
+    payload: Any
+    success_fields: Optional[Dict[str, Any]]
+
+    def validate(self):
+        if not self.url:
+            raise ValueError("Webhook channel requires 'url' in config")
+        if self.method is not None and str(self.method).upper() not in METHODS:
+            raise ValueError(f"method must be one of {', '.join(METHODS)}")
+
+
+class Webhook(HttpChannel):
+    """通用 Webhook 渠道，通过配置对接自建服务，无需编写 HttpChannel 子类
+
+    ``payload`` 是 JSON 模板，字符串中可使用 ``{title}`` 和 ``{content}`` 占位符
+    （``{{`` / ``}}`` 表示字面大括号）。模板在创建渠道时编译为字节片段，
+    发送时只需转义标题和正文并拼接一次，不再逐层复制模板、重新序列化。
+    发送复用渠道自己的连接池。
+
+    Example:
+        Webhook({
+            "url": "https://hooks.example.com/notify",
+            "headers": {"Authorization": "Bearer ..."},
+            "payload": {"text": "**{title}**\\n{content}", "channel": "ops"},
+            "success_fields": {"ok": [True]},
+        })
+    """
+
+    config_class = WebhookConfig
+    reuse_connections = True
+    request_methods = METHODS
+
+    def __init__(self, config):
+        super().__init__(config)
+        config = self.config
+        self.request_method = (config.method or "POST").upper()
+        self.provider_name = "webhook"
+        self._headers = {"Content-Type": "application/json", **(config.headers or {})}
+        self._render = compile_template(
+            DEFAULT_TEMPLATE if config.payload is None else config.payload
+        )
+        if config.success_fields:
+            self.success_fields = freeze_success_fields(config.success_fields)
+            self._success_prefixes = build_success_prefixes(self.success_fields)
+
+    @property
+    def api_url(self):
+        return self.resolve_config_value("url")
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def request_payload(self, content, title=None):
+        return self._render(content, title)
+
+    def build_request_payload(self, content, title=None):
+        return json.loads(self._render(content, title))
+
+
+def compile_template(template) -> Callable[[str, Optional[str]], bytes]:
+    """把 JSON 模板编译为 ``render(content, title) -> bytes``
+
+    模板序列化一次，按占位符切成字节片段；渲染时把转义后的值填入片段之间。
+    """
+    marked = json.dumps(_mark_fields(template), ensure_ascii=False, separators=(",", ":"))
+    pieces = _MARK_PATTERN.split(marked)
+    literals = [piece.encode("utf-8") for piece in pieces[0::2]]
+    fields = pieces[1::2]
+
+    if not fields:
+        body = literals[0]
+        return lambda content, title=None: body
+
+    # 片段与字段交替排列，渲染时原地替换字段位置
+    parts = [literals[0]]
+    slots = []
+    for field, literal in zip(fields, literals[1:]):
+        slots.append((len(parts), field == "content"))
+        parts.append(b"")
+        parts.append(literal)
+
+    def render(content, title=None):
+        content_bytes = _escape(content)
+        title_bytes = _escape(title) if title else b""
+        rendered = parts.copy()
+        for index, is_content in slots:
+            rendered[index] = content_bytes if is_content else title_bytes
+        return b"".join(rendered)
+
+    return render
+
+
+def _mark_fields(node):
+    if isinstance(node, str):
+        return _mark_string(node)
+    if isinstance(node, dict):
+        return {_mark_string(key): _mark_fields(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_mark_fields(item) for item in node]
+    return node
+
+
+def _mark_string(text):
+    if "{" not in text and "}" not in text:
+        return text
+    marked = []
+    for literal, field, format_spec, conversion in Formatter().parse(text):
+        marked.append(literal)
+        if field is None:
+            continue
+        if field not in TEMPLATE_FIELDS or format_spec or conversion:
+            raise ValueError(
+                f"Unsupported template placeholder {{{field}}}; "
+                f"use {', '.join('{' + name + '}' for name in TEMPLATE_FIELDS)}"
+            )
+        marked.append(f"{_MARK_START}{field}{_MARK_END}")
+    return "".join(marked)
+
+
+def _escape(value) -> bytes:
+    # JSON 字符串内容（不含引号）
+    return json.dumps(str(value), ensure_ascii=False)[1:-1].encode("utf-8")
@@ -1,21 +1,32 @@
 # -*- coding: utf-8 -*-
-from .http import HttpChannel
+from typing import List, Optional
 
+from .broadcast import BroadcastChannel, BroadcastConfig
+from .splitting import utf8_size
 
-class WeChat(HttpChannel):
+
+class WeChatConfig(BroadcastConfig):
+    __slots__ = ("mentioned_list", "mentioned_mobile_list")
+
+    mentioned_list: Optional[List[str]]
+    mentioned_mobile_list: Optional[List[str]]
+
+
+class WeChat(BroadcastChannel):
     """企业微信消息通知"""
 
+    config_class = WeChatConfig
+
     payload_kind = "json"
+    cache_request_body = True
     provider_name = "wechat"
     success_fields = {"errcode": {0}}
     success_log_message = "`WeChat` send successfully"
+    # 企业微信限制的是 markdown.content 的 UTF-8 字节数
+    max_message_bytes = 4096
 
-    @property
-    def api_url(self):
-        return (
-            "https://qyapi.weixin.qq.com/cgi-bin/webhook/send"
-            f"?key={self.resolve_config_value('token')}"
-        )
+    def url_for_token(self, token):
+        return f"https://qyapi.weixin.qq.com/cgi-bin/webhook/send?key={token}"
 
     @property
     def headers(self):
@@ -35,3 +46,9 @@ class WeChat(HttpChannel):
 
     def build_request_payload(self, content, title=None):
         return self.build_api_body(title, content)
+
+    def message_size(self, content, title=None):
+        return utf8_size(f"## {title}\n\n{content}" if title else content)
+
+    def measure_content(self, text):
+        return utf8_size(text)
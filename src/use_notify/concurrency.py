@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from use_notify._validation import is_int_like, is_number_like
+
+# Weight of the newest sample in the latency baseline.
+LATENCY_SMOOTHING = 0.1
+
+
+class AdaptiveConcurrency:
+    """Per-channel AIMD limit on concurrent async sends.
+
+    Each channel starts at ``initial_limit`` concurrent attempts. Every
+    successful attempt at full utilization adds ``1 / limit`` (about +1 per
+    round of sends); an overload error (429, 5xx, timeouts and other
+    errors the publisher would retry) or an attempt slower than
+    ``latency_tolerance`` times the channel's smoothed latency multiplies the
+    limit by ``backoff``, at most once per smoothed latency. Attempts beyond
+    the limit wait for a slot.
+
+    Pass one instance to ``useNotify(concurrency=...)``; it keeps separate
+    state for each channel.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        if not is_int_like(min_limit) or min_limit < 1:
+            raise ValueError("min_limit must be >= 1")
+        if not is_int_like(max_limit) or max_limit < min_limit:
+            raise ValueError("max_limit must be >= min_limit")
+        if not is_int_like(initial_limit) or not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if not is_number_like(backoff) or not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if not is_number_like(latency_tolerance) or latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        # Keyed by id() so channels that define __eq__ without __hash__ work;
+        # the entry keeps the channel alive, so its id cannot be reused.
+        self._channels: Dict[int, Tuple[object, "_ChannelLimit"]] = {}
+
+    def for_channel(self, channel) -> "_ChannelLimit":
+        entry = self._channels.get(id(channel))
+        if entry is None:
+            with self._lock:
+                entry = self._channels.setdefault(id(channel), (channel, _ChannelLimit(self)))
+        return entry[1]
+
+    def limit(self, channel) -> Optional[float]:
+        """Current limit for ``channel``, or None before its first send."""
+        entry = self._channels.get(id(channel))
+        return entry[1].limit if entry is not None else None
+
+
+class _ChannelLimit:
+    __slots__ = (
+        "settings",
+        "limit",
+        "in_flight",
+        "latency",
+        "last_decrease",
+        "_lock",
+        "_waiters",
+        "_granted",
+    )
+
+    def __init__(self, settings: AdaptiveConcurrency):
+        self.settings = settings
+        self.limit = float(settings.initial_limit)
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.last_decrease = 0.0
+        # A lock rather than asyncio primitives: the same channel may be sent
+        # from more than one event loop (e.g. a loop bridge and the caller's).
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        # Waiters handed a slot that may not have resumed yet.
+        self._granted = set()
+
+    async def acquire(self):
+        with self._lock:
+            if self.in_flight < int(self.limit) and not self._waiters:
+                self.in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter in self._granted
+                self._granted.discard(waiter)
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            if granted:
+                # The slot was handed over just before cancellation; pass it on.
+                self.release(None)
+            raise
+        with self._lock:
+            self._granted.discard(waiter)
+
+    def release(self, elapsed: Optional[float], overloaded: bool = False):
+        """Free a slot and adjust the limit from the attempt's outcome.
+
+        ``elapsed`` is None when the attempt didn't run and shouldn't count.
+        """
+        with self._lock:
+            full = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if elapsed is not None:
+                self._adjust(elapsed, overloaded, full)
+            self._wake()
+
+    def _adjust(self, elapsed: float, overloaded: bool, full: bool):
+        settings = self.settings
+        latency = self.latency
+        spike = latency is not None and elapsed > latency * settings.latency_tolerance
+        if not overloaded:
+            self.latency = (
+                elapsed if latency is None else latency + LATENCY_SMOOTHING * (elapsed - latency)
+            )
+        if overloaded or spike:
+            now = time.monotonic()
+            # One congestion event often fails several in-flight attempts;
+            # cut once per round trip instead of once per failure.
+            if now - self.last_decrease >= (self.latency or 0.0):
+                self.limit = max(settings.min_limit, self.limit * settings.backoff)
+                self.last_decrease = now
+        elif full:
+            self.limit = min(settings.max_limit, self.limit + 1 / self.limit)
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            self._granted.add(waiter)
+            waiter.get_loop().call_soon_threadsafe(_hand_over, waiter)
+
+
+def _hand_over(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
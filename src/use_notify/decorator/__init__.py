@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 # flake8: noqa: F401
+from .aggregator import AggregateSummary
 from .context import ExecutionContext
 from .core import (
+    NotifyBlock,
     NotifyDecorator,
     clear_default_notify_instance,
     get_default_notify_instance,
     notify,
+    notify_block,
     set_default_notify_instance,
 )
 from .exceptions import NotifyConfigError, NotifyDecoratorError, NotifySendError
@@ -14,11 +17,14 @@ from .sender import NotificationSender
 
 __all__ = [
     "notify",
+    "notify_block",
     "NotifyDecorator",
+    "NotifyBlock",
     "set_default_notify_instance",
     "get_default_notify_instance",
     "clear_default_notify_instance",
     "ExecutionContext",
+    "AggregateSummary",
     "MessageFormatter",
     "NotificationSender",
     "NotifyDecoratorError",
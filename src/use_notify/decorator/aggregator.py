@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+执行统计聚合器，按时间窗口汇总函数执行情况
+"""
+
+import logging
+import math
+import random
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .context import ExecutionContext
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AggregateSummary:
+    """一个聚合窗口内的执行统计"""
+
+    function_name: str
+    window_start: datetime
+    window_end: datetime
+    count: int
+    failures: int
+    p50: float
+    p95: float
+    max_time: float
+    error_types: Tuple[str, ...] = ()
+
+    @property
+    def successes(self) -> int:
+        """成功次数"""
+        return self.count - self.failures
+
+
+class ExecutionAggregator:
+    """按时间窗口收集 ExecutionContext 统计，并在窗口结束时回调一次"""
+
+    # 每个窗口最多保留的耗时样本数，超过后使用蓄水池抽样，保证内存占用恒定
+    MAX_SAMPLES = 1024
+
+    def __init__(
+        self,
+        window: float,
+        on_flush: Callable[[AggregateSummary, Any], None],
+    ):
+        self.window = window
+        self._on_flush = on_flush
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._reset()
+
+    def record(self, context: ExecutionContext, resolve_target: Callable[[], Any]) -> None:
+        """记录一次执行；窗口内第一次记录时解析通知目标并启动计时器"""
+        with self._lock:
+            if self._count == 0:
+                self._function_name = context.function_name
+                self._window_start = context.start_time
+                self._target = resolve_target()
+                self._start_timer()
+
+            self._count += 1
+            execution_time = context.execution_time or 0.0
+            if execution_time > self._max_time:
+                self._max_time = execution_time
+            self._add_sample(execution_time)
+
+            if not context.is_success:
+                self._failures += 1
+                error_type = context.exception.__class__.__name__
+                self._error_types[error_type] = None
+
+    def flush(
+        self, on_flush: Optional[Callable[[AggregateSummary, Any], None]] = None
+    ) -> Optional[AggregateSummary]:
+        """立即结束当前窗口并发送汇总，没有记录时返回 None
+
+        ``on_flush`` 用于本次替代构造时传入的回调。
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._count == 0:
+                return None
+            summary = self._build_summary()
+            target = self._target
+            self._reset()
+
+        (on_flush or self._on_flush)(summary, target)
+        return summary
+
+    def _reset(self) -> None:
+        self._function_name = ""
+        self._window_start: Optional[datetime] = None
+        self._target: Any = None
+        self._count = 0
+        self._failures = 0
+        self._max_time = 0.0
+        self._samples: List[float] = []
+        self._error_types: Dict[str, None] = {}
+
+    def _start_timer(self) -> None:
+        timer = threading.Timer(self.window, self._flush_from_timer)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(f"发送聚合通知失败: {e}")
+
+    def _add_sample(self, execution_time: float) -> None:
+        if len(self._samples) < self.MAX_SAMPLES:
+            self._samples.append(execution_time)
+            return
+        index = random.randrange(self._count)
+        if index < self.MAX_SAMPLES:
+            self._samples[index] = execution_time
+
+    def _build_summary(self) -> AggregateSummary:
+        samples = sorted(self._samples)
+        return AggregateSummary(
+            function_name=self._function_name,
+            window_start=self._window_start,
+            window_end=datetime.now(),
+            count=self._count,
+            failures=self._failures,
+            p50=_percentile(samples, 0.5),
+            p95=_percentile(samples, 0.95),
+            max_time=self._max_time,
+            error_types=tuple(self._error_types),
+        )
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """最近秩法计算百分位"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
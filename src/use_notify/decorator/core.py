@@ -3,10 +3,12 @@
 核心装饰器实现
 """
 
+import atexit
 import functools
 import inspect
 import logging
 import threading
+import weakref
 from contextvars import ContextVar
 from datetime import datetime
 from typing import Callable, Optional, Sequence, Type
@@ -14,6 +16,8 @@ from typing import Callable, Optional, Sequence, Type
 from use_notify._validation import is_int_like, is_number_like
 
 from ..notification import Notify
+from ..priority import BULK, CRITICAL
+from .aggregator import AggregateSummary, ExecutionAggregator
 from .context import ExecutionContext
 from .exceptions import NotifyConfigError
 from .formatter import MessageFormatter
@@ -31,6 +35,11 @@ RetriableExceptionsInput = Optional[Sequence[Type[BaseException]]]
 # 线程锁，用于保护类级别共享状态
 _decorators_lock = threading.Lock()
 
+# 聚合模式的装饰器，进程退出前统一发送最后一个窗口的汇总；
+# 弱引用不会让装饰器及其通知实例常驻内存
+_aggregating_decorators: "weakref.WeakSet[NotifyDecorator]" = weakref.WeakSet()
+_atexit_registered = False
+
 
 def set_default_notify_instance(notify_instance: Notify) -> None:
     """设置当前执行上下文的默认通知实例
@@ -91,6 +100,7 @@ class NotifyDecorator:
         retry_delay: Optional[float] = None,
         retry_backoff: Optional[float] = None,
         retriable_exceptions: RetriableExceptionsInput = None,
+        aggregate_window: Optional[float] = None,
     ):
         # 验证配置
         self._validate_config(
@@ -107,6 +117,7 @@ class NotifyDecorator:
             retry_delay,
             retry_backoff,
             retriable_exceptions,
+            aggregate_window,
         )
 
         self.notify_instance = notify_instance
@@ -118,6 +129,7 @@ class NotifyDecorator:
         self.retry_delay = retry_delay
         self.retry_backoff = retry_backoff
         self.retriable_exceptions = retriable_exceptions
+        self.aggregate_window = aggregate_window
         # 使用装饰器实例的唯一ID作为标识
         self._instance_id = id(self)
 
@@ -129,13 +141,29 @@ class NotifyDecorator:
             include_result=include_result,
         )
 
+        # 聚合模式：按窗口汇总执行统计，每个窗口只发送一条通知
+        self._aggregator: Optional[ExecutionAggregator] = None
+        if aggregate_window is not None:
+            self._aggregator = ExecutionAggregator(
+                window=aggregate_window, on_flush=self._send_summary_notification
+            )
+            _register_for_exit_flush(self)
+
     def __call__(self, func: Callable) -> Callable:
         """装饰器调用"""
+        if inspect.isasyncgenfunction(func):
+            return self._wrap_async_generator_function(func)
+        if inspect.isgeneratorfunction(func):
+            return self._wrap_generator_function(func)
         if inspect.iscoroutinefunction(func):
             return self._wrap_async_function(func)
         else:
             return self._wrap_sync_function(func)
 
+    def block(self, name: str) -> "NotifyBlock":
+        """创建使用当前装饰器配置的代码块通知上下文管理器"""
+        return NotifyBlock(name=name, decorator=self)
+
     def _wrap_sync_function(self, func: Callable) -> Callable:
         """包装同步函数"""
 
@@ -157,8 +185,7 @@ class NotifyDecorator:
                 logger.debug(f"函数 {func.__name__} 执行成功，耗时 {context.execution_time:.2f}秒")
 
                 # 发送成功通知
-                if self.notify_on_success:
-                    self._send_success_notification(context)
+                self._handle_success(context)
 
                 return result
 
@@ -168,8 +195,7 @@ class NotifyDecorator:
                 logger.debug(f"函数 {func.__name__} 执行失败，耗时 {context.execution_time:.2f}秒")
 
                 # 发送失败通知
-                if self.notify_on_error:
-                    self._send_error_notification(context)
+                self._handle_error(context)
 
                 # 重新抛出异常
                 raise
@@ -199,8 +225,7 @@ class NotifyDecorator:
                 )
 
                 # 发送成功通知
-                if self.notify_on_success:
-                    await self._send_success_notification_async(context)
+                await self._handle_success_async(context)
 
                 return result
 
@@ -212,21 +237,159 @@ class NotifyDecorator:
                 )
 
                 # 发送失败通知
-                if self.notify_on_error:
-                    await self._send_error_notification_async(context)
+                await self._handle_error_async(context)
 
                 # 重新抛出异常
                 raise
 
         return async_wrapper
 
+    def _wrap_generator_function(self, func: Callable) -> Callable:
+        """包装生成器函数，计时和通知覆盖完整的迭代过程"""
+
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            context = ExecutionContext(
+                function_name=func.__name__, start_time=datetime.now(), args=args, kwargs=kwargs
+            )
+
+            logger.debug(f"开始执行生成器函数: {func.__name__}")
+
+            try:
+                result = yield from func(*args, **kwargs)
+            except GeneratorExit:
+                # 调用方提前关闭（break、消费方出错或被回收）时迭代并未完成，
+                # 不能算作成功，也没有可报告的异常，因此不发送通知
+                logger.debug(f"生成器 {func.__name__} 被提前关闭，未完成迭代，不发送通知")
+                raise
+            except Exception as e:
+                context.mark_error(e)
+                logger.debug(
+                    f"生成器 {func.__name__} 执行失败，耗时 {context.execution_time:.2f}秒"
+                )
+                self._handle_error(context)
+                raise
+
+            context.mark_success(result)
+            logger.debug(f"生成器 {func.__name__} 执行完成，耗时 {context.execution_time:.2f}秒")
+            self._handle_success(context)
+            return result
+
+        return generator_wrapper
+
+    def _wrap_async_generator_function(self, func: Callable) -> Callable:
+        """包装异步生成器函数，计时和通知覆盖完整的迭代过程"""
+
+        @functools.wraps(func)
+        async def async_generator_wrapper(*args, **kwargs):
+            context = ExecutionContext(
+                function_name=func.__name__, start_time=datetime.now(), args=args, kwargs=kwargs
+            )
+
+            logger.debug(f"开始执行异步生成器函数: {func.__name__}")
+
+            agen = func(*args, **kwargs)
+            try:
+                # 异步生成器没有 yield from，手动转发 asend/athrow
+                sent = None
+                thrown = None
+                while True:
+                    try:
+                        if thrown is not None:
+                            item = await agen.athrow(thrown)
+                        else:
+                            item = await agen.asend(sent)
+                    except StopAsyncIteration:
+                        break
+                    thrown = None
+                    sent = None
+                    try:
+                        sent = yield item
+                    except GeneratorExit:
+                        raise
+                    except BaseException as exc:
+                        thrown = exc
+            except GeneratorExit:
+                # 与同步生成器相同：提前关闭不算成功，不发送通知
+                await agen.aclose()
+                logger.debug(f"异步生成器 {func.__name__} 被提前关闭，未完成迭代，不发送通知")
+                raise
+            except Exception as e:
+                context.mark_error(e)
+                logger.debug(
+                    f"异步生成器 {func.__name__} 执行失败，耗时 {context.execution_time:.2f}秒"
+                )
+                await self._handle_error_async(context)
+                raise
+
+            context.mark_success(None)
+            logger.debug(
+                f"异步生成器 {func.__name__} 执行完成，耗时 {context.execution_time:.2f}秒"
+            )
+            await self._handle_success_async(context)
+
+        return async_generator_wrapper
+
+    def flush(self) -> Optional[AggregateSummary]:
+        """立即发送当前聚合窗口的汇总通知（仅聚合模式有效）"""
+        if self._aggregator is None:
+            return None
+        return self._aggregator.flush()
+
+    def _handle_success(self, context: ExecutionContext) -> None:
+        if self._aggregator is not None:
+            self._aggregator.record(context, self._resolve_notify_instance)
+        elif self.notify_on_success:
+            self._send_success_notification(context)
+
+    def _handle_error(self, context: ExecutionContext) -> None:
+        if self._aggregator is not None:
+            self._aggregator.record(context, self._resolve_notify_instance)
+        elif self.notify_on_error:
+            self._send_error_notification(context)
+
+    async def _handle_success_async(self, context: ExecutionContext) -> None:
+        if self._aggregator is not None:
+            self._aggregator.record(context, self._resolve_notify_instance)
+        elif self.notify_on_success:
+            await self._send_success_notification_async(context)
+
+    async def _handle_error_async(self, context: ExecutionContext) -> None:
+        if self._aggregator is not None:
+            self._aggregator.record(context, self._resolve_notify_instance)
+        elif self.notify_on_error:
+            await self._send_error_notification_async(context)
+
+    def _send_summary_notification(
+        self, summary: AggregateSummary, notify_instance: Notify, inline: bool = False
+    ):
+        """发送聚合汇总通知（同步，在计时器线程或 flush 调用方执行）
+
+        ``inline`` 为 True 时忽略 timeout，直接在当前线程发送（用于进程退出时）。
+        """
+        if summary.failures == 0 and not self.notify_on_success:
+            return
+        if summary.successes == 0 and not self.notify_on_error:
+            return
+        try:
+            message = self.formatter.format_summary_message(summary)
+            title = self.title or message["title"]
+            # notify_instance 由 _resolve_notify_instance 解析，已应用重试覆盖
+            sender = NotificationSender(
+                notify_instance=notify_instance, timeout=None if inline else self.timeout
+            )
+            priority = CRITICAL if summary.failures else BULK
+            sender.send_notification(title, message["content"], priority)
+        except Exception as e:
+            logger.warning(f"发送聚合通知失败: {e}")
+
     def _send_success_notification(self, context: ExecutionContext) -> None:
         """发送成功通知（同步）"""
         try:
             message = self.formatter.format_success_message(context)
             title = self.title or message["title"]
             sender = self._build_sender()
-            sender.send_notification(title, message["content"])
+            sender.send_notification(title, message["content"], BULK)
         except Exception as e:
             logger.warning(f"发送成功通知失败: {e}")
 
@@ -236,7 +399,7 @@ class NotifyDecorator:
             message = self.formatter.format_success_message(context)
             title = self.title or message["title"]
             sender = self._build_sender()
-            await sender.send_notification_async(title, message["content"])
+            await sender.send_notification_async(title, message["content"], BULK)
         except Exception as e:
             logger.warning(f"发送成功通知失败: {e}")
 
@@ -246,7 +409,7 @@ class NotifyDecorator:
             message = self.formatter.format_error_message(context)
             title = self.title or message["title"]
             sender = self._build_sender()
-            sender.send_notification(title, message["content"])
+            sender.send_notification(title, message["content"], CRITICAL)
         except Exception as e:
             logger.warning(f"发送错误通知失败: {e}")
 
@@ -256,10 +419,17 @@ class NotifyDecorator:
             message = self.formatter.format_error_message(context)
             title = self.title or message["title"]
             sender = self._build_sender()
-            await sender.send_notification_async(title, message["content"])
+            await sender.send_notification_async(title, message["content"], CRITICAL)
         except Exception as e:
             logger.warning(f"发送错误通知失败: {e}")
 
+    def _flush_at_exit(self) -> None:
+        # 解释器退出时无法可靠地启动 dispatcher 线程，汇总直接在当前线程发送
+        if self._aggregator is not None:
+            self._aggregator.flush(
+                on_flush=functools.partial(self._send_summary_notification, inline=True)
+            )
+
     def _build_sender(self) -> NotificationSender:
         notify_instance = self._resolve_notify_instance()
         return NotificationSender(notify_instance=notify_instance, timeout=self.timeout)
@@ -306,6 +476,7 @@ class NotifyDecorator:
             retry_delay,
             retry_backoff,
             retriable_exceptions,
+            aggregate_window,
         ) = args
 
         if notify_instance is not None and not isinstance(notify_instance, Notify):
@@ -356,6 +527,11 @@ class NotifyDecorator:
             if invalid_types:
                 raise NotifyConfigError("retriable_exceptions 必须只包含异常类型")
 
+        if aggregate_window is not None and (
+            not is_number_like(aggregate_window) or aggregate_window <= 0
+        ):
+            raise NotifyConfigError("aggregate_window 必须是正数")
+
         if not notify_on_success and not notify_on_error:
             raise NotifyConfigError("notify_on_success 和 notify_on_error 不能同时为 False")
 
@@ -376,7 +552,7 @@ class NotifyDecorator:
             return notify_instance
 
         retry_config = notify_instance.retry_config
-        return Notify(
+        overridden = Notify(
             channels=list(notify_instance.channels),
             max_retries=retry_config.max_retries if max_retries is None else max_retries,
             retry_delay=retry_config.retry_delay if retry_delay is None else retry_delay,
@@ -386,7 +562,74 @@ class NotifyDecorator:
                 if retriable_exceptions is None
                 else tuple(retriable_exceptions)
             ),
+            dispatcher=notify_instance.dispatcher,
+            loop_bridge=notify_instance.loop_bridge,
+            metrics=notify_instance.metrics,
+            tracer=notify_instance.tracer,
+            rate_limiter=notify_instance.rate_limiter,
+            concurrency=notify_instance.concurrency,
         )
+        # 共享计数器，装饰器发送也计入原实例的 stats()
+        overridden._counters = notify_instance._counters
+        return overridden
+
+
+def _register_for_exit_flush(decorator: NotifyDecorator) -> None:
+    global _atexit_registered
+    with _decorators_lock:
+        _aggregating_decorators.add(decorator)
+        if not _atexit_registered:
+            atexit.register(_flush_aggregating_decorators)
+            _atexit_registered = True
+
+
+def _flush_aggregating_decorators() -> None:
+    """进程退出前发送所有仍存活的聚合装饰器的最后一个窗口"""
+    for decorator in list(_aggregating_decorators):
+        decorator._flush_at_exit()
+
+
+class NotifyBlock:
+    """代码块通知上下文管理器，支持 ``with`` 和 ``async with``
+
+    进入时返回 ExecutionContext，可在代码块内设置 ``context.result``，
+    退出时按代码块是否抛出异常发送成功或失败通知，异常会原样抛出。
+    """
+
+    def __init__(self, name: str, decorator: NotifyDecorator):
+        if not isinstance(name, str) or not name:
+            raise NotifyConfigError("name 必须是非空字符串")
+        self.name = name
+        self.decorator = decorator
+        self.context: Optional[ExecutionContext] = None
+
+    def __enter__(self) -> ExecutionContext:
+        self.context = ExecutionContext(function_name=self.name, start_time=datetime.now())
+        logger.debug(f"开始执行代码块: {self.name}")
+        return self.context
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        context = self.context
+        if exc_type is None:
+            context.mark_success(context.result)
+            self.decorator._handle_success(context)
+        elif issubclass(exc_type, Exception):
+            context.mark_error(exc_value)
+            self.decorator._handle_error(context)
+        return False
+
+    async def __aenter__(self) -> ExecutionContext:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        context = self.context
+        if exc_type is None:
+            context.mark_success(context.result)
+            await self.decorator._handle_success_async(context)
+        elif issubclass(exc_type, Exception):
+            context.mark_error(exc_value)
+            await self.decorator._handle_error_async(context)
+        return False
 
 
 def notify(
@@ -403,6 +646,7 @@ def notify(
     retry_delay: Optional[float] = None,
     retry_backoff: Optional[float] = None,
     retriable_exceptions: RetriableExceptionsInput = None,
+    aggregate_window: Optional[float] = None,
 ) -> Callable:
     """
     创建通知装饰器的工厂函数
@@ -421,6 +665,8 @@ def notify(
         retry_delay: 每次重试前的延迟（秒）
         retry_backoff: 重试延迟的退避倍数
         retriable_exceptions: 额外视为可重试的异常类型序列
+        aggregate_window: 聚合窗口（秒），设置后不再逐次通知，
+            而是每个窗口发送一条包含次数、失败数、耗时分位和错误类型的汇总
 
     Returns:
         装饰器函数
@@ -437,6 +683,10 @@ def notify(
         )
         def important_task():
             return "任务完成"
+
+        @notify(aggregate_window=60)
+        def high_frequency_task():
+            return "ok"
     """
     return NotifyDecorator(
         notify_instance=notify_instance,
@@ -452,4 +702,26 @@ def notify(
         retry_delay=retry_delay,
         retry_backoff=retry_backoff,
         retriable_exceptions=retriable_exceptions,
+        aggregate_window=aggregate_window,
     )
+
+
+def notify_block(name: str, **kwargs) -> NotifyBlock:
+    """
+    创建代码块通知上下文管理器，参数与 ``notify`` 相同
+
+    Args:
+        name: 代码块名称，作为通知中的 function_name
+        **kwargs: 传给 ``notify`` 的配置
+
+    Returns:
+        NotifyBlock 上下文管理器
+
+    Example:
+        with notify_block("导出报表", title="ETL"):
+            export_report()
+
+        async with notify_block("同步数据") as context:
+            context.result = await sync_rows()
+    """
+    return notify(**kwargs).block(name)
@@ -7,6 +7,7 @@ import json
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from .aggregator import AggregateSummary
 from .context import ExecutionContext
 
 
@@ -21,6 +22,12 @@ class MessageFormatter:
         "⏱️ 执行时间: {execution_time:.2f}秒\n"
         "🚨 错误信息: {error_message}"
     )
+    DEFAULT_SUMMARY_TEMPLATE = (
+        "📊 函数 {function_name} 执行汇总\n"
+        "🔢 执行次数: {count}（成功 {successes}，失败 {failures}）\n"
+        "⏱️ 执行时间: p50 {p50:.2f}秒 / p95 {p95:.2f}秒 / max {max_time:.2f}秒\n"
+        "🕒 统计区间: {window_start} ~ {window_end}"
+    )
 
     def __init__(
         self,
@@ -52,6 +59,25 @@ class MessageFormatter:
 
         return {"title": f"❌ {context.function_name} 执行失败", "content": content}
 
+    def format_summary_message(self, summary: AggregateSummary) -> Dict[str, str]:
+        """格式化聚合汇总消息"""
+        content = self.DEFAULT_SUMMARY_TEMPLATE.format(
+            function_name=summary.function_name,
+            count=summary.count,
+            successes=summary.successes,
+            failures=summary.failures,
+            p50=summary.p50,
+            p95=summary.p95,
+            max_time=summary.max_time,
+            window_start=summary.window_start.strftime("%Y-%m-%d %H:%M:%S"),
+            window_end=summary.window_end.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        if summary.error_types:
+            content += f"\n🚨 错误类型: {', '.join(summary.error_types)}"
+
+        status = "❌" if summary.failures else "✅"
+        return {"title": f"{status} {summary.function_name} 执行汇总", "content": content}
+
     def _get_format_variables(self, context: ExecutionContext) -> Dict[str, Any]:
         """获取格式化变量"""
         current_time = datetime.now()
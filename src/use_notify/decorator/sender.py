@@ -5,12 +5,12 @@
 
 import asyncio
 import logging
-import threading
-from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Optional
 
+from ..dispatch import get_default_dispatcher
 from ..notification import Notify
+from ..priority import NORMAL
 
 logger = logging.getLogger(__name__)
 
@@ -18,26 +18,22 @@ logger = logging.getLogger(__name__)
 class NotificationSender:
     """通知发送器"""
 
-    SYNC_TIMEOUT_WORKERS = 4
-    _sync_timeout_executor = ThreadPoolExecutor(
-        max_workers=SYNC_TIMEOUT_WORKERS,
-        thread_name_prefix="use-notify-sync-timeout",
-    )
-    _sync_timeout_slots = threading.BoundedSemaphore(SYNC_TIMEOUT_WORKERS)
+    # 未注入 dispatcher 时，共享的默认 dispatcher 的 worker 数
+    SYNC_TIMEOUT_WORKERS = get_default_dispatcher().max_workers
 
     def __init__(self, notify_instance: Notify, timeout: Optional[float] = None):
         self.notify_instance = notify_instance
         self.timeout = timeout
 
-    def send_notification(self, title: str, content: str) -> None:
+    def send_notification(self, title: str, content: str, priority: str = NORMAL) -> None:
         """发送同步通知"""
         try:
             if self.timeout:
-                # Python cannot stop a running sync send safely. Keep timed-out
-                # work bounded so callers return quickly without unbounded threads.
-                self._send_sync_with_timeout(title, content)
+                # Python cannot stop a running sync send safely. Run it on the
+                # Notify instance's bounded dispatcher so callers return quickly.
+                self._send_sync_with_timeout(title, content, priority)
             else:
-                self.notify_instance.publish(title=title, content=content)
+                self.notify_instance.publish(title=title, content=content, priority=priority)
 
             logger.info(f"通知发送成功: {title}")
 
@@ -48,49 +44,32 @@ class NotificationSender:
         except Exception as error:
             self._handle_send_error(error)
 
-    async def send_notification_async(self, title: str, content: str) -> None:
+    async def send_notification_async(
+        self, title: str, content: str, priority: str = NORMAL
+    ) -> None:
         """发送异步通知"""
         try:
             if self.timeout:
                 await asyncio.wait_for(
-                    self._send_async_internal(title, content), timeout=self.timeout
+                    self._send_async_internal(title, content, priority), timeout=self.timeout
                 )
             else:
-                await self._send_async_internal(title, content)
+                await self._send_async_internal(title, content, priority)
 
             logger.info(f"异步通知发送成功: {title}")
 
         except Exception as error:
             self._handle_send_error(error)
 
-    async def _send_async_internal(self, title: str, content: str) -> None:
+    async def _send_async_internal(self, title: str, content: str, priority: str) -> None:
         """内部异步发送方法"""
-        await self.notify_instance.publish_async(title=title, content=content)
+        await self.notify_instance.publish_async(title=title, content=content, priority=priority)
 
-    def _send_sync_with_timeout(self, title: str, content: str) -> None:
-        if not self._sync_timeout_slots.acquire(blocking=False):
-            raise asyncio.TimeoutError(
-                f"同步通知后台 worker 已满（最多 {self.SYNC_TIMEOUT_WORKERS} 个）"
-            )
-
-        try:
-            future = self._sync_timeout_executor.submit(
-                self.notify_instance.publish, title=title, content=content
-            )
-        except Exception:
-            self._sync_timeout_slots.release()
-            raise
-
-        future.add_done_callback(self._release_sync_timeout_slot)
-        try:
-            future.result(timeout=self.timeout)
-        except FutureTimeoutError:
-            future.cancel()
-            raise
-
-    @classmethod
-    def _release_sync_timeout_slot(cls, _future) -> None:
-        cls._sync_timeout_slots.release()
+    def _send_sync_with_timeout(self, title: str, content: str, priority: str) -> None:
+        # 满载时按 dispatcher 的拒绝策略处理（拒绝、等待或在当前线程执行）；
+        # 超时后不取消排队中的发送，保持尽力送达
+        future = self.notify_instance.submit(title=title, content=content, priority=priority)
+        future.result(timeout=self.timeout)
 
     def _handle_send_error(self, error: Exception) -> None:
         """处理发送错误"""
@@ -0,0 +1,225 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+
+from use_notify._validation import is_int_like, is_number_like
+from use_notify.priority import BULK, CRITICAL, NORMAL, priority_rank
+
+REJECT = "reject"
+WAIT = "wait"
+INLINE = "inline"
+REJECTION_POLICIES = (REJECT, WAIT, INLINE)
+
+
+class DispatcherRejectedError(RuntimeError):
+    """Raised when the dispatcher is saturated and refuses new work."""
+
+
+@dataclass(frozen=True)
+class DispatcherStats:
+    """Point-in-time view of dispatcher load."""
+
+    max_workers: int
+    queue_size: int
+    active: int
+    queued: int
+    rejected: int
+    completed: int
+    shed: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_size
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of worker and queue capacity in use.
+
+        Exceeds 1.0 while critical work occupies reserved slots.
+        """
+        return (self.active + self.queued) / self.capacity
+
+
+class NotificationDispatcher:
+    """Bounded background executor for sync notification delivery.
+
+    Work runs on up to ``max_workers`` daemon threads. Up to ``queue_size``
+    more submissions wait for a free worker. When both are full the
+    ``rejection_policy`` decides what happens:
+
+    - ``"reject"`` raises :class:`DispatcherRejectedError` immediately.
+    - ``"wait"`` blocks the caller until capacity frees up, for at most
+      ``wait_timeout`` seconds (forever when ``None``), then rejects.
+    - ``"inline"`` runs the work in the calling thread.
+
+    Queued work runs in priority order (critical, normal, bulk), FIFO within
+    a priority. Critical work may also use ``reserved_slots`` extra queue
+    slots. Bulk work is shed (rejected without waiting or running inline)
+    once saturation reaches ``shed_bulk_at``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        queue_size: int = 0,
+        rejection_policy: str = REJECT,
+        wait_timeout: Optional[float] = None,
+        thread_name_prefix: str = "use-notify-dispatch",
+        reserved_slots: int = 0,
+        shed_bulk_at: float = 1.0,
+    ):
+        if not is_int_like(max_workers) or max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if not is_int_like(queue_size) or queue_size < 0:
+            raise ValueError("queue_size must be >= 0")
+        if rejection_policy not in REJECTION_POLICIES:
+            raise ValueError(f"rejection_policy must be one of {', '.join(REJECTION_POLICIES)}")
+        if wait_timeout is not None and (not is_number_like(wait_timeout) or wait_timeout < 0):
+            raise ValueError("wait_timeout must be >= 0")
+        if not is_int_like(reserved_slots) or reserved_slots < 0:
+            raise ValueError("reserved_slots must be >= 0")
+        if not is_number_like(shed_bulk_at) or not 0 < shed_bulk_at <= 1:
+            raise ValueError("shed_bulk_at must be > 0 and <= 1")
+
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.rejection_policy = rejection_policy
+        self.wait_timeout = wait_timeout
+        self.thread_name_prefix = thread_name_prefix
+        self.reserved_slots = reserved_slots
+        self.shed_bulk_at = shed_bulk_at
+
+        self._condition = threading.Condition()
+        self._work_queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads = []
+        self._idle_workers = 0
+        self._pending = 0
+        self._active = 0
+        self._rejected = 0
+        self._completed = 0
+        self._shed = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` at normal priority and return a Future."""
+        return self.submit_with_priority(NORMAL, fn, *args, **kwargs)
+
+    def submit_with_priority(self, priority: str, fn, /, *args, **kwargs) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` at ``priority`` and return a Future."""
+        rank = priority_rank(priority)
+        future = Future()
+        with self._condition:
+            if priority == BULK and self._should_shed_bulk():
+                self._shed += 1
+                self._rejected += 1
+                raise DispatcherRejectedError(
+                    f"Notification dispatcher shed bulk work at {self._saturation():.0%} saturation"
+                )
+
+            has_capacity = partial(self._has_capacity, priority)
+            if not has_capacity() and self.rejection_policy == WAIT:
+                self._condition.wait_for(has_capacity, timeout=self.wait_timeout)
+            run_inline = not has_capacity() and self.rejection_policy == INLINE
+            if not run_inline:
+                if not has_capacity():
+                    self._rejected += 1
+                    raise DispatcherRejectedError(
+                        f"Notification dispatcher is saturated ({self.max_workers} workers, "
+                        f"{self.queue_size} queue slots)"
+                    )
+                self._pending += 1
+                self._work_queue.put((rank, next(self._sequence), future, fn, args, kwargs))
+                self._ensure_worker()
+                return future
+
+        # Caller-runs policy: the submitting thread does the work itself.
+        future.set_running_or_notify_cancel()
+        self._run(future, fn, args, kwargs)
+        return future
+
+    def stats(self) -> DispatcherStats:
+        with self._condition:
+            return DispatcherStats(
+                max_workers=self.max_workers,
+                queue_size=self.queue_size,
+                active=self._active,
+                queued=self._pending - self._active,
+                rejected=self._rejected,
+                completed=self._completed,
+                shed=self._shed,
+            )
+
+    @property
+    def saturation(self) -> float:
+        return self.stats().saturation
+
+    def _has_capacity(self, priority: str = NORMAL) -> bool:
+        capacity = self.max_workers + self.queue_size
+        if priority == CRITICAL:
+            capacity += self.reserved_slots
+        return self._pending < capacity
+
+    def _saturation(self) -> float:
+        return self._pending / (self.max_workers + self.queue_size)
+
+    def _should_shed_bulk(self) -> bool:
+        return self._saturation() >= self.shed_bulk_at
+
+    def _ensure_worker(self):
+        if self._idle_workers >= self._pending or len(self._threads) >= self.max_workers:
+            return
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self.thread_name_prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                self._idle_workers += 1
+            _, _, future, fn, args, kwargs = self._work_queue.get()
+            with self._condition:
+                self._idle_workers -= 1
+                self._active += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    self._run(future, fn, args, kwargs)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self._pending -= 1
+                    self._completed += 1
+                    # Waiters need different capacity per priority; wake them all.
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _run(future: Future, fn, args, kwargs):
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+_default_dispatcher: Optional[NotificationDispatcher] = None
+_default_dispatcher_lock = threading.Lock()
+
+
+def get_default_dispatcher() -> NotificationDispatcher:
+    """Return the process-wide dispatcher used when none is injected."""
+    global _default_dispatcher
+    if _default_dispatcher is None:
+        with _default_dispatcher_lock:
+            if _default_dispatcher is None:
+                _default_dispatcher = NotificationDispatcher(
+                    thread_name_prefix="use-notify-sync-timeout"
+                )
+    return _default_dispatcher
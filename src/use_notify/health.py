@@ -0,0 +1,116 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from use_notify.redaction import redact_text
+
+# Weight of the newest sample in the latency moving average.
+EWMA_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class ChannelHealth:
+    """Point-in-time view of one channel's delivery history."""
+
+    sends: int
+    failures: int
+    retries: int
+    in_flight: int
+    ewma_latency: Optional[float]
+    last_error: Optional[str]
+    last_error_at: Optional[float]
+    # Current adaptive concurrency limit, when the publisher uses one.
+    concurrency_limit: Optional[float] = None
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of finished attempts that failed."""
+        finished = self.sends - self.in_flight
+        return self.failures / finished if finished else 0.0
+
+
+@dataclass(frozen=True)
+class PublisherStats:
+    """Per-channel health plus the publisher's shared rate limiter state.
+
+    ``channels`` is keyed by channel class name; repeated classes get a
+    ``#2``, ``#3``... suffix in channel order.
+    """
+
+    channels: Dict[str, ChannelHealth]
+    rate_limiter_tokens: Optional[float] = None
+
+
+class ChannelCounters:
+    """Counters for one channel, updated on every send attempt.
+
+    Each channel has its own lock, so concurrent publishes only contend when
+    they hit the same channel. The last error is stored as-is and only
+    redacted when a snapshot is taken.
+    """
+
+    __slots__ = (
+        "_lock",
+        "sends",
+        "failures",
+        "retries",
+        "in_flight",
+        "ewma_latency",
+        "last_error",
+        "last_error_at",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sends = 0
+        self.failures = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.ewma_latency: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self.last_error_at: Optional[float] = None
+
+    def attempt_started(self):
+        with self._lock:
+            self.sends += 1
+            self.in_flight += 1
+
+    def attempt_finished(self, elapsed: float, error: Optional[Exception] = None):
+        with self._lock:
+            self.in_flight -= 1
+            latency = self.ewma_latency
+            self.ewma_latency = (
+                elapsed if latency is None else latency + EWMA_ALPHA * (elapsed - latency)
+            )
+            if error is not None:
+                self.failures += 1
+                self.last_error = error
+                self.last_error_at = time.time()
+
+    def attempt_cancelled(self):
+        # Cancelled or interrupted: neither a latency sample nor a failure.
+        with self._lock:
+            self.in_flight -= 1
+
+    def retry_scheduled(self):
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self, concurrency_limit: Optional[float] = None) -> ChannelHealth:
+        with self._lock:
+            error = self.last_error
+            health = ChannelHealth(
+                sends=self.sends,
+                failures=self.failures,
+                retries=self.retries,
+                in_flight=self.in_flight,
+                ewma_latency=self.ewma_latency,
+                last_error=None,
+                last_error_at=self.last_error_at,
+                concurrency_limit=concurrency_limit,
+            )
+        if error is None:
+            return health
+        message = redact_text(f"{error.__class__.__name__}: {error}")
+        return ChannelHealth(**{**health.__dict__, "last_error": message})
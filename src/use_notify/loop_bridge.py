@@ -0,0 +1,112 @@
+import asyncio
+import atexit
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+
+class EventLoopBridge:
+    """A persistent event loop on a background thread for sync callers.
+
+    Running coroutines here avoids creating and tearing down an event loop
+    per call (as ``asyncio.run`` does) and gives sync code ``gather`` fan-out
+    across channels. Channels with ``reuse_connections`` keep their async
+    client on this loop between calls.
+    """
+
+    def __init__(self, thread_name: str = "use-notify-loop"):
+        self.thread_name = thread_name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the bridge loop, starting its thread on first use."""
+        loop = self._loop
+        if loop is None:
+            with self._lock:
+                if self._loop is None:
+                    self._start()
+                loop = self._loop
+        return loop
+
+    def in_loop_thread(self) -> bool:
+        """Return True when called from the bridge loop's own thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run ``coro`` on the bridge loop and block until it finishes."""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("EventLoopBridge.run cannot block inside its own loop thread")
+
+        # Submitting under the lock means close() either sees this work and
+        # cancels it, or runs first and this call starts a fresh loop.
+        with self._lock:
+            if self._loop is None:
+                self._start()
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def close(self):
+        """Cancel pending work and stop the loop thread.
+
+        Pending ``run()`` calls raise ``CancelledError``. The bridge restarts
+        on next use.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run_loop, name=self.thread_name, daemon=True)
+        thread.start()
+        started.wait()
+        self._thread = thread
+        self._loop = loop
+
+
+async def _cancel_pending_tasks():
+    # Same shutdown as asyncio.run: cancel the remaining tasks and let them
+    # finish their cleanup before the loop closes.
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
+
+_default_bridge: Optional[EventLoopBridge] = None
+_default_bridge_lock = threading.Lock()
+
+
+def get_default_loop_bridge() -> EventLoopBridge:
+    """Return the process-wide event loop bridge."""
+    global _default_bridge
+    if _default_bridge is None:
+        with _default_bridge_lock:
+            if _default_bridge is None:
+                _default_bridge = EventLoopBridge()
+                atexit.register(_default_bridge.close)
+    return _default_bridge
@@ -0,0 +1,296 @@
+import bisect
+import threading
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence, Tuple
+
+SUCCESS = "success"
+FAILURE = "failure"
+# The attempt was cancelled or interrupted (CancelledError, KeyboardInterrupt).
+CANCELLED = "cancelled"
+
+# Seconds; covers fast local sends through slow provider timeouts.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_current_sink = ContextVar("use_notify_metrics_sink", default=None)
+
+
+class MetricsSink:
+    """Receives delivery events from ``Publisher`` and ``HttpChannel``.
+
+    Every hook is a no-op here; subclasses override the ones they need.
+    Hooks run inline on the sending thread or event loop, so they should be
+    cheap and must not raise.
+    """
+
+    def send_started(self, channel: str, attempt: int) -> None:
+        """A send attempt to ``channel`` is starting (attempts count from 1)."""
+
+    def send_finished(
+        self,
+        channel: str,
+        attempt: int,
+        elapsed: float,
+        outcome: str,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """A send attempt finished with ``outcome`` ``"success"``, ``"failure"`` or
+        ``"cancelled"``.
+
+        Every ``send_started`` is matched by exactly one ``send_finished``.
+        """
+
+    def retry_scheduled(self, channel: str, attempt: int, delay: float, error: BaseException):
+        """Attempt ``attempt`` failed and the next one starts after ``delay`` seconds."""
+
+    def http_request_finished(
+        self, channel: str, status_code: int, bytes_sent: int, elapsed: float
+    ) -> None:
+        """An HTTP channel received a response, before business validation."""
+
+
+def current_metrics_sink() -> Optional[MetricsSink]:
+    """Return the sink of the publish call running in this context, if any."""
+    return _current_sink.get()
+
+
+class Histogram:
+    """Fixed-bucket histogram. ``counts[i]`` is per bucket, not cumulative."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations.
+
+        Observations above the last bucket report the largest value seen.
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(1, fraction * self.count)
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class _ChannelMetrics:
+    __slots__ = (
+        "latency",
+        "attempts",
+        "successes",
+        "failures",
+        "cancelled",
+        "retries",
+        "bytes_sent",
+        "status",
+    )
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.status: Dict[int, int] = {}
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "status_codes": dict(self.status),
+            "latency": self.latency.snapshot(),
+        }
+
+
+class InMemoryMetrics(MetricsSink):
+    """Per-channel counters and attempt latency histograms kept in process.
+
+    Example:
+        metrics = InMemoryMetrics()
+        notify = useNotify([...], metrics=metrics)
+        notify.publish(title="t", content="c")
+        metrics.snapshot()["Ding"]["latency"]["p95"]
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._channels: Dict[str, _ChannelMetrics] = {}
+
+    def send_started(self, channel, attempt):
+        with self._lock:
+            self._channel(channel).attempts += 1
+
+    def send_finished(self, channel, attempt, elapsed, outcome, status_code=None, error=None):
+        with self._lock:
+            metrics = self._channel(channel)
+            if outcome == CANCELLED:
+                # A cut-short attempt is not a latency sample.
+                metrics.cancelled += 1
+                return
+            metrics.latency.observe(elapsed)
+            if outcome == SUCCESS:
+                metrics.successes += 1
+            else:
+                metrics.failures += 1
+
+    def retry_scheduled(self, channel, attempt, delay, error):
+        with self._lock:
+            self._channel(channel).retries += 1
+
+    def http_request_finished(self, channel, status_code, bytes_sent, elapsed):
+        with self._lock:
+            metrics = self._channel(channel)
+            metrics.bytes_sent += bytes_sent
+            metrics.status[status_code] = metrics.status.get(status_code, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Return a copy of all counters keyed by channel name."""
+        with self._lock:
+            return {name: metrics.snapshot() for name, metrics in self._channels.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._channels.clear()
+
+    def _channel(self, name: str) -> _ChannelMetrics:
+        metrics = self._channels.get(name)
+        if metrics is None:
+            metrics = self._channels[name] = _ChannelMetrics(self.buckets)
+        return metrics
+
+
+class PrometheusMetrics(MetricsSink):
+    """Export delivery metrics through ``prometheus_client``.
+
+    Requires ``pip install prometheus-client``. Metrics are registered on
+    ``registry`` (the global default registry when omitted).
+    """
+
+    def __init__(
+        self,
+        registry=None,
+        namespace: str = "use_notify",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        try:
+            import prometheus_client
+        except ImportError as exc:
+            raise ImportError(
+                "PrometheusMetrics requires prometheus-client: pip install prometheus-client"
+            ) from exc
+
+        options = {"namespace": namespace}
+        if registry is not None:
+            options["registry"] = registry
+        self._latency = prometheus_client.Histogram(
+            "send_duration_seconds",
+            "Duration of notification send attempts",
+            ["channel", "outcome"],
+            buckets=tuple(buckets),
+            **options,
+        )
+        self._retries = prometheus_client.Counter(
+            "send_retries", "Notification send retries", ["channel"], **options
+        )
+        self._responses = prometheus_client.Counter(
+            "http_responses", "HTTP responses by status code", ["channel", "status_code"], **options
+        )
+        self._bytes_sent = prometheus_client.Counter(
+            "http_request_bytes", "HTTP request body bytes sent", ["channel"], **options
+        )
+
+    def send_finished(self, channel, attempt, elapsed, outcome, status_code=None, error=None):
+        self._latency.labels(channel, outcome).observe(elapsed)
+
+    def retry_scheduled(self, channel, attempt, delay, error):
+        self._retries.labels(channel).inc()
+
+    def http_request_finished(self, channel, status_code, bytes_sent, elapsed):
+        self._responses.labels(channel, str(status_code)).inc()
+        self._bytes_sent.labels(channel).inc(bytes_sent)
+
+
+class OpenTelemetryMetrics(MetricsSink):
+    """Export delivery metrics through the OpenTelemetry metrics API.
+
+    Requires ``pip install opentelemetry-api``. Uses ``meter`` or the
+    ``use_notify`` meter from the global meter provider.
+    """
+
+    def __init__(self, meter=None):
+        try:
+            from opentelemetry import metrics
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryMetrics requires opentelemetry-api: pip install opentelemetry-api"
+            ) from exc
+
+        meter = meter or metrics.get_meter("use_notify")
+        self._latency = meter.create_histogram(
+            "use_notify.send.duration", unit="s", description="Notification send attempt duration"
+        )
+        self._retries = meter.create_counter(
+            "use_notify.send.retries", description="Notification send retries"
+        )
+        self._responses = meter.create_counter(
+            "use_notify.http.responses", description="HTTP responses by status code"
+        )
+        self._bytes_sent = meter.create_counter(
+            "use_notify.http.request_bytes", unit="By", description="HTTP request body bytes sent"
+        )
+
+    def send_finished(self, channel, attempt, elapsed, outcome, status_code=None, error=None):
+        self._latency.record(elapsed, {"channel": channel, "outcome": outcome})
+
+    def retry_scheduled(self, channel, attempt, delay, error):
+        self._retries.add(1, {"channel": channel})
+
+    def http_request_finished(self, channel, status_code, bytes_sent, elapsed):
+        self._responses.add(1, {"channel": channel, "status_code": status_code})
+        self._bytes_sent.add(bytes_sent, {"channel": channel})
@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import logging
-import smtplib
+import sys
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from threading import RLock
-from typing import List, Optional, Tuple, Type, TypeVar
-
-import httpx
+from typing import Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from use_notify import channels as channels_models
 from use_notify._validation import is_int_like, is_number_like
+from use_notify.concurrency import AdaptiveConcurrency
+from use_notify.dispatch import NotificationDispatcher, get_default_dispatcher
+from use_notify.health import ChannelCounters, PublisherStats
+from use_notify.loop_bridge import EventLoopBridge
+from use_notify.metrics import CANCELLED, FAILURE, SUCCESS, MetricsSink, _current_sink
+from use_notify.priority import NORMAL, priority_rank
+from use_notify.ratelimit import RateLimitedError, RateLimiter
 from use_notify.redaction import redact_exception_message, redact_text
+from use_notify.tracing import ATTEMPT_SPAN, CHANNEL_SPAN, PUBLISH_SPAN, start_span
 
 logger = logging.getLogger(__name__)
 RetriableExceptions = Tuple[Type[BaseException], ...]
@@ -55,15 +62,142 @@ class RetryConfig:
         object.__setattr__(self, "retriable_exceptions", retriable_exceptions)
 
 
+@dataclass(frozen=True)
+class ChannelFailure:
+    """Delivery failure of one channel after its retries were exhausted."""
+
+    channel: str
+    error: Exception
+    status_code: Optional[int] = None
+    attempts: int = 1
+    elapsed: float = 0.0
+
+
 class NotificationPublishError(RuntimeError):
-    """Raised after all channels exhaust their retries."""
+    """Raised after all channels exhaust their retries.
+
+    The redacted message is only built when the error is rendered, so
+    callers that catch it and inspect ``records`` skip the formatting cost.
+    """
+
+    def __init__(self, failures: Sequence[Union[ChannelFailure, Tuple[str, Exception]]]):
+        self._set_records(failures)
+        super().__init__(self.records)
+
+    @property
+    def failures(self) -> List[Tuple[str, Exception]]:
+        """(channel name, error) pairs for each failed channel."""
+        return [(record.channel, record.error) for record in self.records]
+
+    @failures.setter
+    def failures(self, failures: Sequence[Union[ChannelFailure, Tuple[str, Exception]]]):
+        self._set_records(failures)
+        self.args = (self.records,)
+
+    def __str__(self) -> str:
+        if self._message is None:
+            failure_summary = ", ".join(
+                f"{record.channel}: {redact_text(str(record.error))}" for record in self.records
+            )
+            self._message = f"Failed to publish notification via: {failure_summary}"
+        return self._message
+
+    def __repr__(self) -> str:
+        # args hold the raw errors; show the redacted message instead.
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def _set_records(self, failures):
+        self.records: List[ChannelFailure] = [
+            (
+                failure
+                if isinstance(failure, ChannelFailure)
+                else ChannelFailure(
+                    channel=failure[0],
+                    error=failure[1],
+                    status_code=_failure_status_code(failure[1]),
+                )
+            )
+            for failure in failures
+        ]
+        self._message: Optional[str] = None
 
-    def __init__(self, failures: List[Tuple[str, Exception]]):
-        self.failures = failures
-        failure_summary = ", ".join(
-            f"{channel_name}: {redact_text(str(error))}" for channel_name, error in failures
+    def __reduce__(self):
+        return self.__class__, (self.records,)
+
+
+class _Delivery:
+    """Per-channel bookkeeping for one publish call."""
+
+    __slots__ = (
+        "channel",
+        "attempts",
+        "started_at",
+        "metrics",
+        "counters",
+        "attempt_started_at",
+    )
+
+    def __init__(
+        self,
+        channel,
+        metrics: Optional[MetricsSink] = None,
+        counters: Optional[ChannelCounters] = None,
+    ):
+        self.channel = channel
+        self.attempts = 0
+        self.started_at = time.monotonic()
+        self.metrics = metrics
+        self.counters = counters
+        self.attempt_started_at = 0.0
+
+    def begin_attempt(self, attempt: int):
+        self.attempts = attempt
+        if self.counters is not None:
+            self.counters.attempt_started()
+        if self.metrics is not None:
+            self.metrics.send_started(Publisher._channel_name(self.channel), attempt)
+        self.attempt_started_at = time.perf_counter()
+
+    def end_attempt(self, error: Optional[BaseException] = None):
+        elapsed = time.perf_counter() - self.attempt_started_at
+        if error is None:
+            outcome = SUCCESS
+        elif isinstance(error, Exception):
+            outcome = FAILURE
+        else:
+            outcome = CANCELLED
+        if self.counters is not None:
+            if outcome == CANCELLED:
+                self.counters.attempt_cancelled()
+            else:
+                self.counters.attempt_finished(elapsed, error)
+        if self.metrics is None:
+            return
+        self.metrics.send_finished(
+            Publisher._channel_name(self.channel),
+            self.attempts,
+            elapsed,
+            outcome,
+            None if error is None else _failure_status_code(error),
+            error,
+        )
+
+    def retry_scheduled(self, delay: float, error: Exception):
+        if self.counters is not None:
+            self.counters.retry_scheduled()
+        if self.metrics is not None:
+            self.metrics.retry_scheduled(
+                Publisher._channel_name(self.channel), self.attempts, delay, error
+            )
+
+    def failure(self, error: Exception) -> ChannelFailure:
+        return ChannelFailure(
+            channel=Publisher._channel_name(self.channel),
+            error=error,
+            status_code=_failure_status_code(error),
+            attempts=self.attempts,
+            elapsed=time.monotonic() - self.started_at,
         )
-        super().__init__(f"Failed to publish notification via: {failure_summary}")
 
 
 class Publisher:
@@ -76,11 +210,26 @@ class Publisher:
         retry_delay: float = 0.0,
         retry_backoff: float = 1.0,
         retriable_exceptions: RetriableExceptions = DEFAULT_RETRIABLE_EXCEPTIONS,
+        dispatcher: Optional[NotificationDispatcher] = None,
+        loop_bridge: Optional[EventLoopBridge] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
     ):
         if channels is None:
             channels = []
         self._state_lock = RLock()
         self.channels = tuple(channels)
+        # Keyed by id() so channels that define __eq__ without __hash__ work;
+        # the entry keeps the channel alive, so its id cannot be reused.
+        self._counters: Dict[int, Tuple[channels_models.BaseChannel, ChannelCounters]] = {}
+        self.dispatcher = dispatcher
+        self.loop_bridge = loop_bridge
+        self.metrics = metrics
+        self.tracer = tracer
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
         self.retry_config = RetryConfig(
             max_retries=max_retries,
             retry_delay=retry_delay,
@@ -120,95 +269,230 @@ class Publisher:
             self.retry_config = retry_config
         return self
 
-    def publish(self, *args, **kwargs):
+    def publish(self, *args, priority: str = NORMAL, **kwargs):
         """
         Publish a notification to all channels.
+
+        ``priority`` is ``"critical"``, ``"normal"`` or ``"bulk"``. With a rate
+        limiter configured, critical messages may use its reserved capacity and
+        bulk messages raise RateLimitedError instead of waiting for a token.
+
+        With a loop bridge configured, channels are sent concurrently through
+        ``publish_async`` on the bridge's persistent event loop.
         """
+        loop_bridge = self.loop_bridge
+        if loop_bridge is not None and not loop_bridge.in_loop_thread():
+            return loop_bridge.run(self.publish_async(*args, priority=priority, **kwargs))
+
+        priority_rank(priority)
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None and not rate_limiter.acquire(priority):
+            self._raise_rate_limited(priority)
+
         channels, retry_config = self._snapshot_state()
-        failures = []
-        for channel in channels:
-            try:
-                self._send_with_retry(channel, retry_config, *args, **kwargs)
-            except Exception as error:
-                failures.append((self._channel_name(channel), error))
+        metrics = self.metrics
+        sink_token = _current_sink.set(metrics) if metrics is not None else None
+        try:
+            with start_span(self.tracer, PUBLISH_SPAN, {"use_notify.channels": len(channels)}):
+                failures = []
+                for channel in channels:
+                    delivery = _Delivery(channel, metrics, self._counters_for(channel))
+                    try:
+                        self._send_with_retry(delivery, retry_config, *args, **kwargs)
+                    except Exception as error:
+                        failures.append(delivery.failure(error))
+
+                if failures:
+                    self._raise_publish_error(failures)
+        finally:
+            if sink_token is not None:
+                _current_sink.reset(sink_token)
+
+    def submit(self, *args, priority: str = NORMAL, **kwargs) -> Future:
+        """
+        Publish a notification in the background via the dispatcher.
+
+        Uses the injected dispatcher, or the shared default one. Queued work
+        runs in ``priority`` order. Returns a Future that resolves when
+        publishing finishes or raises the publish error. Raises
+        DispatcherRejectedError when the dispatcher is saturated or sheds
+        bulk work.
+        """
+        return self.get_dispatcher().submit_with_priority(
+            priority, self.publish, *args, priority=priority, **kwargs
+        )
 
-        if failures:
-            self._raise_publish_error(failures)
+    def get_dispatcher(self) -> NotificationDispatcher:
+        """Return the injected dispatcher or the shared default one."""
+        return self.dispatcher or get_default_dispatcher()
 
-    async def publish_async(self, *args, **kwargs):
+    async def publish_async(self, *args, priority: str = NORMAL, **kwargs):
         """
         Publish a notification asynchronously to all channels.
+
+        ``priority`` behaves as in :meth:`publish`.
         """
+        priority_rank(priority)
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None and not await rate_limiter.acquire_async(priority):
+            self._raise_rate_limited(priority)
+
         channels, retry_config = self._snapshot_state()
-        tasks = [
-            self._send_with_retry_async(channel, retry_config, *args, **kwargs)
-            for channel in channels
+        metrics = self.metrics
+        deliveries = [
+            _Delivery(channel, metrics, self._counters_for(channel)) for channel in channels
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        failures = []
-        for channel, result in zip(channels, results):
-            if isinstance(result, Exception):
-                failures.append((self._channel_name(channel), result))
+        # gather copies the current context into each task, so channels see the
+        # sink and the publish span.
+        sink_token = _current_sink.set(metrics) if metrics is not None else None
+        try:
+            with start_span(self.tracer, PUBLISH_SPAN, {"use_notify.channels": len(channels)}):
+                results = await asyncio.gather(
+                    *(
+                        self._send_with_retry_async(delivery, retry_config, *args, **kwargs)
+                        for delivery in deliveries
+                    ),
+                    return_exceptions=True,
+                )
+
+                failures = []
+                for delivery, result in zip(deliveries, results):
+                    if isinstance(result, Exception):
+                        failures.append(delivery.failure(result))
+
+                if failures:
+                    self._raise_publish_error(failures)
+        finally:
+            if sink_token is not None:
+                _current_sink.reset(sink_token)
+
+    def stats(self) -> PublisherStats:
+        """Snapshot per-channel send counts, failures, retries, in-flight
+        attempts, EWMA latency and last (redacted) error.
+
+        Cheap enough to poll from a health endpoint; counters are updated on
+        every attempt whether or not a metrics sink is configured.
+        """
+        channels, _ = self._snapshot_state()
+        concurrency = self.concurrency
+        health = {}
+        seen: Dict[str, int] = {}
+        for channel in channels:
+            name = self._channel_name(channel)
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name}#{seen[name]}"
+            health[name] = self._counters_for(channel).snapshot(
+                concurrency.limit(channel) if concurrency is not None else None
+            )
+        rate_limiter = self.rate_limiter
+        return PublisherStats(
+            channels=health,
+            rate_limiter_tokens=rate_limiter.tokens() if rate_limiter is not None else None,
+        )
 
-        if failures:
-            self._raise_publish_error(failures)
+    def _counters_for(self, channel) -> ChannelCounters:
+        entry = self._counters.get(id(channel))
+        if entry is None:
+            with self._state_lock:
+                entry = self._counters.setdefault(id(channel), (channel, ChannelCounters()))
+        return entry[1]
 
     def _snapshot_state(self):
         with self._state_lock:
             return self.channels, self.retry_config
 
-    def _send_with_retry(self, channel, retry_config: RetryConfig, *args, **kwargs):
+    def _send_with_retry(self, delivery: _Delivery, retry_config: RetryConfig, *args, **kwargs):
+        channel = delivery.channel
         max_attempts = retry_config.max_retries + 1
         delay = retry_config.retry_delay
 
-        for attempt in range(1, max_attempts + 1):
-            try:
-                channel.send(*args, **kwargs)
-                return
-            except Exception as error:
-                if attempt == max_attempts:
-                    raise
-
-                if not self._is_retriable_exception(error, retry_config):
-                    logger.debug(
-                        "Channel %s send failed with non-retriable %s: %s",
-                        self._channel_name(channel),
-                        error.__class__.__name__,
-                        error,
-                    )
-                    raise
-
-                self._log_retry(channel, attempt, error, delay, retry_config)
-                if delay > 0:
-                    time.sleep(delay)
-                delay *= retry_config.retry_backoff
-
-    async def _send_with_retry_async(self, channel, retry_config: RetryConfig, *args, **kwargs):
+        with start_span(
+            self.tracer, CHANNEL_SPAN, {"use_notify.channel": self._channel_name(channel)}
+        ):
+            for attempt in range(1, max_attempts + 1):
+                delivery.begin_attempt(attempt)
+                try:
+                    with start_span(self.tracer, ATTEMPT_SPAN, {"use_notify.attempt": attempt}):
+                        channel.send(*args, **kwargs)
+                except BaseException as error:
+                    # Interrupted attempts are closed too, so in_flight drops back.
+                    delivery.end_attempt(error)
+                    if not isinstance(error, Exception) or attempt == max_attempts:
+                        raise
+
+                    if not self._is_retriable_exception(error, retry_config):
+                        logger.debug(
+                            "Channel %s send failed with non-retriable %s: %s",
+                            self._channel_name(channel),
+                            error.__class__.__name__,
+                            error,
+                        )
+                        raise
+
+                    self._log_retry(channel, attempt, error, delay, retry_config)
+                    delivery.retry_scheduled(delay, error)
+                    if delay > 0:
+                        time.sleep(delay)
+                    delay *= retry_config.retry_backoff
+                else:
+                    delivery.end_attempt()
+                    return
+
+    async def _send_with_retry_async(
+        self, delivery: _Delivery, retry_config: RetryConfig, *args, **kwargs
+    ):
+        channel = delivery.channel
         max_attempts = retry_config.max_retries + 1
         delay = retry_config.retry_delay
-
-        for attempt in range(1, max_attempts + 1):
-            try:
-                await channel.send_async(*args, **kwargs)
-                return
-            except Exception as error:
-                if attempt == max_attempts:
-                    raise
-
-                if not self._is_retriable_exception(error, retry_config):
-                    logger.debug(
-                        "Channel %s send failed with non-retriable %s: %s",
-                        self._channel_name(channel),
-                        error.__class__.__name__,
-                        error,
-                    )
-                    raise
-
-                self._log_retry(channel, attempt, error, delay, retry_config)
-                if delay > 0:
-                    await asyncio.sleep(delay)
-                delay *= retry_config.retry_backoff
+        concurrency = self.concurrency
+        limit = concurrency.for_channel(channel) if concurrency is not None else None
+
+        with start_span(
+            self.tracer, CHANNEL_SPAN, {"use_notify.channel": self._channel_name(channel)}
+        ):
+            for attempt in range(1, max_attempts + 1):
+                if limit is not None:
+                    await limit.acquire()
+                delivery.begin_attempt(attempt)
+                try:
+                    with start_span(self.tracer, ATTEMPT_SPAN, {"use_notify.attempt": attempt}):
+                        await channel.send_async(*args, **kwargs)
+                except BaseException as error:
+                    if not isinstance(error, Exception):
+                        # Cancelled or interrupted: free the slot without a sample.
+                        if limit is not None:
+                            limit.release(None)
+                        delivery.end_attempt(error)
+                        raise
+                    if limit is not None:
+                        limit.release(
+                            time.perf_counter() - delivery.attempt_started_at,
+                            overloaded=self._is_retriable_exception(error, retry_config),
+                        )
+                    delivery.end_attempt(error)
+                    if attempt == max_attempts:
+                        raise
+
+                    if not self._is_retriable_exception(error, retry_config):
+                        logger.debug(
+                            "Channel %s send failed with non-retriable %s: %s",
+                            self._channel_name(channel),
+                            error.__class__.__name__,
+                            error,
+                        )
+                        raise
+
+                    self._log_retry(channel, attempt, error, delay, retry_config)
+                    delivery.retry_scheduled(delay, error)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    delay *= retry_config.retry_backoff
+                else:
+                    if limit is not None:
+                        limit.release(time.perf_counter() - delivery.attempt_started_at)
+                    delivery.end_attempt()
+                    return
 
     @staticmethod
     def _channel_name(channel) -> str:
@@ -233,28 +517,58 @@ class Publisher:
         )
 
     @staticmethod
-    def _raise_publish_error(failures):
+    def _raise_rate_limited(priority: str):
+        raise RateLimitedError(f"Rate limit exceeded for {priority} notification")
+
+    @staticmethod
+    def _raise_publish_error(failures: List[ChannelFailure]):
         if len(failures) == 1:
-            raise redact_exception_message(failures[0][1])
+            raise redact_exception_message(failures[0].error)
         raise NotificationPublishError(failures)
 
     def _is_retriable_exception(self, error: Exception, retry_config: RetryConfig) -> bool:
-        if isinstance(error, httpx.HTTPStatusError):
-            if error.response is None:
+        # A ChannelGroup whose members all failed is retried if any member
+        # failure is. Other aggregate errors (broadcast targets, later split
+        # parts) stay non-retriable so delivered messages are not resent.
+        channel_group = sys.modules.get("use_notify.channels.group")
+        if channel_group is not None and isinstance(error, channel_group.ChannelGroupError):
+            return any(
+                self._is_retriable_exception(record.error, retry_config) for record in error.records
+            )
+
+        httpx = sys.modules.get("httpx")
+        if httpx is not None:
+            if isinstance(error, httpx.HTTPStatusError):
+                if error.response is None:
+                    return False
+                status_code = error.response.status_code
+                return status_code in (408, 429) or status_code >= 500
+
+            if isinstance(error, httpx.RequestError):
+                return True
+
+        smtplib = sys.modules.get("smtplib")
+        if smtplib is not None:
+            if isinstance(error, smtplib.SMTPAuthenticationError):
                 return False
-            status_code = error.response.status_code
-            return status_code in (408, 429) or status_code >= 500
 
-        if isinstance(error, httpx.RequestError):
-            return True
+            if isinstance(error, smtplib.SMTPResponseException):
+                return 400 <= error.smtp_code < 500
 
-        if isinstance(error, smtplib.SMTPAuthenticationError):
-            return False
+        return isinstance(error, retry_config.retriable_exceptions)
 
-        if isinstance(error, smtplib.SMTPResponseException):
-            return 400 <= error.smtp_code < 500
 
-        return isinstance(error, retry_config.retriable_exceptions)
+# httpx and smtplib are only imported by the channels that send with them. An
+# error can only be one of their exception types if the module is loaded, so
+# they are looked up in sys.modules instead of being imported here.
+def _failure_status_code(error: Exception) -> Optional[int]:
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code if error.response is not None else None
+    smtplib = sys.modules.get("smtplib")
+    if smtplib is not None and isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code
+    return None
 
 
 class Notify(Publisher):
@@ -0,0 +1,15 @@
+CRITICAL = "critical"
+NORMAL = "normal"
+BULK = "bulk"
+PRIORITIES = (CRITICAL, NORMAL, BULK)
+
+# Lower rank is served first.
+_RANKS = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+
+
+def priority_rank(priority: str) -> int:
+    """Return the queue rank of ``priority``; raises ValueError for unknown values."""
+    try:
+        return _RANKS[priority]
+    except (KeyError, TypeError):
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}") from None
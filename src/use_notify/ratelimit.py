@@ -0,0 +1,198 @@
+import asyncio
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Union
+
+from use_notify._validation import is_number_like
+from use_notify.priority import BULK, NORMAL, priority_rank
+
+
+class RateLimitedError(RuntimeError):
+    """Raised when a notification could not get rate-limit capacity in time."""
+
+
+class RateLimiter:
+    """Token bucket shared by all priorities of one publisher.
+
+    Tokens refill at ``rate`` per second up to ``burst``. The last
+    ``reserved`` tokens are only handed to critical notifications, so a flood
+    of normal and bulk traffic cannot use up the capacity alerts need.
+
+    Critical and normal notifications wait up to ``max_wait`` seconds for a
+    token (forever when ``None``). Bulk notifications never wait: without a
+    free token they are shed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        reserved: float = 0,
+        max_wait: Optional[float] = None,
+    ):
+        if not is_number_like(rate) or rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst is None:
+            burst = max(1.0, rate)
+        if not is_number_like(burst) or burst < 1:
+            raise ValueError("burst must be >= 1")
+        if not is_number_like(reserved) or reserved < 0 or reserved >= burst:
+            raise ValueError("reserved must be >= 0 and less than burst")
+        if max_wait is not None and (not is_number_like(max_wait) or max_wait < 0):
+            raise ValueError("max_wait must be >= 0")
+
+        self.rate = rate
+        self.burst = burst
+        self.reserved = reserved
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    def try_acquire(self, priority: str = NORMAL) -> float:
+        """Take a token if one is free for ``priority``.
+
+        Returns 0.0 on success, otherwise the seconds until one should be.
+        """
+        # Only critical (rank 0) may dip into the reserved tokens.
+        floor = self.reserved if priority_rank(priority) else 0.0
+        with self._bucket():
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens - 1 >= floor:
+                self._tokens -= 1
+                return 0.0
+            return (floor + 1 - self._tokens) / self.rate
+
+    def acquire(self, priority: str = NORMAL) -> bool:
+        """Block until a token is taken; False when shed or ``max_wait`` passed."""
+        deadline = self._deadline()
+        while True:
+            delay = self._next_delay(priority, deadline)
+            if delay is None:
+                return True
+            if delay < 0:
+                return False
+            time.sleep(delay)
+
+    async def acquire_async(self, priority: str = NORMAL) -> bool:
+        """Async variant of :meth:`acquire`."""
+        deadline = self._deadline()
+        while True:
+            delay = self._next_delay(priority, deadline)
+            if delay is None:
+                return True
+            if delay < 0:
+                return False
+            await asyncio.sleep(delay)
+
+    def tokens(self) -> float:
+        """Tokens currently available, including the reserved ones."""
+        with self._bucket():
+            elapsed = time.monotonic() - self._updated_at
+            return min(self.burst, self._tokens + elapsed * self.rate)
+
+    def _bucket(self):
+        # Held while ``_tokens`` / ``_updated_at`` are read or updated.
+        return self._lock
+
+    def _deadline(self) -> Optional[float]:
+        if self.max_wait is None:
+            return None
+        return time.monotonic() + self.max_wait
+
+    def _next_delay(self, priority: str, deadline: Optional[float]) -> Optional[float]:
+        # None: acquired. Negative: give up. Otherwise: seconds to sleep.
+        wait = self.try_acquire(priority)
+        if wait == 0.0:
+            return None
+        if priority == BULK:
+            return -1.0
+        if deadline is None:
+            return wait
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return -1.0
+        return min(wait, remaining)
+
+
+# Bucket state shared through the file: magic, tokens, last refill time.
+_SHARED_STATE = struct.Struct("<4sdd")
+_SHARED_MAGIC = b"UNRL"
+
+
+class SharedRateLimiter(RateLimiter):
+    """:class:`RateLimiter` whose bucket is shared by every process on the host
+    that opens the same ``path``, e.g. all workers of a gunicorn server.
+
+    The bucket lives in a small memory-mapped file and is updated under an
+    ``fcntl`` record lock, so no external service is needed. Processes should
+    use the same ``rate``, ``burst`` and ``reserved``. Refill times come from
+    ``time.monotonic()``, which all processes on one host share. POSIX only.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        rate: float,
+        burst: Optional[float] = None,
+        reserved: float = 0,
+        max_wait: Optional[float] = None,
+    ):
+        super().__init__(rate, burst, reserved, max_wait)
+        try:
+            import fcntl
+        except ImportError:
+            raise ImportError("SharedRateLimiter requires fcntl, which is POSIX only") from None
+
+        self.path = os.fspath(path)
+        self._fcntl = fcntl
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # lockf locks belong to the process, so they also exclude workers
+            # forked after this limiter was created (unlike flock).
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < _SHARED_STATE.size:
+                    os.ftruncate(fd, _SHARED_STATE.size)
+                    state = _SHARED_STATE.pack(_SHARED_MAGIC, float(self.burst), time.monotonic())
+                    os.pwrite(fd, state, 0)
+                self._map = mmap.mmap(fd, _SHARED_STATE.size)
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN)
+            if self._map[:4] != _SHARED_MAGIC:
+                self._map.close()
+                raise ValueError(f"{self.path} is not a rate limiter state file")
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def close(self):
+        """Unmap and close the state file."""
+        if self._fd is not None:
+            self._map.close()
+            os.close(self._fd)
+            self._fd = None
+
+    @contextmanager
+    def _bucket(self):
+        # The thread lock covers this process's threads, which share its
+        # lockf lock; lockf covers the other processes.
+        with self._lock:
+            fcntl = self._fcntl
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                _, tokens, updated_at = _SHARED_STATE.unpack_from(self._map)
+                # A state file from before a reboot has a refill time in the future.
+                self._tokens = tokens
+                self._updated_at = min(updated_at, time.monotonic())
+                yield
+                _SHARED_STATE.pack_into(self._map, 0, _SHARED_MAGIC, self._tokens, self._updated_at)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
@@ -1,16 +1,18 @@
 import re
+from typing import List, Tuple
 
 SECRET_REPLACEMENT = "<redacted>"
 
-_QUERY_SECRET_RE = re.compile(r"(?i)([?&](?:access_token|token|key|pushkey)=)[^&\s)]+")
-_PATH_SECRET_PATTERNS = (
-    re.compile(r"(?i)(api\.day\.app/)[^/?\s)]+"),
-    re.compile(r"(?i)(/v1/sender/)[^/?\s)]+"),
-    re.compile(r"(?i)(/open-apis/bot/v2/hook/)[^/?\s)]+"),
-    re.compile(r"(?i)(ntfy\.sh/)[^/?\s)]+"),
-)
-_SINGLE_SEGMENT_URL_RE = re.compile(
-    r"(?i)(?P<prefix>https?://[^/?#\s)]+/)(?P<segment>[^/?#\s)]+)(?=(?:[?#\s)]|$))"
+# One alternation covering query secrets, single-segment URLs and known
+# provider path secrets, so text is scanned by a single compiled pattern.
+# The leading lookahead lists every alternative's first character, which lets
+# the regex engine skip other positions without trying each branch.
+_SECRET_RE = re.compile(
+    r"(?i)(?=[?&/hna])(?:"
+    r"(?P<query>[?&](?:access_token|token|key|pushkey)=)(?P<query_secret>[^&\s)]+)"
+    r"|(?P<url>https?://[^/?#\s)]+/)(?P<segment>[^/?#\s)]+)(?=(?:[?#\s)]|$))"
+    r"|(?P<path>api\.day\.app/|/v1/sender/|/open-apis/bot/v2/hook/|ntfy\.sh/)"
+    r"(?P<path_secret>[^/?\s)]+))"
 )
 _SENSITIVE_SEGMENT_RE = re.compile(
     r"(?i)(?:^|[-_.])(?:token|secret|pushkey|topic|api[-_.]?key|access[-_.]?key|key)(?:$|[-_.]|\d)"
@@ -19,11 +21,27 @@ _SENSITIVE_SEGMENT_RE = re.compile(
 
 def redact_text(value: str) -> str:
     """Redact common notification provider secrets from text."""
-    redacted = _QUERY_SECRET_RE.sub(rf"\1{SECRET_REPLACEMENT}", value)
-    for pattern in _PATH_SECRET_PATTERNS:
-        redacted = pattern.sub(rf"\1{SECRET_REPLACEMENT}", redacted)
-    redacted = _SINGLE_SEGMENT_URL_RE.sub(_redact_sensitive_single_segment_url, redacted)
-    return redacted
+    # Every pattern needs a query "=" or a path "/", so most plain error
+    # messages skip the scan entirely.
+    if "=" not in value and "/" not in value:
+        return value
+
+    spans = _secret_spans(value)
+    if not spans:
+        return value
+
+    parts = []
+    position = 0
+    for start, end in sorted(spans):
+        if start < position:
+            # Overlaps the previous secret: widen the redacted range.
+            position = max(position, end)
+            continue
+        parts.append(value[position:start])
+        parts.append(SECRET_REPLACEMENT)
+        position = end
+    parts.append(value[position:])
+    return "".join(parts)
 
 
 def redact_exception_message(error: Exception) -> Exception:
@@ -35,11 +53,29 @@ def redact_exception_message(error: Exception) -> Exception:
     return error
 
 
-def _redact_sensitive_single_segment_url(match: re.Match) -> str:
-    segment = match.group("segment")
-    if _looks_sensitive_path_segment(segment):
-        return f"{match.group('prefix')}{SECRET_REPLACEMENT}"
-    return match.group(0)
+def _secret_spans(value: str) -> List[Tuple[int, int]]:
+    """Collect (start, end) ranges of secrets in one forward scan.
+
+    Matches may overlap (a provider path inside a URL, or two provider paths
+    sharing a "/"), so the scan resumes just inside each match instead of
+    after it, and overlapping ranges are merged by the caller.
+    """
+    spans = []
+    search = _SECRET_RE.search
+    match = search(value)
+    while match is not None:
+        if match.lastgroup == "query_secret":
+            spans.append(match.span("query_secret"))
+            resume = match.end()
+        elif match.lastgroup == "path_secret":
+            spans.append(match.span("path_secret"))
+            resume = match.end("path") - 1
+        else:
+            if _looks_sensitive_path_segment(match.group("segment")):
+                spans.append(match.span("segment"))
+            resume = match.start() + 1
+        match = search(value, resume)
+    return spans
 
 
 def _looks_sensitive_path_segment(segment: str) -> bool:
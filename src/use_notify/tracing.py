@@ -0,0 +1,92 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from use_notify.redaction import redact_text
+
+PUBLISH_SPAN = "use_notify.publish"
+CHANNEL_SPAN = "use_notify.channel"
+ATTEMPT_SPAN = "use_notify.attempt"
+
+_current_span = ContextVar("use_notify_trace_span", default=None)
+_NO_SPAN = nullcontext()
+
+
+def get_tracer(name: str = "use_notify"):
+    """Return an OpenTelemetry tracer, or None when opentelemetry isn't installed.
+
+    Pass the result to ``useNotify(tracer=...)``. Spans go to whatever tracer
+    provider the application configured.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace.get_tracer(name)
+
+
+def start_span(tracer, name: str, attributes=None):
+    """Context manager for a span made current for this context.
+
+    Returns a shared no-op context manager when ``tracer`` is None, so
+    untraced publishes pay for one attribute lookup and nothing else.
+    """
+    if tracer is None:
+        return _NO_SPAN
+    return _span(tracer, name, attributes)
+
+
+@contextmanager
+def _span(tracer, name, attributes):
+    # Exceptions are recorded by hand so their messages are redacted first;
+    # provider errors often carry webhook tokens in URLs.
+    with tracer.start_as_current_span(
+        name, attributes=attributes, record_exception=False, set_status_on_exception=False
+    ) as span:
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as error:
+            _record_error(span, error)
+            raise
+        finally:
+            _current_span.reset(token)
+
+
+def _record_error(span, error: Exception):
+    message = redact_text(str(error))
+    span.add_event(
+        "exception",
+        {"exception.type": error.__class__.__name__, "exception.message": message},
+    )
+    try:
+        from opentelemetry.trace import Status, StatusCode
+    except ImportError:
+        return
+    span.set_status(Status(StatusCode.ERROR, message))
+
+
+def current_span():
+    """Return the innermost use-notify span in this context, if any."""
+    return _current_span.get()
+
+
+def http_trace_hook(span):
+    """httpx ``trace`` extension callback that adds connection events to ``span``.
+
+    Events cover DNS and TCP connect, TLS handshake, and sending the request
+    and receiving response headers, e.g. ``connection.start_tls.complete``.
+    """
+
+    def trace(event_name, info):
+        span.add_event(event_name)
+
+    return trace
+
+
+def http_trace_hook_async(span):
+    """Async variant of :func:`http_trace_hook` for ``httpx.AsyncClient``."""
+
+    async def trace(event_name, info):
+        span.add_event(event_name)
+
+    return trace
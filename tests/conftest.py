@@ -1,3 +1,39 @@
+import functools
+import threading
+
+import httpx
+import pytest
+
 from tests.helpers import RecordingChannel, make_http_status_error
 
 __all__ = ["RecordingChannel", "make_http_status_error"]
+
+
+@pytest.fixture
+def http_transport(monkeypatch):
+    """Route new httpx clients through a MockTransport that records every request.
+
+    Set ``http_transport.fail_when`` to a predicate on the request to answer it
+    with an error payload instead of success; ``fail_status`` sets its status
+    code (400 by default).
+    """
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            handler.requests.append(request)
+        if handler.fail_when(request):
+            return httpx.Response(
+                handler.fail_status, json={"errcode": 310000, "errmsg": "rejected"}
+            )
+        return httpx.Response(200, json={"errcode": 0})
+
+    handler.requests = []
+    handler.fail_when = lambda request: False
+    handler.fail_status = 400
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(httpx, "Client", functools.partial(httpx.Client, transport=transport))
+    monkeypatch.setattr(
+        httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=transport)
+    )
+    return handler
@@ -1,3 +1,5 @@
+import json
+
 import httpx
 
 from use_notify.channels.base import BaseChannel
@@ -30,3 +32,8 @@ def make_http_status_error(status_code, method="POST", url="https://example.com/
         request=request,
         response=response,
     )
+
+
+def json_body(payload):
+    """The bytes HTTP channels send for a JSON payload."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from use_notify import NotificationPublishError, useNotify
+from use_notify.channels import Ding, Feishu, WeChat
+
+
+def _token(request):
+    return request.url.params.get("access_token") or request.url.params.get("key")
+
+
+def test_ding_broadcast_sends_one_serialized_body_to_every_token(http_transport):
+    Ding({"tokens": ["a", "b", lambda: "c"]}).send("内容", "标题")
+
+    tokens = sorted(request.url.params["access_token"] for request in http_transport.requests)
+    assert tokens == ["a", "b", "c"]
+    bodies = {request.content for request in http_transport.requests}
+    assert len(bodies) == 1
+    assert json.loads(bodies.pop()) == {
+        "msgtype": "markdown",
+        "markdown": {"title": "标题", "text": "内容"},
+        "at": {},
+    }
+
+
+def test_broadcast_reports_each_failed_target(http_transport):
+    http_transport.fail_when = lambda request: _token(request) in {"b", "d"}
+
+    with pytest.raises(NotificationPublishError) as exc_info:
+        WeChat({"tokens": ["a", "b", "c", "d"], "broadcast_concurrency": 2}).send("hi")
+
+    assert [channel for channel, _ in exc_info.value.failures] == ["WeChat[1]", "WeChat[3]"]
+    assert len(http_transport.requests) == 4
+
+
+def test_publisher_does_not_resend_partly_failed_broadcast(http_transport):
+    http_transport.fail_when = lambda request: _token(request) == "b"
+    http_transport.fail_status = 503
+
+    with pytest.raises(NotificationPublishError):
+        useNotify([Ding({"tokens": ["a", "b", "c"]})], max_retries=2).publish("hi")
+
+    assert sorted(_token(request) for request in http_transport.requests) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_async_sends_to_every_token(http_transport):
+    await Feishu({"tokens": ["a", "b"]}).send_async("hi")
+
+    assert sorted(request.url.path for request in http_transport.requests) == [
+        "/open-apis/bot/v2/hook/a",
+        "/open-apis/bot/v2/hook/b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_async_reports_failed_targets(http_transport):
+    http_transport.fail_when = lambda request: _token(request) == "a"
+
+    with pytest.raises(NotificationPublishError) as exc_info:
+        await Ding({"tokens": ["a", "b"]}).send_async("hi")
+
+    assert [channel for channel, _ in exc_info.value.failures] == ["Ding[0]"]
+
+
+def test_single_token_keeps_single_target_path(http_transport):
+    Ding({"token": "solo"}).send("hi")
+
+    assert [request.url.params["access_token"] for request in http_transport.requests] == ["solo"]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{"tokens": "abc"}, {"tokens": ["a"], "broadcast_concurrency": 0}],
+)
+def test_broadcast_config_validation(config):
+    with pytest.raises(ValueError):
+        Ding(config)
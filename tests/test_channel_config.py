@@ -0,0 +1,84 @@
+import pickle
+
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify.channels import Bark, Ding, Ntfy
+from use_notify.channels.config import ChannelConfig
+
+
+class SampleConfig(ChannelConfig):
+    __slots__ = ("token", "base_url")
+
+
+def test_config_reads_declared_fields_from_slots():
+    config = SampleConfig({"token": "abc"})
+
+    assert config.token == "abc"
+    assert config.base_url is None
+    assert not hasattr(config, "__dict__")
+    assert SampleConfig._fields == ("token", "base_url")
+
+
+def test_config_keeps_dict_semantics_for_given_keys():
+    config = SampleConfig({"token": "abc", "extra": 1})
+
+    assert "token" in config
+    assert "base_url" not in config
+    assert config["extra"] == config.extra == 1
+    assert config.get("base_url", "fallback") == "fallback"
+    assert not hasattr(config, "unknown")
+    with pytest.raises(AttributeError, match="unknown"):
+        config.unknown
+    assert dict(config) == {"token": "abc", "extra": 1}
+    with pytest.raises(KeyError):
+        config["base_url"]
+
+
+def test_config_assignment_updates_membership():
+    config = SampleConfig({})
+
+    config.base_url = "https://example.com"
+    config.other = "value"
+
+    assert config.to_dict() == {"base_url": "https://example.com", "other": "value"}
+
+
+def test_config_item_assignment_matches_attribute_assignment():
+    config = SampleConfig({"get": "extra value"})
+    version = config._version
+
+    config["token"] = "abc"
+    config["other"] = 1
+
+    assert config._version == version + 2
+    assert config.token == config["token"] == "abc"
+    assert config.other == 1
+    assert config["get"] == "extra value"
+    assert config.get("other") == 1
+
+
+def test_configs_with_same_keys_share_key_tuple_and_pickle():
+    first = SampleConfig({"token": "a"})
+    second = SampleConfig({"token": "b"})
+
+    assert first._keys is second._keys
+    restored = pickle.loads(pickle.dumps(second))
+    assert restored.token == "b"
+    assert restored == second
+
+
+def test_channels_build_slotted_configs_and_validate_once():
+    ding = Ding({"token": "abc", "at_all": True})
+
+    assert type(ding.config).__name__ == "DingConfig"
+    assert ding.config.at_mobiles is None
+    assert Bark(ding.config.to_dict()).config.token == "abc"
+    with pytest.raises(ValueError, match="topic"):
+        Ntfy({"base_url": "https://ntfy.example.com"})
+
+
+def test_channels_without_config_class_fall_back_to_addict():
+    channel = RecordingChannel()
+
+    assert type(channel.config).__name__ == "AdDict"
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify import NotificationPublishError, useNotify
+from use_notify.channels import ChannelGroup
+from use_notify.metrics import MetricsSink, current_metrics_sink
+
+
+class SlowChannel(RecordingChannel):
+    def __init__(self, delay, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.cancelled = False
+
+    def send(self, content, title=None):
+        time.sleep(self.delay)
+        super().send(content, title)
+
+    async def send_async(self, content, title=None):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        await super().send_async(content, title)
+
+
+class PrimaryChannel(SlowChannel):
+    pass
+
+
+class BackupChannel(SlowChannel):
+    pass
+
+
+def test_failover_stops_at_first_success():
+    primary = RecordingChannel(sync_failures=[ConnectionError("down")])
+    backup = RecordingChannel()
+    unused = RecordingChannel()
+
+    ChannelGroup([primary, backup, unused]).send("hello", "title")
+
+    assert len(primary.sync_messages) == len(backup.sync_messages) == 1
+    assert unused.sync_messages == []
+
+
+@pytest.mark.asyncio
+async def test_failover_async_raises_publish_error_when_all_fail():
+    group = ChannelGroup(
+        [
+            PrimaryChannel(0, async_failures=[ConnectionError("a")]),
+            BackupChannel(0, async_failures=[ValueError("b")]),
+        ]
+    )
+
+    with pytest.raises(NotificationPublishError) as exc_info:
+        await group.send_async("hello")
+
+    assert [record.channel for record in exc_info.value.records] == [
+        "PrimaryChannel",
+        "BackupChannel",
+    ]
+
+
+def test_hedge_starts_backup_when_primary_is_slow():
+    primary = PrimaryChannel(0.5)
+    backup = BackupChannel(0)
+
+    started = time.perf_counter()
+    ChannelGroup([primary, backup], hedge_delay=0.02).send("hello")
+
+    assert time.perf_counter() - started < 0.4
+    assert len(backup.sync_messages) == 1
+
+
+def test_hedge_moves_on_immediately_after_failure():
+    primary = PrimaryChannel(0, sync_failures=[ConnectionError("down")])
+    backup = BackupChannel(0)
+
+    started = time.perf_counter()
+    ChannelGroup([primary, backup], hedge_delay=5).send("hello")
+
+    assert time.perf_counter() - started < 1
+    assert len(backup.sync_messages) == 1
+
+
+def test_hedge_does_not_start_backup_when_primary_is_fast():
+    backup = BackupChannel(0)
+
+    ChannelGroup([PrimaryChannel(0), backup], hedge_delay=0.5).send("hello")
+
+    assert backup.sync_messages == []
+
+
+def test_hedge_worker_threads_keep_publish_context():
+    seen = []
+    sink = MetricsSink()
+
+    class ProbeChannel(RecordingChannel):
+        def send(self, content, title=None):
+            seen.append((threading.current_thread().name, current_metrics_sink()))
+
+    group = ChannelGroup([ProbeChannel()], hedge_delay=0.1)
+    useNotify([group], metrics=sink).publish("hello")
+
+    ((thread_name, active_sink),) = seen
+    assert thread_name.startswith("use-notify-hedge")
+    assert active_sink is sink
+
+
+@pytest.mark.asyncio
+async def test_hedge_async_cancels_losing_channels():
+    primary = PrimaryChannel(1)
+    backup = BackupChannel(0)
+
+    await ChannelGroup([primary, backup], hedge_delay=0.01).send_async("hello")
+    await asyncio.sleep(0)
+
+    assert len(backup.async_messages) == 1
+    assert primary.cancelled
+
+
+@pytest.mark.parametrize("kwargs", [{"channels": []}, {"hedge_delay": -1}])
+def test_channel_group_rejects_invalid_configuration(kwargs):
+    options = {"channels": [RecordingChannel()], **kwargs}
+    with pytest.raises(ValueError):
+        ChannelGroup(**options)
+
+
+def test_publisher_retries_group_when_all_members_fail_retriably():
+    primary = PrimaryChannel(0, sync_failures=[ConnectionError("a")])
+    backup = BackupChannel(0, sync_failures=[ValueError("b")])
+    notify = useNotify([ChannelGroup([primary, backup])], max_retries=1)
+
+    notify.publish("hello", "title")
+
+    assert len(primary.sync_messages) == 2
+    assert len(backup.sync_messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_publisher_retries_group_when_all_members_fail_retriably_async():
+    primary = PrimaryChannel(0, async_failures=[TimeoutError("a")])
+    backup = BackupChannel(0, async_failures=[TimeoutError("b")])
+    notify = useNotify([ChannelGroup([primary, backup])], max_retries=1)
+
+    await notify.publish_async("hello", "title")
+
+    assert len(primary.async_messages) == 2
+    assert len(backup.async_messages) == 1
+
+
+def test_publisher_does_not_retry_group_with_only_permanent_failures():
+    primary = PrimaryChannel(0, sync_failures=[ValueError("a")])
+    backup = BackupChannel(0, sync_failures=[ValueError("b")])
+    notify = useNotify([ChannelGroup([primary, backup])], max_retries=2)
+
+    with pytest.raises(NotificationPublishError):
+        notify.publish("hello", "title")
+
+    assert len(primary.sync_messages) == len(backup.sync_messages) == 1
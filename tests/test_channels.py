@@ -1,10 +1,27 @@
+import base64
+import hashlib
+import hmac
+import io
+import json
+import time
+import urllib.parse
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from use_notify import useNotifyChannel
+from tests.helpers import json_body
+from use_notify import NotificationPublishError, useNotifyChannel
+from use_notify.channels import console as console_module
+from use_notify.channels import ding as ding_module
 from use_notify.channels.http import HttpChannel
-from use_notify.channels.utils import ProviderResponseError, validate_business_response
+from use_notify.channels.utils import (
+    MAX_VALIDATED_BODY_SIZE,
+    ProviderResponseError,
+    dumps_json,
+    set_json_encoder,
+    validate_business_response,
+)
 
 
 def _mock_sync_http_response(json_data=None):
@@ -84,6 +101,172 @@ async def test_http_channel_async_rejects_unsupported_method():
         await channel.send_async("hello")
 
 
+class CountingJsonChannel(HttpChannel):
+    cache_request_body = True
+
+    @property
+    def api_url(self):
+        return "https://example.com"
+
+    @property
+    def headers(self):
+        return {"Content-Type": "application/json"}
+
+    def build_request_payload(self, content, title=None):
+        self.builds = getattr(self, "builds", 0) + 1
+        return {"message": content, "title": title}
+
+
+@pytest.fixture
+def restore_json_encoder():
+    yield
+    set_json_encoder(None)
+
+
+def test_http_channel_reuses_serialized_body_for_the_same_message():
+    channel = CountingJsonChannel({})
+    content = "hello " * 100
+
+    first = channel.request_payload(content, "title")
+    second = channel.request_payload(content, "title")
+
+    assert first is second
+    assert first == json_body({"message": content, "title": "title"})
+    assert channel.builds == 1
+
+    channel.request_payload("other", "title")
+    assert channel.builds == 2
+
+
+def test_http_channel_rebuilds_cached_body_after_config_change():
+    channel = useNotifyChannel.Ding({"token": "t", "at_mobiles": ["1"]})
+    content, title = "hello", "title"
+
+    first = channel.request_payload(content, title)
+    channel.config.at_mobiles = ["2"]
+    second = channel.request_payload(content, title)
+
+    assert first != second
+    assert b'"2"' in second
+    assert channel.request_payload(content, title) is second
+
+    custom = CountingJsonChannel({"token": "a"})
+    custom.request_payload(content, title)
+    custom.config.token = "b"
+    custom.request_payload(content, title)
+    assert custom.builds == 2
+
+
+class PlainJsonChannel(HttpChannel):
+    @property
+    def api_url(self):
+        return "https://example.com"
+
+    @property
+    def headers(self):
+        return {"X-Token": "t"}
+
+    def build_request_payload(self, content, title=None):
+        self.builds = getattr(self, "builds", 0) + 1
+        return {"message": content, "sent_at": self.builds}
+
+
+def test_custom_http_channel_rebuilds_body_for_every_send(http_transport):
+    channel = PlainJsonChannel({})
+
+    channel.send("disk full", "alert")
+    channel.send("disk full", "alert")
+
+    assert [json.loads(request.content)["sent_at"] for request in http_transport.requests] == [
+        1,
+        2,
+    ]
+
+
+def test_json_channel_without_content_type_header_sends_json(http_transport):
+    PlainJsonChannel({}).send("hello")
+
+    request = http_transport.requests[0]
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["x-token"] == "t"
+
+
+def test_http_channel_skips_body_cache_when_disabled():
+    channel = CountingJsonChannel({})
+    channel.cache_request_body = False
+
+    channel.request_payload("hello")
+    channel.request_payload("hello")
+
+    assert channel.builds == 2
+
+
+@pytest.mark.parametrize("encoder", ["json", "orjson", "ujson"])
+def test_dumps_json_encoders_match_stdlib_output(encoder, restore_json_encoder):
+    pytest.importorskip(encoder)
+    set_json_encoder(encoder)
+    payload = {"text": "告警 https://example.com/a", "n": [1, 2.5, None, True]}
+
+    assert dumps_json(payload) == json_body(payload)
+
+
+def test_dumps_json_accepts_custom_encoder_and_rejects_unknown_name(restore_json_encoder):
+    set_json_encoder(lambda payload: b"custom")
+    assert dumps_json({"a": 1}) == b"custom"
+
+    with pytest.raises(ValueError, match="Unsupported JSON encoder"):
+        set_json_encoder("simplejson")
+
+
+def test_dumps_json_falls_back_to_stdlib_for_payloads_orjson_rejects(restore_json_encoder):
+    pytest.importorskip("orjson")
+    set_json_encoder("orjson")
+
+    assert dumps_json({1: "a"}) == b'{"1":"a"}'
+
+
+def _raw_response(body, content_type="application/json"):
+    response = httpx.Response(200, content=body, headers={"content-type": content_type})
+    response.json = MagicMock(side_effect=response.json)
+    return response
+
+
+def test_http_channel_freezes_success_fields_at_class_definition():
+    assert useNotifyChannel.Ding.success_fields == {"errcode": frozenset({0})}
+    assert useNotifyChannel.Ding._success_prefixes == (b'{"errcode":0',)
+    assert useNotifyChannel.Chanify._success_prefixes == ()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"errcode":0,"errmsg":"ok"}', b'{"errcode":0}', b' \n{"errcode":0 }'],
+)
+def test_validate_business_response_accepts_success_prefix_without_parsing(body):
+    response = _raw_response(body)
+
+    validate_business_response(response, "ding", {"errcode": {0}}, (b'{"errcode":0',))
+
+    response.json.assert_not_called()
+
+
+def test_validate_business_response_prefix_requires_complete_value():
+    response = _raw_response(b'{"status":10,"errors":["bad user"]}')
+
+    with pytest.raises(ProviderResponseError, match="bad user"):
+        validate_business_response(response, "pushover", {"status": {1}}, (b'{"status":1',))
+
+
+def test_validate_business_response_skips_non_json_and_oversized_bodies():
+    html = _raw_response(b"<html>errcode</html>", content_type="text/html")
+    oversized = _raw_response(b'{"errcode":1,"pad":"' + b"x" * MAX_VALIDATED_BODY_SIZE + b'"}')
+
+    validate_business_response(html, "ding", {"errcode": {0}})
+    validate_business_response(oversized, "ding", {"errcode": {0}})
+
+    html.json.assert_not_called()
+    oversized.json.assert_not_called()
+
+
 def test_validate_business_response_ignores_non_dict_json_payloads():
     response = _mock_sync_http_response(["ok"])
 
@@ -131,7 +314,7 @@ def test_bark_send_builds_expected_request(mock_client):
     client.post.assert_called_once_with(
         "https://bark.example.com/token",
         headers={"Content-Type": "application/json; charset=utf-8"},
-        json={"body": "hello", "title": "title", "badge": 3, "sound": "bell"},
+        content=json_body({"body": "hello", "title": "title", "badge": 3, "sound": "bell"}),
     )
     response.raise_for_status.assert_called_once_with()
 
@@ -244,6 +427,39 @@ def test_ding_resolves_callable_token_each_time():
     assert channel.api_url == "https://oapi.dingtalk.com/robot/send?access_token=second"
 
 
+def _reference_ding_sign(timestamp, secret):
+    string_to_sign = f"{timestamp}\n{secret}".encode("utf-8")
+    digest = hmac.new(secret.encode("utf-8"), string_to_sign, digestmod=hashlib.sha256).digest()
+    return urllib.parse.quote_plus(base64.b64encode(digest))
+
+
+def test_ding_signed_url_matches_reference_signature(monkeypatch):
+    monkeypatch.setattr(ding_module.time, "time", lambda: 1699999992.5)
+    channel = useNotifyChannel.Ding({"token": "token", "secret": "SEC123"})
+
+    timestamp = 1699999980 * 1000
+    assert channel.api_url == (
+        "https://oapi.dingtalk.com/robot/send?access_token=token"
+        f"&timestamp={timestamp}&sign={_reference_ding_sign(timestamp, 'SEC123')}"
+    )
+
+
+def test_ding_signature_is_cached_per_window(monkeypatch):
+    now = [1699999980.0]
+    monkeypatch.setattr(ding_module.time, "time", lambda: now[0])
+    secrets = iter(["first", "first", "second"])
+    channel = useNotifyChannel.Ding({"token": "token", "secret": lambda: next(secrets)})
+
+    first = channel.signature()
+    now[0] += ding_module.SIGN_REUSE_SECONDS - 1
+    assert channel.signature() == first
+
+    now[0] += 1
+    timestamp, sign = channel.signature()
+    assert timestamp == first[0] + ding_module.SIGN_REUSE_SECONDS * 1000
+    assert sign == _reference_ding_sign(timestamp, "second")
+
+
 @patch("httpx.Client")
 def test_ding_send_rejects_business_error_response(mock_client):
     response = _mock_sync_http_response({"errcode": 310000, "errmsg": "invalid token"})
@@ -267,7 +483,9 @@ async def test_ding_send_async_builds_expected_request(mock_client):
 
     client.post.assert_awaited_once_with(
         "https://oapi.dingtalk.com/robot/send?access_token=token",
-        json={"msgtype": "markdown", "markdown": {"title": "title", "text": "hello"}, "at": {}},
+        content=json_body(
+            {"msgtype": "markdown", "markdown": {"title": "title", "text": "hello"}, "at": {}}
+        ),
         headers={"Content-Type": "application/json"},
     )
     response.raise_for_status.assert_called_once_with()
@@ -321,17 +539,19 @@ async def test_feishu_send_async_builds_expected_request(mock_client):
 
     client.post.assert_awaited_once_with(
         "https://open.feishu.cn/open-apis/bot/v2/hook/token",
-        json={
-            "msg_type": "post",
-            "content": {
-                "post": {
-                    "zh_cn": {
-                        "title": "title",
-                        "content": [[{"tag": "text", "text": "hello"}]],
+        content=json_body(
+            {
+                "msg_type": "post",
+                "content": {
+                    "post": {
+                        "zh_cn": {
+                            "title": "title",
+                            "content": [[{"tag": "text", "text": "hello"}]],
+                        }
                     }
-                }
-            },
-        },
+                },
+            }
+        ),
         headers={"Content-Type": "application/json"},
     )
     response.raise_for_status.assert_called_once_with()
@@ -397,7 +617,7 @@ async def test_wechat_send_async_builds_expected_request(mock_client):
 
     client.post.assert_awaited_once_with(
         "https://qyapi.weixin.qq.com/cgi-bin/webhook/send?key=token",
-        json={"markdown": {"content": "## title\n\nhello"}, "msgtype": "markdown"},
+        content=json_body({"markdown": {"content": "## title\n\nhello"}, "msgtype": "markdown"}),
         headers={"Content-Type": "application/json"},
     )
     response.raise_for_status.assert_called_once_with()
@@ -459,12 +679,14 @@ def test_ntfy_send_builds_expected_request(mock_client):
     client.post.assert_called_once_with(
         "https://ntfy.example.com/alerts",
         headers={"Content-Type": "application/json; charset=utf-8"},
-        json={
-            "message": "hello",
-            "title": "title",
-            "attach": "https://example.com/file.txt",
-            "actions": [{"action": "view", "label": "Open", "url": "https://example.com"}],
-        },
+        content=json_body(
+            {
+                "message": "hello",
+                "title": "title",
+                "attach": "https://example.com/file.txt",
+                "actions": [{"action": "view", "label": "Open", "url": "https://example.com"}],
+            }
+        ),
     )
     response.raise_for_status.assert_called_once_with()
 
@@ -482,7 +704,7 @@ async def test_ntfy_send_async_builds_expected_request(mock_client):
     client.post.assert_awaited_once_with(
         "https://ntfy.sh/alerts",
         headers={"Content-Type": "application/json; charset=utf-8"},
-        json={"message": "hello"},
+        content=json_body({"message": "hello"}),
     )
     response.raise_for_status.assert_called_once_with()
 
@@ -688,7 +910,7 @@ async def test_bark_send_async_builds_expected_request(mock_client):
     client.post.assert_awaited_once_with(
         "https://api.day.app/token",
         headers={"Content-Type": "application/json; charset=utf-8"},
-        json={"body": "hello"},
+        content=json_body({"body": "hello"}),
     )
     response.raise_for_status.assert_called_once_with()
 
@@ -724,3 +946,128 @@ async def test_console_send_async_outputs_message(capsys):
     output = capsys.readouterr().out
     assert "title" in output
     assert "hello" in output
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_console_writes_each_message_in_one_call():
+    stream = CountingStream()
+    channel = useNotifyChannel.Console({"stream": stream})
+
+    channel.send("hello", "title")
+
+    assert stream.writes == 1
+    assert stream.getvalue() == f"\n📢 [默认实例通知] title\n📝 hello\n{'-' * 50}\n"
+
+
+@pytest.mark.asyncio
+async def test_console_json_lines_format():
+    stream = io.StringIO()
+    channel = useNotifyChannel.Console({"stream": stream, "format": "json"})
+
+    channel.send("第一条", "title")
+    await channel.send_async("second")
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(record["title"], record["content"]) for record in records] == [
+        ("title", "第一条"),
+        ("消息提醒", "second"),
+    ]
+
+
+def test_console_buffer_writes_once_per_batch():
+    stream = CountingStream()
+    channel = useNotifyChannel.Console({"stream": stream, "format": "json", "buffer_size": 3})
+
+    for index in range(5):
+        channel.send(str(index))
+    assert stream.writes == 1
+    assert len(stream.getvalue().splitlines()) == 3
+
+    channel.close()
+    assert stream.writes == 2
+    assert [json.loads(line)["content"] for line in stream.getvalue().splitlines()] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+
+
+def test_console_background_flusher_writes_buffered_messages():
+    stream = io.StringIO()
+    channel = useNotifyChannel.Console({"stream": stream, "flush_interval": 0.01})
+
+    channel.send("hello")
+    deadline = time.monotonic() + 2
+    while not stream.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    channel.close()
+
+    assert "hello" in stream.getvalue()
+
+
+def test_console_send_after_close_is_flushed_at_exit(monkeypatch):
+    registered = []
+    monkeypatch.setattr(console_module.atexit, "register", registered.append)
+    monkeypatch.setattr(console_module.atexit, "unregister", registered.remove)
+    stream = io.StringIO()
+    channel = useNotifyChannel.Console({"stream": stream, "buffer_size": 10})
+
+    channel.close()
+    assert registered == []
+    channel.send("late")
+    assert registered == [channel.flush]
+
+    registered[0]()
+    assert "late" in stream.getvalue()
+    channel.close()
+    assert registered == []
+
+
+@pytest.mark.parametrize("config", [{"format": "xml"}, {"buffer_size": 0}, {"flush_interval": 0}])
+def test_console_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        useNotifyChannel.Console(config)
+
+
+def test_ntfy_send_batch_posts_every_message_to_one_resolved_topic(http_transport):
+    topics = _credential_provider("alerts", "other")
+    channel = useNotifyChannel.Ntfy({"topic": topics, "tags": ["batch"]})
+
+    channel.send_batch(["one", ("two", "title")], concurrency=1)
+
+    assert [str(request.url) for request in http_transport.requests] == [
+        "https://ntfy.sh/alerts",
+        "https://ntfy.sh/alerts",
+    ]
+    assert [request.content for request in http_transport.requests] == [
+        json_body({"message": "one", "tags": ["batch"]}),
+        json_body({"message": "two", "title": "title", "tags": ["batch"]}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ntfy_send_batch_async_reports_failed_messages(http_transport):
+    http_transport.fail_when = lambda request: b"bad" in request.content
+    channel = useNotifyChannel.Ntfy({"topic": "alerts"})
+
+    with pytest.raises(NotificationPublishError) as error_info:
+        await channel.send_batch_async(["ok", "bad", "ok", "bad"], concurrency=2)
+
+    assert [name for name, _ in error_info.value.failures] == ["Ntfy[1]", "Ntfy[3]"]
+    assert len(http_transport.requests) == 4
+
+
+def test_ntfy_send_batch_rejects_invalid_concurrency():
+    with pytest.raises(ValueError, match="concurrency must be >= 1"):
+        useNotifyChannel.Ntfy({"topic": "alerts"}).send_batch(["hello"], concurrency=0)
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from tests.helpers import RecordingChannel, make_http_status_error
+from use_notify import AdaptiveConcurrency, useNotify
+from use_notify.concurrency import _ChannelLimit
+
+
+class ConcurrencyProbe(RecordingChannel):
+    def __init__(self, delay=0.01, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def send_async(self, content, title=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            await super().send_async(content, title)
+        finally:
+            self.active -= 1
+
+
+def _limit(**kwargs):
+    return _ChannelLimit(AdaptiveConcurrency(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_additively_while_saturated():
+    limit = _limit(initial_limit=2, max_limit=3)
+
+    for _ in range(20):
+        await limit.acquire()
+        await limit.acquire()
+        limit.release(0.1)
+        limit.release(0.1)
+
+    assert limit.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_grow_when_underused():
+    limit = _limit(initial_limit=4)
+
+    for _ in range(10):
+        await limit.acquire()
+        limit.release(0.1)
+
+    assert limit.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_overload_and_latency_spike_cut_the_limit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("use_notify.concurrency.time.monotonic", lambda: now[0])
+    limit = _limit(initial_limit=8, backoff=0.5, latency_tolerance=2.0)
+
+    await limit.acquire()
+    limit.release(0.1)
+    await limit.acquire()
+    limit.release(0.1, overloaded=True)
+    assert limit.limit == 4
+
+    # A second failure within the same round trip doesn't cut again.
+    await limit.acquire()
+    limit.release(0.1, overloaded=True)
+    assert limit.limit == 4
+
+    now[0] += 1
+    await limit.acquire()
+    limit.release(5.0)
+    assert limit.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_back_its_slot():
+    limit = _limit(initial_limit=1)
+    await limit.acquire()
+    waiter = asyncio.ensure_future(limit.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limit.release(None)
+
+    assert limit.in_flight == 0
+    await asyncio.wait_for(limit.acquire(), 1)
+
+
+@pytest.mark.asyncio
+async def test_publish_async_respects_channel_limit():
+    channel = ConcurrencyProbe()
+    concurrency = AdaptiveConcurrency(initial_limit=2, max_limit=2)
+    notify = useNotify([channel], concurrency=concurrency)
+
+    await asyncio.gather(*(notify.publish_async(content=str(index)) for index in range(10)))
+
+    assert channel.peak == 2
+    assert len(channel.async_messages) == 10
+    assert notify.stats().channels["ConcurrencyProbe"].concurrency_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_async_backs_off_on_provider_overload():
+    channel = ConcurrencyProbe(async_failures=[make_http_status_error(429)])
+    concurrency = AdaptiveConcurrency(initial_limit=8)
+    notify = useNotify([channel], max_retries=1, concurrency=concurrency)
+
+    await notify.publish_async(content="hello")
+
+    assert concurrency.limit(channel) == 4
+    assert len(channel.async_messages) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_limit": 0},
+        {"min_limit": 4, "max_limit": 2},
+        {"initial_limit": 100},
+        {"backoff": 1},
+        {"latency_tolerance": 1},
+    ],
+)
+def test_adaptive_concurrency_validates_settings(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(**kwargs)
@@ -1,5 +1,7 @@
 import asyncio
+import gc
 import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
@@ -10,10 +12,12 @@ from use_notify import (
     clear_default_notify_instance,
     get_default_notify_instance,
     notify,
+    notify_block,
     set_default_notify_instance,
     useNotify,
 )
-from use_notify.decorator import NotifyConfigError, NotifyDecorator
+from use_notify.decorator import NotifyConfigError, NotifyDecorator, core
+from use_notify.decorator.aggregator import ExecutionAggregator
 from use_notify.decorator.context import ExecutionContext
 from use_notify.decorator.formatter import MessageFormatter
 from use_notify.decorator.sender import NotificationSender
@@ -406,6 +410,281 @@ class TestNotifyDecorator:
         # 超时应该生效，通知发送失败
         assert len(channel.async_messages) == 0
 
+    def test_aggregate_window_sends_one_summary_per_window(self):
+        channel = RecordingChannel()
+        decorator = notify(notify_instance=useNotify([channel]), aggregate_window=60)
+
+        @decorator
+        def task(fail=False):
+            if fail:
+                raise ValueError("bad input")
+            return "ok"
+
+        for _ in range(5):
+            assert task() == "ok"
+        with pytest.raises(ValueError):
+            task(fail=True)
+
+        assert channel.sync_messages == []
+
+        summary = decorator.flush()
+
+        assert summary.count == 6
+        assert summary.failures == 1
+        assert summary.successes == 5
+        assert summary.error_types == ("ValueError",)
+        assert summary.max_time >= summary.p95 >= summary.p50
+        assert len(channel.sync_messages) == 1
+        assert "执行次数: 6" in channel.sync_messages[0]["content"]
+        assert "ValueError" in channel.sync_messages[0]["content"]
+        assert decorator.flush() is None
+
+    @pytest.mark.asyncio
+    async def test_aggregate_window_flushes_async_calls_when_window_expires(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]), aggregate_window=0.05)
+        async def task():
+            return "ok"
+
+        for _ in range(3):
+            assert await task() == "ok"
+
+        for _ in range(50):
+            if channel.sync_messages:
+                break
+            await asyncio.sleep(0.02)
+
+        assert len(channel.sync_messages) == 1
+        assert "执行次数: 3" in channel.sync_messages[0]["content"]
+        assert channel.async_messages == []
+
+    def test_aggregate_exit_flush_sends_inline_with_retry_overrides(self):
+        threads = []
+
+        class ThreadRecordingChannel(RecordingChannel):
+            def send(self, content, title=None):
+                threads.append(threading.get_ident())
+                super().send(content, title)
+
+        channel = ThreadRecordingChannel(sync_failures=[ConnectionError("down")])
+        decorator = notify(
+            notify_instance=useNotify([channel]), aggregate_window=60, timeout=5, max_retries=1
+        )
+
+        @decorator
+        def task():
+            return "ok"
+
+        task()
+        core._flush_aggregating_decorators()
+
+        assert len(channel.sync_messages) == 2
+        assert threads == [threading.get_ident()] * 2
+        assert decorator.flush() is None
+
+    def test_aggregate_decorators_are_not_kept_alive_for_exit_flush(self):
+        decorator = notify(notify_instance=useNotify([RecordingChannel()]), aggregate_window=60)
+        reference = weakref.ref(decorator)
+
+        del decorator
+        gc.collect()
+
+        assert reference() is None
+
+    def test_aggregate_window_respects_error_only_mode(self):
+        channel = RecordingChannel()
+        decorator = notify(
+            notify_instance=useNotify([channel]), aggregate_window=60, notify_on_success=False
+        )
+
+        @decorator
+        def task():
+            return "ok"
+
+        task()
+        decorator.flush()
+
+        assert channel.sync_messages == []
+
+    def test_generator_notifies_after_full_consumption(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]))
+        def rows():
+            yield 1
+            assert channel.sync_messages == []
+            yield 2
+
+        generator = rows()
+
+        assert channel.sync_messages == []
+        assert list(generator) == [1, 2]
+        assert len(channel.sync_messages) == 1
+        assert "执行成功" in channel.sync_messages[0]["content"]
+
+    def test_generator_error_notifies_and_reraises(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]))
+        def rows():
+            yield 1
+            raise RuntimeError("stream broke")
+
+        with pytest.raises(RuntimeError, match="stream broke"):
+            list(rows())
+
+        assert "stream broke" in channel.sync_messages[0]["content"]
+
+    def test_generator_forwards_send_and_early_close(self):
+        channel = RecordingChannel()
+        received = []
+
+        @notify(notify_instance=useNotify([channel]))
+        def echo():
+            while True:
+                received.append((yield len(received)))
+
+        generator = echo()
+        assert next(generator) == 0
+        assert generator.send("a") == 1
+        generator.close()
+
+        assert received == ["a"]
+        assert channel.sync_messages == []
+
+    def test_generator_abandoned_by_failing_consumer_sends_no_success(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]))
+        def rows():
+            yield from range(10)
+
+        with pytest.raises(ValueError):
+            for row in rows():
+                if row == 3:
+                    raise ValueError("bad row")
+        gc.collect()
+
+        assert channel.sync_messages == []
+
+    @pytest.mark.asyncio
+    async def test_async_generator_notifies_after_full_consumption(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]))
+        async def rows():
+            for value in range(3):
+                await asyncio.sleep(0)
+                yield value
+
+        items = []
+        async for item in rows():
+            assert channel.async_messages == []
+            items.append(item)
+
+        assert items == [0, 1, 2]
+        assert len(channel.async_messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_generator_error_and_throw_are_forwarded(self):
+        channel = RecordingChannel()
+
+        @notify(notify_instance=useNotify([channel]))
+        async def rows():
+            try:
+                yield 1
+            except KeyError:
+                yield "recovered"
+            raise RuntimeError("async stream broke")
+
+        generator = rows()
+        assert await generator.__anext__() == 1
+        assert await generator.athrow(KeyError("retry")) == "recovered"
+        with pytest.raises(RuntimeError, match="async stream broke"):
+            await generator.__anext__()
+
+        assert "async stream broke" in channel.async_messages[0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_async_generator_early_close_sends_nothing(self):
+        channel = RecordingChannel()
+        closed = []
+
+        @notify(notify_instance=useNotify([channel]))
+        async def rows():
+            try:
+                while True:
+                    yield "row"
+            finally:
+                closed.append(True)
+
+        generator = rows()
+        assert await generator.__anext__() == "row"
+        await generator.aclose()
+
+        assert closed == [True]
+        assert channel.async_messages == []
+
+    def test_notify_block_sends_success_with_result(self):
+        channel = RecordingChannel()
+
+        with notify_block(
+            "导出报表", notify_instance=useNotify([channel]), include_result=True
+        ) as context:
+            context.result = {"rows": 3}
+
+        assert channel.sync_messages[0]["title"] == "✅ 导出报表 执行成功"
+        assert '"rows": 3' in channel.sync_messages[0]["content"]
+
+    def test_notify_block_sends_error_and_reraises(self):
+        channel = RecordingChannel()
+
+        with pytest.raises(RuntimeError, match="block failed"):
+            with notify_block("导出报表", notify_instance=useNotify([channel])):
+                raise RuntimeError("block failed")
+
+        assert "block failed" in channel.sync_messages[0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_async_notify_block_uses_async_delivery(self):
+        channel = RecordingChannel()
+
+        async with notify_block("同步数据", notify_instance=useNotify([channel])):
+            await asyncio.sleep(0)
+
+        with pytest.raises(ValueError):
+            async with notify_block("同步数据", notify_instance=useNotify([channel])):
+                raise ValueError("async block failed")
+
+        assert len(channel.async_messages) == 2
+        assert "async block failed" in channel.async_messages[1]["content"]
+
+    def test_decorator_block_shares_aggregation_window(self):
+        channel = RecordingChannel()
+        decorator = notify(notify_instance=useNotify([channel]), aggregate_window=60)
+
+        for _ in range(3):
+            with decorator.block("step"):
+                pass
+
+        summary = decorator.flush()
+
+        assert summary.function_name == "step"
+        assert summary.count == 3
+        assert len(channel.sync_messages) == 1
+
+    def test_notify_block_rejects_empty_name(self):
+        with pytest.raises(NotifyConfigError):
+            notify_block("")
+
+    def test_invalid_aggregate_window_is_rejected(self):
+        with pytest.raises(NotifyConfigError):
+            NotifyDecorator(aggregate_window=0)
+
+        with pytest.raises(NotifyConfigError):
+            NotifyDecorator(aggregate_window=True)
+
 
 def test_message_formatter_includes_args_result_and_truncates_values():
     context = ExecutionContext(
@@ -430,6 +709,27 @@ def test_message_formatter_includes_args_result_and_truncates_values():
     assert "返回结果" in message["content"]
 
 
+def test_aggregator_samples_stay_bounded():
+    flushed = []
+    aggregator = ExecutionAggregator(
+        window=60, on_flush=lambda summary, target: flushed.append(summary)
+    )
+    aggregator.MAX_SAMPLES = 10
+
+    for index in range(100):
+        context = ExecutionContext(function_name="job", start_time=datetime.now())
+        context.mark_success(None)
+        context.execution_time = float(index)
+        aggregator.record(context, lambda: None)
+
+    assert len(aggregator._samples) == 10
+    summary = aggregator.flush()
+
+    assert flushed == [summary]
+    assert summary.count == 100
+    assert summary.max_time == 99.0
+
+
 def test_message_formatter_safe_serialize_fallbacks():
     class BrokenRepr:
         def __repr__(self):
@@ -0,0 +1,243 @@
+import threading
+
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify import DispatcherRejectedError, NotificationDispatcher, notify, useNotify
+from use_notify.dispatch import get_default_dispatcher
+
+
+def _blocking_task(started: threading.Event, release: threading.Event, value="done"):
+    started.set()
+    assert release.wait(timeout=2)
+    return value
+
+
+def test_dispatcher_runs_work_and_reports_completion():
+    dispatcher = NotificationDispatcher(max_workers=2)
+
+    future = dispatcher.submit(lambda left, right: left + right, 1, right=2)
+
+    assert future.result(timeout=1) == 3
+    stats = dispatcher.stats()
+    assert stats.completed == 1
+    assert stats.saturation == 0
+
+
+def test_dispatcher_reject_policy_reports_saturation():
+    dispatcher = NotificationDispatcher(max_workers=1, queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    try:
+        running = dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+        queued = dispatcher.submit(lambda: "queued")
+
+        stats = dispatcher.stats()
+        assert (stats.active, stats.queued) == (1, 1)
+        assert dispatcher.saturation == 1.0
+
+        with pytest.raises(DispatcherRejectedError, match="saturated"):
+            dispatcher.submit(lambda: "rejected")
+        assert dispatcher.stats().rejected == 1
+    finally:
+        release.set()
+
+    assert running.result(timeout=1) == "done"
+    assert queued.result(timeout=1) == "queued"
+
+
+def test_dispatcher_inline_policy_runs_in_caller_thread():
+    dispatcher = NotificationDispatcher(max_workers=1, rejection_policy="inline")
+    started = threading.Event()
+    release = threading.Event()
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+
+        future = dispatcher.submit(threading.current_thread)
+
+        assert future.result(timeout=0) is threading.current_thread()
+    finally:
+        release.set()
+
+
+def test_dispatcher_wait_policy_blocks_until_capacity_frees():
+    dispatcher = NotificationDispatcher(max_workers=1, rejection_policy="wait", wait_timeout=2)
+    started = threading.Event()
+    release = threading.Event()
+
+    dispatcher.submit(_blocking_task, started, release)
+    assert started.wait(timeout=1)
+    threading.Timer(0.05, release.set).start()
+
+    assert dispatcher.submit(lambda: "after-wait").result(timeout=1) == "after-wait"
+
+
+def test_dispatcher_wait_policy_rejects_after_wait_timeout():
+    dispatcher = NotificationDispatcher(max_workers=1, rejection_policy="wait", wait_timeout=0.01)
+    started = threading.Event()
+    release = threading.Event()
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+
+        with pytest.raises(DispatcherRejectedError):
+            dispatcher.submit(lambda: "late")
+    finally:
+        release.set()
+
+
+def test_dispatcher_propagates_exceptions_through_future():
+    dispatcher = NotificationDispatcher()
+
+    future = dispatcher.submit(_raise, RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        future.result(timeout=1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_workers": 0},
+        {"max_workers": True},
+        {"queue_size": -1},
+        {"rejection_policy": "drop"},
+        {"wait_timeout": -1},
+        {"reserved_slots": -1},
+        {"shed_bulk_at": 0},
+        {"shed_bulk_at": 1.5},
+    ],
+)
+def test_dispatcher_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        NotificationDispatcher(**kwargs)
+
+
+def test_notify_submit_uses_injected_dispatcher():
+    channel = RecordingChannel()
+    dispatcher = NotificationDispatcher(max_workers=1)
+    notify_instance = useNotify([channel], dispatcher=dispatcher)
+
+    notify_instance.submit("hello", title="world").result(timeout=1)
+
+    assert notify_instance.get_dispatcher() is dispatcher
+    assert channel.sync_messages == [{"content": "hello", "title": "world"}]
+    assert dispatcher.stats().completed == 1
+    assert useNotify().get_dispatcher() is get_default_dispatcher()
+
+
+def test_dispatcher_runs_queued_work_in_priority_order():
+    dispatcher = NotificationDispatcher(max_workers=1, queue_size=4)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+        futures = [
+            dispatcher.submit_with_priority(priority, order.append, priority)
+            for priority in ("bulk", "normal", "critical", "normal")
+        ]
+    finally:
+        release.set()
+
+    for future in futures:
+        future.result(timeout=1)
+    assert order == ["critical", "normal", "normal", "bulk"]
+
+
+def test_dispatcher_reserves_slots_for_critical_work():
+    dispatcher = NotificationDispatcher(max_workers=1, reserved_slots=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+
+        with pytest.raises(DispatcherRejectedError):
+            dispatcher.submit(lambda: "normal")
+        critical = dispatcher.submit_with_priority("critical", lambda: "critical")
+        assert dispatcher.saturation == 2.0
+    finally:
+        release.set()
+
+    assert critical.result(timeout=1) == "critical"
+
+
+def test_dispatcher_sheds_bulk_work_before_waiting():
+    dispatcher = NotificationDispatcher(
+        max_workers=1, queue_size=1, rejection_policy="wait", shed_bulk_at=0.5
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+
+        with pytest.raises(DispatcherRejectedError, match="shed bulk"):
+            dispatcher.submit_with_priority("bulk", lambda: "bulk")
+        queued = dispatcher.submit(lambda: "normal")
+        assert dispatcher.stats().shed == 1
+    finally:
+        release.set()
+
+    assert queued.result(timeout=1) == "normal"
+    with pytest.raises(ValueError, match="priority"):
+        dispatcher.submit_with_priority("urgent", lambda: None)
+
+
+def test_notify_submit_forwards_priority_to_dispatcher_and_publish():
+    dispatcher = NotificationDispatcher(max_workers=1, queue_size=1, shed_bulk_at=0.5)
+    started = threading.Event()
+    release = threading.Event()
+    notify_instance = useNotify([RecordingChannel()], dispatcher=dispatcher)
+
+    try:
+        dispatcher.submit(_blocking_task, started, release)
+        assert started.wait(timeout=1)
+        with pytest.raises(DispatcherRejectedError):
+            notify_instance.submit("hello", priority="bulk")
+        future = notify_instance.submit("hello", priority="critical")
+    finally:
+        release.set()
+
+    assert future.result(timeout=1) is None
+
+
+def test_decorator_timeout_uses_notify_dispatcher_queue():
+    release = threading.Event()
+
+    class SlowChannel(RecordingChannel):
+        def send(self, content, title=None):
+            assert release.wait(timeout=2)
+            super().send(content, title)
+
+    channel = SlowChannel()
+    dispatcher = NotificationDispatcher(max_workers=1, queue_size=4)
+
+    @notify(notify_instance=useNotify([channel], dispatcher=dispatcher), timeout=0.01)
+    def task():
+        return "ok"
+
+    for _ in range(3):
+        assert task() == "ok"
+
+    assert dispatcher.stats().rejected == 0
+    release.set()
+    for _ in range(100):
+        if len(channel.sync_messages) == 3:
+            break
+        threading.Event().wait(0.01)
+    assert len(channel.sync_messages) == 3
+
+
+def _raise(error):
+    raise error
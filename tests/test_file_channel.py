@@ -0,0 +1,179 @@
+import gc
+import gzip
+import json
+import os
+import threading
+import weakref
+
+import pytest
+
+from use_notify import useNotify
+from use_notify.channels import File
+from use_notify.channels import file as file_module
+from use_notify.channels import get_channel_class
+
+
+def _records(path):
+    with open(path, "rb") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_file_channel_appends_json_lines(tmp_path):
+    path = tmp_path / "audit" / "notify.jsonl"
+    channel = File({"path": str(path)})
+
+    channel.send("第一条", "title")
+    channel.send("second")
+    channel.close()
+
+    records = _records(path)
+    assert [(record["title"], record["content"]) for record in records] == [
+        ("title", "第一条"),
+        (None, "second"),
+    ]
+    assert all(isinstance(record["ts"], float) for record in records)
+
+
+@pytest.mark.asyncio
+async def test_file_channel_send_async_buffers_until_flush(tmp_path):
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path), "buffer_size": 4096})
+
+    await channel.send_async("hello")
+    assert path.read_bytes() == b""
+
+    channel.flush()
+    assert [record["content"] for record in _records(path)] == ["hello"]
+    channel.close()
+
+
+@pytest.mark.asyncio
+async def test_file_channel_send_async_writes_off_the_event_loop(tmp_path, monkeypatch):
+    threads = []
+    send = File.send
+
+    def recording_send(self, content, title=None):
+        threads.append(threading.get_ident())
+        send(self, content, title)
+
+    monkeypatch.setattr(File, "send", recording_send)
+    channel = File({"path": str(tmp_path / "notify.jsonl")})
+
+    await channel.send_async("hello")
+
+    assert threads and threads[0] != threading.get_ident()
+    channel.close()
+
+
+def test_file_channel_writes_each_record_through_by_default(tmp_path):
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path)})
+
+    channel.send("first")
+
+    assert [record["content"] for record in _records(path)] == ["first"]
+    channel.close()
+
+
+def test_file_channel_send_after_close_reopens_and_closes_at_exit(tmp_path):
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path), "buffer_size": 4096})
+
+    channel.send("first")
+    channel.close()
+    channel.send("late")
+    assert [record["content"] for record in _records(path)] == ["first"]
+
+    file_module._close_open_files()
+    assert [record["content"] for record in _records(path)] == ["first", "late"]
+
+
+def test_file_channel_exit_hook_does_not_keep_channels_alive(tmp_path):
+    channel = File({"path": str(tmp_path / "notify.jsonl"), "fsync_interval": 60})
+    channel.send("hello")
+    assert channel in file_module._open_files
+    ref = weakref.ref(channel)
+
+    del channel
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_file_channel_fsyncs_on_interval_without_new_records(tmp_path, monkeypatch):
+    synced = threading.Event()
+    monkeypatch.setattr(file_module.os, "fsync", lambda fd: synced.set())
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path), "fsync_interval": 0.01})
+
+    channel.send("hello")
+    assert synced.wait(2)
+
+    assert [record["content"] for record in _records(path)] == ["hello"]
+    channel.close()
+    assert channel._flusher is None
+
+
+def test_file_channel_fsyncs_in_batches(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(file_module.os, "fsync", synced.append)
+    channel = File({"path": str(tmp_path / "notify.jsonl"), "fsync_every": 3})
+
+    for index in range(7):
+        channel.send(str(index))
+
+    assert len(synced) == 2
+    assert len(_records(tmp_path / "notify.jsonl")) == 6
+    channel.close()
+
+
+def test_file_channel_rotates_by_size_and_compresses(tmp_path):
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path), "rotate_bytes": 200, "compress": True})
+
+    for index in range(10):
+        channel.send("x" * 50, str(index))
+    channel.close()
+
+    rotated = sorted(name for name in os.listdir(tmp_path) if name != "notify.jsonl")
+    assert rotated and all(name.endswith(".gz") for name in rotated)
+    contents = []
+    for name in rotated:
+        with gzip.open(tmp_path / name, "rb") as handle:
+            contents.extend(json.loads(line)["title"] for line in handle)
+    contents.extend(record["title"] for record in _records(path))
+    assert sorted(contents, key=int) == [str(index) for index in range(10)]
+    assert all(os.path.getsize(tmp_path / name) > 0 for name in rotated)
+
+
+def test_file_channel_rotates_by_interval(tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(file_module.time, "monotonic", lambda: now[0])
+    path = tmp_path / "notify.jsonl"
+    channel = File({"path": str(path), "rotate_interval": 60})
+
+    channel.send("before")
+    now[0] += 60
+    channel.send("after")
+    channel.close()
+
+    assert [record["content"] for record in _records(path)] == ["after"]
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_file_channel_is_available_from_settings(tmp_path):
+    assert get_channel_class("file") is File
+
+    notify = useNotify.from_settings({"FILE": {"path": str(tmp_path / "n.jsonl")}})
+    notify.publish(title="title", content="hello")
+    notify.channels[0].close()
+
+    assert _records(tmp_path / "n.jsonl")[0]["content"] == "hello"
+
+
+@pytest.mark.parametrize(
+    "config", [{}, {"path": "x", "rotate_bytes": 0}, {"path": "x", "fsync_interval": -1}]
+)
+def test_file_channel_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        File(config)
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify import AdaptiveConcurrency, RateLimiter, notify, useNotify
+from use_notify.channels.base import BaseChannel
+from use_notify.health import ChannelCounters
+
+
+class BlockingChannel(RecordingChannel):
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def send(self, content, title=None):
+        self.entered.set()
+        self.release.wait(5)
+        super().send(content, title)
+
+
+@dataclass(eq=True)
+class UnhashableChannel(BaseChannel):
+    name: str
+
+    def send(self, content, title=None):
+        pass
+
+    async def send_async(self, content, title=None):
+        pass
+
+
+def test_stats_support_channels_without_hash():
+    first, second = UnhashableChannel("a"), UnhashableChannel("a")
+    notify = useNotify([first, second], concurrency=AdaptiveConcurrency())
+
+    notify.publish(content="hello")
+    asyncio.run(notify.publish_async(content="hello"))
+
+    stats = notify.stats()
+    assert [health.sends for health in stats.channels.values()] == [2, 2]
+    assert all(health.concurrency_limit is not None for health in stats.channels.values())
+
+
+def test_stats_counts_sends_failures_and_retries():
+    flaky = RecordingChannel(sync_failures=[ConnectionError("https://x.test/hook?key=secret")])
+    steady = RecordingChannel()
+    notify = useNotify([flaky, steady], max_retries=1)
+
+    notify.publish(content="hello")
+
+    stats = notify.stats()
+    assert list(stats.channels) == ["RecordingChannel", "RecordingChannel#2"]
+    flaky_health = stats.channels["RecordingChannel"]
+    assert (flaky_health.sends, flaky_health.failures, flaky_health.retries) == (2, 1, 1)
+    assert flaky_health.in_flight == 0
+    assert flaky_health.failure_rate == 0.5
+    assert flaky_health.last_error.startswith("ConnectionError: ")
+    assert "secret" not in flaky_health.last_error
+    assert flaky_health.last_error_at is not None
+    assert flaky_health.ewma_latency is not None
+
+    steady_health = stats.channels["RecordingChannel#2"]
+    assert (steady_health.sends, steady_health.failures, steady_health.last_error) == (1, 0, None)
+    assert stats.rate_limiter_tokens is None
+
+
+@pytest.mark.asyncio
+async def test_stats_cover_async_publishes():
+    channel = RecordingChannel(async_failures=[ValueError("bad")])
+    notify = useNotify([channel])
+
+    with pytest.raises(ValueError):
+        await notify.publish_async(content="hello")
+    await notify.publish_async(content="hello")
+
+    health = notify.stats().channels["RecordingChannel"]
+    assert (health.sends, health.failures, health.retries) == (2, 1, 0)
+
+
+def test_stats_report_in_flight_sends_and_rate_limiter_tokens():
+    channel = BlockingChannel()
+    notify = useNotify([channel], rate_limiter=RateLimiter(rate=1, burst=5))
+    thread = threading.Thread(target=notify.publish, kwargs={"content": "hello"})
+    thread.start()
+    try:
+        assert channel.entered.wait(5)
+        stats = notify.stats()
+        assert stats.channels["BlockingChannel"].in_flight == 1
+        assert 3.9 < stats.rate_limiter_tokens <= 5
+    finally:
+        channel.release.set()
+        thread.join()
+
+    assert notify.stats().channels["BlockingChannel"].in_flight == 0
+
+
+def test_channel_counters_ewma_latency():
+    counters = ChannelCounters()
+    for elapsed in (1.0, 2.0):
+        counters.attempt_started()
+        counters.attempt_finished(elapsed)
+
+    assert counters.snapshot().ewma_latency == pytest.approx(1.2)
+
+
+def test_stats_include_decorator_sends_with_retry_overrides():
+    channel = RecordingChannel(sync_failures=[ConnectionError("down")])
+    notify_instance = useNotify([channel])
+
+    @notify(notify_instance=notify_instance, max_retries=1)
+    def task():
+        return "ok"
+
+    task()
+    task()
+
+    health = notify_instance.stats().channels["RecordingChannel"]
+    assert (health.sends, health.failures, health.retries) == (3, 1, 1)
+
+
+class HangingChannel(RecordingChannel):
+    async def send_async(self, content, title=None):
+        await asyncio.sleep(10)
+
+
+class InterruptedChannel(RecordingChannel):
+    def send(self, content, title=None):
+        raise KeyboardInterrupt
+
+
+def test_cancelled_and_interrupted_sends_leave_no_attempt_in_flight():
+    hanging, interrupted = HangingChannel(), InterruptedChannel()
+    notify = useNotify([hanging, interrupted])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(notify.publish_async(content="hello"), 0.01))
+    with pytest.raises(KeyboardInterrupt):
+        notify.publish(content="hello")
+
+    for health in notify.stats().channels.values():
+        assert (health.in_flight, health.failures) == (0, 0)
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import use_notify
+from use_notify import channels
+
+SRC = str(Path(use_notify.__file__).resolve().parents[1])
+
+# Modules that only the channels sending with them need.
+DEFERRED_MODULES = ("httpx", "smtplib", "email.mime.text", "usepy", "use_notify.channels.ding")
+
+
+def _run_python(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([SRC, os.environ.get("PYTHONPATH", "")]))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def test_import_use_notify_skips_channel_dependencies():
+    result = _run_python("-X", "importtime", "-c", "import use_notify")
+    # importtime lines look like: "import time:  self [us] | cumulative | name"
+    imported = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+    assert "use_notify" in imported
+    assert not imported.intersection(DEFERRED_MODULES)
+
+
+def test_channel_modules_load_on_first_use():
+    # importlib.import_module loads are not reported by -X importtime.
+    result = _run_python(
+        "-c",
+        "import sys; from use_notify import useNotifyChannel; useNotifyChannel.Ding; "
+        "print(*sys.modules, sep=chr(10))",
+    )
+    imported = set(result.stdout.splitlines())
+
+    assert "use_notify.channels.ding" in imported
+    assert "use_notify.channels.email" not in imported
+    assert "httpx" not in imported
+
+
+def test_channel_registry_resolves_lazily():
+    assert channels.CHANNEL_REGISTRY["ding"] is channels.Ding
+    assert channels.get_channel_class("WeCom") is channels.WeCom is channels.WeChat
+    assert channels.get_channel_class("missing") is None
+    assert "feishu" in channels.CHANNEL_REGISTRY
+    assert "Email" in dir(channels)
+
+    with pytest.raises(AttributeError):
+        channels.Missing
+
+
+def test_channel_registry_accepts_custom_channels():
+    class Custom(channels.BaseChannel):
+        def send(self, content, title=None):
+            pass
+
+        async def send_async(self, content, title=None):
+            pass
+
+    channels.CHANNEL_REGISTRY["custom"] = Custom
+    try:
+        assert channels.get_channel_class("Custom") is Custom
+    finally:
+        del channels.CHANNEL_REGISTRY["custom"]
+
+    assert channels.get_channel_class("custom") is None
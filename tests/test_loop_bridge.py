@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import httpx
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify import EventLoopBridge, NotificationPublishError, get_default_loop_bridge
+from use_notify.notification import Publisher
+
+
+class LoopRecordingChannel(RecordingChannel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loops = []
+
+    async def send_async(self, content, title=None):
+        self.loops.append(asyncio.get_running_loop())
+        await super().send_async(content, title)
+
+
+@pytest.fixture
+def bridge():
+    loop_bridge = EventLoopBridge()
+    yield loop_bridge
+    loop_bridge.close()
+
+
+def test_bridge_reuses_one_loop_across_runs(bridge):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = bridge.run(current_loop())
+    second = bridge.run(current_loop())
+
+    assert first is second is bridge.loop
+    assert not bridge.in_loop_thread()
+
+
+def test_bridge_restarts_after_close(bridge):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = bridge.run(current_loop())
+    bridge.close()
+    bridge.close()
+
+    assert bridge.run(current_loop()) is not first
+
+
+def test_bridge_run_times_out_and_cancels(bridge):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(FutureTimeoutError):
+        bridge.run(slow(), timeout=0.01)
+
+    assert cancelled.wait(timeout=1)
+
+
+def test_bridge_close_cancels_pending_runs(bridge):
+    started = threading.Event()
+    cleaned_up = threading.Event()
+    errors = []
+
+    async def pending():
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        finally:
+            cleaned_up.set()
+
+    def run_pending():
+        try:
+            bridge.run(pending())
+        except BaseException as error:
+            errors.append(error)
+
+    caller = threading.Thread(target=run_pending)
+    caller.start()
+    assert started.wait(timeout=1)
+    bridge.close()
+    caller.join(timeout=1)
+
+    assert not caller.is_alive()
+    assert cleaned_up.is_set()
+    assert isinstance(errors[0], CancelledError)
+
+
+def test_bridge_rejects_blocking_inside_its_own_loop(bridge):
+    async def nested():
+        return bridge.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="own loop thread"):
+        bridge.run(nested())
+
+
+def test_publish_with_bridge_runs_channels_on_shared_loop(bridge):
+    first = LoopRecordingChannel()
+    second = LoopRecordingChannel()
+    publisher = Publisher([first, second], loop_bridge=bridge)
+
+    publisher.publish("hello", title="world")
+    publisher.publish("again")
+
+    assert first.async_messages[0] == {"content": "hello", "title": "world"}
+    assert len(second.async_messages) == 2
+    assert first.sync_messages == []
+    assert first.loops[0] is first.loops[1] is second.loops[0] is bridge.loop
+
+
+def test_publish_with_bridge_raises_aggregate_errors(bridge):
+    failing_one = LoopRecordingChannel(async_failures=[httpx.ConnectError("one")])
+    failing_two = LoopRecordingChannel(async_failures=[httpx.ConnectError("two")])
+    publisher = Publisher([failing_one, failing_two], loop_bridge=bridge)
+
+    with pytest.raises(NotificationPublishError):
+        publisher.publish("hello")
+
+
+def test_default_loop_bridge_is_shared():
+    assert get_default_loop_bridge() is get_default_loop_bridge()
@@ -0,0 +1,268 @@
+import asyncio
+import types
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tests.helpers import RecordingChannel, make_http_status_error
+from use_notify import InMemoryMetrics, MetricsSink, OpenTelemetryMetrics, PrometheusMetrics
+from use_notify.channels import Ding
+from use_notify.metrics import Histogram, current_metrics_sink
+from use_notify.notification import Publisher
+
+
+class EventSink(MetricsSink):
+    def __init__(self):
+        self.events = []
+
+    def send_started(self, channel, attempt):
+        self.events.append(("started", channel, attempt))
+
+    def send_finished(self, channel, attempt, elapsed, outcome, status_code=None, error=None):
+        assert elapsed >= 0
+        self.events.append(("finished", channel, attempt, outcome, status_code))
+
+    def retry_scheduled(self, channel, attempt, delay, error):
+        self.events.append(("retry", channel, attempt, delay))
+
+    def http_request_finished(self, channel, status_code, bytes_sent, elapsed):
+        self.events.append(("http", channel, status_code, bytes_sent))
+
+
+def test_publish_reports_attempts_retries_and_outcomes():
+    sink = EventSink()
+    channel = RecordingChannel(sync_failures=[make_http_status_error(503)])
+    publisher = Publisher([channel], max_retries=1, retry_delay=0.25, metrics=sink)
+
+    publisher.publish(content="hello")
+
+    assert sink.events == [
+        ("started", "RecordingChannel", 1),
+        ("finished", "RecordingChannel", 1, "failure", 503),
+        ("retry", "RecordingChannel", 1, 0.25),
+        ("started", "RecordingChannel", 2),
+        ("finished", "RecordingChannel", 2, "success", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_async_reports_final_failure():
+    sink = EventSink()
+    channel = RecordingChannel(async_failures=[ValueError("bad payload")])
+    publisher = Publisher([channel], max_retries=2, metrics=sink)
+
+    with pytest.raises(ValueError):
+        await publisher.publish_async(content="hello")
+
+    assert sink.events == [
+        ("started", "RecordingChannel", 1),
+        ("finished", "RecordingChannel", 1, "failure", None),
+    ]
+
+
+class HangingChannel(RecordingChannel):
+    async def send_async(self, content, title=None):
+        await asyncio.sleep(10)
+
+
+def test_cancelled_publish_reports_a_cancelled_finish():
+    sink, metrics = EventSink(), InMemoryMetrics()
+
+    for target in (sink, metrics):
+        publisher = Publisher([HangingChannel()], metrics=target)
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(publisher.publish_async(content="hello"), 0.01))
+
+    assert sink.events == [
+        ("started", "HangingChannel", 1),
+        ("finished", "HangingChannel", 1, "cancelled", None),
+    ]
+    snapshot = metrics.snapshot()["HangingChannel"]
+    assert (snapshot["attempts"], snapshot["cancelled"], snapshot["failures"]) == (1, 1, 0)
+    assert snapshot["latency"]["count"] == 0
+
+
+def test_sink_is_only_active_during_publish():
+    seen = []
+
+    class SinkProbeChannel(RecordingChannel):
+        def send(self, content, title=None):
+            seen.append(current_metrics_sink())
+
+    sink = MetricsSink()
+    Publisher([SinkProbeChannel()], metrics=sink).publish(content="hello")
+    Publisher([SinkProbeChannel()]).publish(content="hello")
+
+    assert seen == [sink, None]
+    assert current_metrics_sink() is None
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+@patch("httpx.AsyncClient")
+@patch("httpx.Client")
+def test_http_channel_reports_status_and_request_bytes(mock_client, mock_async_client, is_async):
+    request = httpx.Request("POST", "https://example.com", json={"msgtype": "markdown"})
+    response = httpx.Response(200, json={"errcode": 0}, request=request)
+    mock_client.return_value.__enter__.return_value.post.return_value = response
+
+    async def post(*args, **kwargs):
+        return response
+
+    mock_async_client.return_value.__aenter__.return_value.post = post
+    metrics = InMemoryMetrics()
+    publisher = Publisher([Ding({"token": "token"})], metrics=metrics)
+
+    if is_async:
+        asyncio.run(publisher.publish_async(content="hello"))
+    else:
+        publisher.publish(content="hello")
+
+    snapshot = metrics.snapshot()["Ding"]
+    assert snapshot["status_codes"] == {200: 1}
+    assert snapshot["bytes_sent"] == len(request.content)
+    assert snapshot["attempts"] == snapshot["successes"] == 1
+
+
+def test_in_memory_metrics_counts_per_channel():
+    metrics = InMemoryMetrics()
+    failing = RecordingChannel(sync_failures=[ConnectionError("down")] * 3)
+    publisher = Publisher([RecordingChannel(), failing], max_retries=2, metrics=metrics)
+
+    with pytest.raises(ConnectionError):
+        publisher.publish(content="hello")
+
+    snapshot = metrics.snapshot()["RecordingChannel"]
+    assert snapshot["attempts"] == 4
+    assert snapshot["successes"] == 1
+    assert snapshot["failures"] == 3
+    assert snapshot["retries"] == 2
+    assert snapshot["latency"]["count"] == 4
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.percentile(0.75) == 1.0
+    assert histogram.percentile(0.99) == 3.0
+    assert Histogram().percentile(0.5) == 0.0
+
+
+def test_optional_adapters_explain_missing_dependency():
+    with patch.dict("sys.modules", {"prometheus_client": None}):
+        with pytest.raises(ImportError, match="pip install prometheus-client"):
+            PrometheusMetrics()
+    with patch.dict("sys.modules", {"opentelemetry": None}):
+        with pytest.raises(ImportError, match="pip install opentelemetry-api"):
+            OpenTelemetryMetrics()
+
+
+class FakeMetric:
+    """Records ``labels(...)`` children and their observations."""
+
+    def __init__(self, name, documentation, labelnames, **options):
+        self.name = name
+        self.labelnames = tuple(labelnames)
+        self.options = options
+        self.values = {}
+
+    def labels(self, *values):
+        assert len(values) == len(self.labelnames)
+        return FakeChild(self.values.setdefault(values, []))
+
+
+class FakeChild:
+    def __init__(self, values):
+        self._values = values
+
+    def observe(self, value):
+        self._values.append(value)
+
+    def inc(self, amount=1):
+        self._values.append(amount)
+
+
+class FakeInstrument:
+    def __init__(self, name, **options):
+        self.name = name
+        self.options = options
+        self.values = []
+
+    def record(self, value, attributes):
+        self.values.append((value, attributes))
+
+    add = record
+
+
+class FakeMeter:
+    def __init__(self, name):
+        self.name = name
+        self.instruments = {}
+
+    def _create(self, name, **options):
+        instrument = self.instruments[name] = FakeInstrument(name, **options)
+        return instrument
+
+    create_histogram = create_counter = _create
+
+
+def test_prometheus_metrics_record_labelled_counters_and_histogram():
+    prometheus_client = types.ModuleType("prometheus_client")
+    prometheus_client.Histogram = prometheus_client.Counter = FakeMetric
+    registry = object()
+
+    with patch.dict("sys.modules", {"prometheus_client": prometheus_client}):
+        sink = PrometheusMetrics(registry=registry, namespace="alerts", buckets=(0.1, 1.0))
+
+    sink.send_finished("Ding", 1, 0.2, "failure", 503, RuntimeError("busy"))
+    sink.send_finished("Ding", 2, 0.05, "success")
+    sink.retry_scheduled("Ding", 1, 0.5, RuntimeError("busy"))
+    sink.http_request_finished("Ding", 200, 42, 0.05)
+
+    assert sink._latency.name == "send_duration_seconds"
+    assert sink._latency.labelnames == ("channel", "outcome")
+    assert sink._latency.options == {
+        "buckets": (0.1, 1.0),
+        "namespace": "alerts",
+        "registry": registry,
+    }
+    assert sink._latency.values == {("Ding", "failure"): [0.2], ("Ding", "success"): [0.05]}
+    assert sink._retries.values == {("Ding",): [1]}
+    assert sink._responses.values == {("Ding", "200"): [1]}
+    assert sink._bytes_sent.values == {("Ding",): [42]}
+
+
+def test_opentelemetry_metrics_record_instruments_with_attributes():
+    opentelemetry = types.ModuleType("opentelemetry")
+    otel_metrics = types.ModuleType("opentelemetry.metrics")
+    meters = []
+    otel_metrics.get_meter = lambda name: meters.append(FakeMeter(name)) or meters[-1]
+    opentelemetry.metrics = otel_metrics
+    modules = {"opentelemetry": opentelemetry, "opentelemetry.metrics": otel_metrics}
+
+    with patch.dict("sys.modules", modules):
+        sink = OpenTelemetryMetrics()
+
+    sink.send_finished("Ding", 1, 0.2, "failure", 503)
+    sink.retry_scheduled("Ding", 1, 0.5, RuntimeError("busy"))
+    sink.http_request_finished("Ding", 200, 42, 0.05)
+
+    (meter,) = meters
+    assert meter.name == "use_notify"
+    instruments = meter.instruments
+    assert instruments["use_notify.send.duration"].options["unit"] == "s"
+    assert instruments["use_notify.send.duration"].values == [
+        (0.2, {"channel": "Ding", "outcome": "failure"})
+    ]
+    assert instruments["use_notify.send.retries"].values == [(1, {"channel": "Ding"})]
+    assert instruments["use_notify.http.responses"].values == [
+        (1, {"channel": "Ding", "status_code": 200})
+    ]
+    assert instruments["use_notify.http.request_bytes"].values == [(42, {"channel": "Ding"})]
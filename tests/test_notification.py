@@ -1,4 +1,5 @@
 import asyncio
+import pickle
 import smtplib
 import threading
 
@@ -190,6 +191,95 @@ async def test_publisher_aggregates_async_failures_after_other_channels_continue
     assert len(error_info.value.failures) == 2
 
 
+def test_publish_error_records_structured_failures():
+    failing_http = RecordingChannel(
+        sync_failures=[make_http_status_error(503), make_http_status_error(503)]
+    )
+    failing_config = RecordingChannel(sync_failures=[ValueError("bad config")])
+    publisher = Publisher([failing_http, failing_config], max_retries=1)
+
+    with pytest.raises(NotificationPublishError) as error_info:
+        publisher.publish("hello")
+
+    http_record, config_record = error_info.value.records
+    assert http_record.channel == "RecordingChannel"
+    assert http_record.status_code == 503
+    assert http_record.attempts == 2
+    assert http_record.elapsed >= 0
+    assert config_record.status_code is None
+    assert config_record.attempts == 1
+    assert error_info.value.failures == [
+        ("RecordingChannel", http_record.error),
+        ("RecordingChannel", config_record.error),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_async_error_records_attempts():
+    failing_one = RecordingChannel(
+        async_failures=[httpx.ConnectError("one"), httpx.ConnectError("one")]
+    )
+    failing_two = RecordingChannel(async_failures=[smtplib.SMTPResponseException(550, b"no")])
+    publisher = Publisher([failing_one, failing_two], max_retries=1)
+
+    with pytest.raises(NotificationPublishError) as error_info:
+        await publisher.publish_async("hello")
+
+    assert [record.attempts for record in error_info.value.records] == [2, 1]
+    assert [record.status_code for record in error_info.value.records] == [None, 550]
+
+
+def test_publish_error_message_is_redacted_lazily_and_cached(monkeypatch):
+    calls = []
+
+    def counting_redact(value):
+        calls.append(value)
+        return redact_text(value)
+
+    monkeypatch.setattr(notification_module, "redact_text", counting_redact)
+    error = NotificationPublishError(
+        [
+            ("Bark", RuntimeError("failed https://api.day.app/bark-secret-token")),
+            ("Ding", RuntimeError("timeout")),
+        ]
+    )
+
+    assert calls == []
+    assert error.records[0].channel == "Bark"
+
+    message = str(error)
+
+    assert "bark-secret-token" not in message
+    assert str(error) is message
+    assert len(calls) == 2
+
+
+def test_publish_error_survives_pickling():
+    error = NotificationPublishError([("Bark", RuntimeError("one")), ("Ding", RuntimeError("two"))])
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert str(restored) == str(error)
+    assert [record.channel for record in restored.records] == ["Bark", "Ding"]
+
+
+def test_publish_error_keeps_args_repr_and_assignable_failures():
+    error = NotificationPublishError(
+        [("Bark", RuntimeError("failed https://api.day.app/bark-secret-token"))]
+    )
+
+    assert error.args == (error.records,)
+    assert repr(error).startswith("NotificationPublishError('Failed to publish")
+    assert "bark-secret-token" not in repr(error)
+    assert str(NotificationPublishError(*error.args)) == str(error)
+
+    error.failures = [("Ding", RuntimeError("timeout"))]
+
+    assert error.failures[0][0] == "Ding"
+    assert error.records[0].channel == "Ding"
+    assert str(error) == "Failed to publish notification via: Ding: timeout"
+
+
 def test_single_channel_failure_redacts_secret_from_exception_message():
     request = httpx.Request(
         "POST",
@@ -267,6 +357,27 @@ def test_redaction_keeps_ordinary_single_segment_urls_visible():
     assert redact_text(message) == message
 
 
+def test_redaction_returns_text_without_url_or_query_markers_unchanged():
+    message = "Connection reset by peer"
+
+    assert redact_text(message) is message
+
+
+def test_redaction_handles_overlapping_provider_paths_in_one_scan():
+    message = (
+        "failed https://ntfy.sh/open-apis/bot/v2/hook/hook-secret "
+        "and https://example.com/a&token=query-secret#frag"
+    )
+
+    redacted = redact_text(message)
+
+    assert "hook-secret" not in redacted
+    assert "query-secret" not in redacted
+    assert "https://ntfy.sh/<redacted>/bot/v2/hook/<redacted>" in redacted
+    assert "https://example.com/<redacted>" in redacted
+    assert redacted.count("<redacted>") == 3
+
+
 def test_publisher_copies_initial_channel_collection():
     initial_channels = [RecordingChannel()]
     publisher = Publisher(initial_channels)
@@ -0,0 +1,168 @@
+import multiprocessing
+
+import pytest
+
+from tests.helpers import RecordingChannel
+from use_notify import RateLimitedError, RateLimiter, SharedRateLimiter, notify, useNotify
+from use_notify.ratelimit import time as ratelimit_time
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the limiter's clock; sleeping advances it."""
+    now = [1000.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(ratelimit_time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit_time, "sleep", sleep)
+    return now
+
+
+def test_reserved_tokens_are_only_used_by_critical(clock):
+    limiter = RateLimiter(rate=1, burst=3, reserved=1, max_wait=0)
+
+    assert limiter.acquire("normal")
+    assert limiter.acquire("bulk")
+    assert not limiter.acquire("normal")
+    assert not limiter.acquire("bulk")
+    assert limiter.acquire("critical")
+    assert not limiter.acquire("critical")
+
+
+def test_normal_waits_for_refill_but_bulk_is_shed(clock):
+    limiter = RateLimiter(rate=2, burst=1)
+    assert limiter.acquire()
+
+    assert not limiter.acquire("bulk")
+    started = clock[0]
+    assert limiter.acquire("normal")
+    assert clock[0] - started == pytest.approx(0.5)
+
+
+def test_max_wait_bounds_blocking(clock):
+    limiter = RateLimiter(rate=1, burst=1, max_wait=0.25)
+    assert limiter.acquire()
+
+    started = clock[0]
+    assert not limiter.acquire()
+    assert clock[0] - started == pytest.approx(0.25)
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_sheds_bulk_and_admits_critical(clock):
+    limiter = RateLimiter(rate=1, burst=2, reserved=1)
+
+    assert await limiter.acquire_async("bulk")
+    assert not await limiter.acquire_async("bulk")
+    assert await limiter.acquire_async("critical")
+
+
+def test_publish_sheds_bulk_when_rate_limited(clock):
+    channel = RecordingChannel()
+    notify_instance = useNotify([channel], rate_limiter=RateLimiter(rate=1, burst=2, reserved=1))
+
+    notify_instance.publish("first", priority="bulk")
+    with pytest.raises(RateLimitedError, match="bulk"):
+        notify_instance.publish("second", priority="bulk")
+    notify_instance.publish("alert", priority="critical")
+
+    assert [message["content"] for message in channel.sync_messages] == ["first", "alert"]
+
+
+@pytest.mark.asyncio
+async def test_publish_async_applies_rate_limit(clock):
+    channel = RecordingChannel()
+    notify_instance = useNotify([channel], rate_limiter=RateLimiter(rate=1, burst=1))
+
+    await notify_instance.publish_async("first")
+    with pytest.raises(RateLimitedError):
+        await notify_instance.publish_async("second", priority="bulk")
+
+    assert len(channel.async_messages) == 1
+
+
+def test_publish_rejects_unknown_priority():
+    with pytest.raises(ValueError, match="priority"):
+        useNotify([RecordingChannel()]).publish("hello", priority="urgent")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rate": 0},
+        {"rate": 1, "burst": 0.5},
+        {"rate": 1, "burst": 2, "reserved": 2},
+        {"rate": 1, "max_wait": -1},
+    ],
+)
+def test_rate_limiter_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+def test_decorator_sends_successes_as_bulk_and_errors_as_critical(clock):
+    channel = RecordingChannel()
+    limiter = RateLimiter(rate=1, burst=2, reserved=1)
+    notify_instance = useNotify([channel], rate_limiter=limiter)
+
+    @notify(notify_instance=notify_instance)
+    def job(fail=False):
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    job()
+    job()
+    with pytest.raises(RuntimeError):
+        job(fail=True)
+
+    titles = [message["title"] for message in channel.sync_messages]
+    assert titles == ["✅ job 执行成功", "❌ job 执行失败"]
+
+
+def test_shared_rate_limiter_shares_tokens_through_the_state_file(clock, tmp_path):
+    path = tmp_path / "notify.rl"
+    first = SharedRateLimiter(path, rate=1, burst=3, max_wait=0)
+    second = SharedRateLimiter(path, rate=1, burst=3, max_wait=0)
+
+    assert first.acquire()
+    assert second.acquire()
+    assert first.acquire()
+    assert not second.acquire()
+    assert first.tokens() == pytest.approx(0)
+
+    clock[0] += 1
+    assert second.tokens() == pytest.approx(1)
+    assert first.acquire()
+    assert not second.acquire()
+    first.close()
+    second.close()
+
+
+def test_shared_rate_limiter_rejects_foreign_state_file(tmp_path):
+    path = tmp_path / "notify.rl"
+    path.write_bytes(b"not a limiter state file")
+
+    with pytest.raises(ValueError, match="not a rate limiter state file"):
+        SharedRateLimiter(path, rate=1)
+
+
+def _take_tokens(path, attempts, results):
+    limiter = SharedRateLimiter(path, rate=0.001, burst=20, max_wait=0)
+    results.put(sum(limiter.acquire() for _ in range(attempts)))
+
+
+def test_shared_rate_limiter_budget_spans_processes(tmp_path):
+    path = str(tmp_path / "notify.rl")
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    workers = [context.Process(target=_take_tokens, args=(path, 10, results)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    taken = sum(results.get(timeout=30) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert taken == 20
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from use_notify import NotificationPublishError, useNotify
+from use_notify.channels import Ding, Feishu, WeChat
+from use_notify.channels.splitting import json_text_size, split_text, utf8_size
+
+
+def test_split_text_breaks_on_line_boundaries():
+    chunks = split_text("aaa\nbbb\nccc\nddd", 7, utf8_size)
+
+    assert chunks == ["aaa\nbbb", "ccc\nddd"]
+
+
+def test_split_text_cuts_overlong_lines_by_character():
+    chunks = split_text("short\n" + "告" * 5 + "\nend", 10, utf8_size)
+
+    assert chunks == ["short", "告告告", "告告\nend"]
+    assert all(utf8_size(chunk) <= 10 for chunk in chunks)
+
+
+def test_split_text_rejects_budget_without_room():
+    with pytest.raises(ValueError, match="no room"):
+        split_text("hello", 0, utf8_size)
+
+
+def test_json_text_size_counts_escapes():
+    assert json_text_size('a"\n告') == len('a\\"\\n'.encode()) + len("告".encode())
+
+
+def test_messages_within_limit_are_not_split():
+    assert WeChat({"token": "t"}).split_message("hello", "title") == [("hello", "title")]
+
+
+def test_wechat_split_parts_fit_the_markdown_limit():
+    channel = WeChat({"token": "t"})
+    content = "\n".join(f"第 {i} 行告警详情" for i in range(600))
+
+    parts = channel.split_message(content, "巡检")
+
+    assert len(parts) > 1
+    assert [title for _, title in parts] == [
+        f"巡检 ({i}/{len(parts)})" for i in range(1, len(parts) + 1)
+    ]
+    assert all(channel.message_size(*part) <= 4096 for part in parts)
+    assert "\n".join(chunk for chunk, _ in parts) == content
+
+
+@pytest.mark.parametrize("channel_cls", [Ding, Feishu])
+def test_json_channels_split_on_encoded_body_size(channel_cls):
+    channel = channel_cls({"token": "t"})
+    content = "\n".join("x" * 100 for _ in range(400))
+
+    parts = channel.split_message(content)
+
+    assert len(parts) > 1
+    assert all(channel.message_size(*part) <= channel.max_message_bytes for part in parts)
+
+
+@pytest.mark.parametrize("channel_cls", [Ding, Feishu])
+def test_split_parts_number_the_default_title(channel_cls):
+    channel = channel_cls({"token": "t"})
+    content = "\n".join("x" * 100 for _ in range(400))
+
+    parts = channel.split_message(content)
+
+    assert parts[0][1] == f"消息提醒 (1/{len(parts)})"
+
+
+def test_oversized_message_is_sent_as_ordered_parts(http_transport):
+    content = "\n".join("y" * 1000 for _ in range(10))
+
+    WeChat({"token": "t"}).send(content, "report")
+
+    titles = [
+        json.loads(request.content)["markdown"]["content"].split("\n", 1)[0]
+        for request in http_transport.requests
+    ]
+    assert titles == ["## report (1/3)", "## report (2/3)", "## report (3/3)"]
+
+
+@pytest.mark.asyncio
+async def test_failed_later_part_is_reported_without_retrying(http_transport):
+    http_transport.fail_when = lambda request: b"(2/3)" in request.content
+    content = "\n".join("y" * 1000 for _ in range(10))
+
+    with pytest.raises(NotificationPublishError) as error_info:
+        await WeChat({"token": "t"}).send_async(content, "report")
+
+    assert [name for name, _ in error_info.value.failures] == ["WeChat(part 2/3)"]
+    assert len(http_transport.requests) == 2
+
+
+def test_publisher_does_not_resend_parts_after_later_part_fails(http_transport):
+    http_transport.fail_when = lambda request: b"(2/3)" in request.content
+    http_transport.fail_status = 503
+    content = "\n".join("y" * 1000 for _ in range(10))
+
+    with pytest.raises(NotificationPublishError):
+        useNotify([WeChat({"token": "t"})], max_retries=2).publish(content, "report")
+
+    assert len(http_transport.requests) == 2
@@ -0,0 +1,141 @@
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tests.helpers import RecordingChannel, make_http_status_error
+from use_notify import NotificationPublishError
+from use_notify.channels import Ding, Webhook
+from use_notify.notification import Publisher
+from use_notify.tracing import current_span, get_tracer
+
+
+class FakeSpan:
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.events = []
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_event(self, name, attributes=None):
+        self.events.append((name, attributes))
+
+    def set_status(self, status):
+        self.status = status
+
+
+class FakeTracer:
+    """Records spans with their parent, like an OpenTelemetry SDK tracer."""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None, **kwargs):
+        span = FakeSpan(name, attributes, self._stack[-1] if self._stack else None)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.remove(span)
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+def test_publish_emits_publish_channel_and_attempt_spans():
+    tracer = FakeTracer()
+    channel = RecordingChannel(sync_failures=[make_http_status_error(503)])
+    Publisher([channel], max_retries=1, tracer=tracer).publish(content="hello")
+
+    (publish,) = tracer.named("use_notify.publish")
+    (channel_span,) = tracer.named("use_notify.channel")
+    attempts = tracer.named("use_notify.attempt")
+
+    assert publish.attributes == {"use_notify.channels": 1}
+    assert channel_span.parent is publish
+    assert channel_span.attributes == {"use_notify.channel": "RecordingChannel"}
+    assert [span.attributes["use_notify.attempt"] for span in attempts] == [1, 2]
+    assert all(span.parent is channel_span for span in attempts)
+    assert attempts[0].events[0][0] == "exception"
+    assert attempts[1].events == []
+
+
+@pytest.mark.asyncio
+async def test_publish_async_spans_nest_per_channel_and_redact_errors():
+    tracer = FakeTracer()
+    failing = RecordingChannel(
+        async_failures=[ValueError("POST https://x/robot/send?access_token=secret failed")]
+    )
+    publisher = Publisher([RecordingChannel(), failing], tracer=tracer)
+
+    with pytest.raises(ValueError):
+        await publisher.publish_async(content="hello")
+
+    (publish,) = tracer.named("use_notify.publish")
+    channel_spans = tracer.named("use_notify.channel")
+    assert len(channel_spans) == 2
+    assert all(span.parent is publish for span in channel_spans)
+    event_name, attributes = publish.events[0]
+    assert event_name == "exception"
+    assert "secret" not in attributes["exception.message"]
+    assert current_span() is None
+
+
+def test_publish_error_is_recorded_on_publish_span():
+    tracer = FakeTracer()
+    channels = [RecordingChannel(sync_failures=[ValueError("a")]) for _ in range(2)]
+
+    with pytest.raises(NotificationPublishError):
+        Publisher(channels, tracer=tracer).publish(content="hello")
+
+    (publish,) = tracer.named("use_notify.publish")
+    assert publish.events[0][1]["exception.type"] == "NotificationPublishError"
+
+
+@patch("httpx.Client")
+def test_http_channel_adds_trace_extension_and_status(mock_client):
+    request = httpx.Request("POST", "https://example.com")
+    client = mock_client.return_value.__enter__.return_value
+    client.post.return_value = httpx.Response(200, json={"errcode": 0}, request=request)
+    tracer = FakeTracer()
+
+    Publisher([Ding({"token": "token"})], tracer=tracer).publish(content="hello")
+
+    (attempt,) = tracer.named("use_notify.attempt")
+    trace_hook = client.post.call_args.kwargs["extensions"]["trace"]
+    trace_hook("connection.start_tls.complete", {})
+    assert attempt.attributes["http.response.status_code"] == 200
+    assert attempt.events == [("connection.start_tls.complete", None)]
+
+
+@patch("httpx.Client")
+def test_http_channel_omits_trace_extension_without_tracer(mock_client):
+    client = mock_client.return_value.__enter__.return_value
+    client.post.return_value.json.return_value = {"errcode": 0}
+
+    Publisher([Ding({"token": "token"})]).publish(content="hello")
+
+    assert "extensions" not in client.post.call_args.kwargs
+
+
+def test_get_tracer_is_none_without_opentelemetry():
+    with patch.dict("sys.modules", {"opentelemetry": None}):
+        assert get_tracer() is None
+
+
+def test_webhook_put_requests_carry_trace_extension(http_transport):
+    channel = Webhook({"url": "https://hooks.example.com/notify", "method": "PUT"})
+
+    Publisher([channel], tracer=FakeTracer()).publish(content="hello")
+
+    (request,) = http_transport.requests
+    assert request.method == "PUT"
+    assert "trace" in request.extensions
+    channel.close()
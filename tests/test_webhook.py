@@ -0,0 +1,136 @@
+import asyncio
+import gc
+import json
+
+import pytest
+
+from use_notify import useNotify
+from use_notify.channels import Webhook, get_channel_class
+from use_notify.channels.utils import ProviderResponseError
+from use_notify.channels.webhook import compile_template
+
+
+def test_compile_template_fills_placeholders_and_escapes_values():
+    render = compile_template(
+        {"text": "**{title}**\n{content}", "tags": ["{content}", 1, None], "raw": "{{x}}"}
+    )
+
+    body = render('say "hi"\n告警', "标题")
+
+    assert json.loads(body) == {
+        "text": '**标题**\nsay "hi"\n告警',
+        "tags": ['say "hi"\n告警', 1, None],
+        "raw": "{x}",
+    }
+
+
+def test_compile_template_without_placeholders_returns_constant_body():
+    render = compile_template({"static": True})
+
+    assert render("a") is render("b")
+
+
+def test_compile_template_rejects_unknown_placeholders():
+    with pytest.raises(ValueError, match="Unsupported template placeholder"):
+        compile_template({"text": "{user}"})
+
+
+def test_webhook_posts_rendered_template_with_headers(http_transport):
+    channel = Webhook(
+        {
+            "url": "https://hooks.example.com/notify",
+            "headers": {"Authorization": "Bearer t"},
+            "payload": {"text": "{title}: {content}"},
+        }
+    )
+
+    channel.send("hello", "title")
+
+    (request,) = http_transport.requests
+    assert request.method == "POST"
+    assert str(request.url) == "https://hooks.example.com/notify"
+    assert request.headers["authorization"] == "Bearer t"
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == {"text": "title: hello"}
+
+
+def test_webhook_reuses_one_pooled_client(http_transport):
+    channel = Webhook({"url": "https://hooks.example.com/notify"})
+
+    channel.send("one")
+    client = channel._pooled_client
+    channel.send("two")
+
+    assert client is not None and channel._pooled_client is client
+    assert [json.loads(request.content)["content"] for request in http_transport.requests] == [
+        "one",
+        "two",
+    ]
+    channel.close()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_webhook_async_supports_put_and_callable_url(http_transport):
+    channel = Webhook(
+        {"url": lambda: "https://hooks.example.com/put", "method": "put", "payload": None}
+    )
+
+    await channel.send_async("ok")
+    assert http_transport.requests[0].method == "PUT"
+    assert str(http_transport.requests[0].url) == "https://hooks.example.com/put"
+    await channel.aclose()
+
+
+def test_webhook_closes_each_loops_client_when_the_loop_shuts_down(http_transport):
+    channel = Webhook({"url": "https://hooks.example.com/notify"})
+    clients = []
+
+    async def send(content):
+        await channel.send_async(content)
+        clients.extend(client for client, _ in channel._async_pools.values())
+
+    asyncio.run(send("one"))
+    asyncio.run(send("two"))
+
+    first, second = clients[0], clients[-1]
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert len(http_transport.requests) == 2
+
+
+def test_webhook_does_not_keep_finished_loops_alive(http_transport):
+    channel = Webhook({"url": "https://hooks.example.com/notify"})
+
+    for _ in range(5):
+        asyncio.run(channel.send_async("hello"))
+    gc.collect()
+
+    assert len(channel._async_pools) == 0
+    assert len(http_transport.requests) == 5
+
+
+def test_webhook_validates_business_response(http_transport):
+    channel = Webhook(
+        {"url": "https://hooks.example.com/notify", "success_fields": {"errcode": [1]}}
+    )
+
+    with pytest.raises(ProviderResponseError):
+        channel.send("hello")
+    channel.close()
+
+
+def test_webhook_is_available_from_settings(http_transport):
+    assert get_channel_class("webhook") is Webhook
+
+    useNotify.from_settings({"WEBHOOK": {"url": "https://hooks.example.com/n"}}).publish(
+        content="hello"
+    )
+
+    assert json.loads(http_transport.requests[0].content) == {"title": "", "content": "hello"}
+
+
+@pytest.mark.parametrize("config", [{}, {"url": "https://x", "method": "DELETE"}])
+def test_webhook_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        Webhook(config)